@@ -0,0 +1,234 @@
+"""Modo banco embarcado: agregações por SQL sobre um arquivo SQLite ou DuckDB.
+
+Ativado pela seção [embarcado] do .streamlit/secrets.toml:
+
+    [embarcado]
+    motor = "duckdb"    # ou "sqlite" (padrão; não precisa de nada instalado)
+
+Os dados preparados de cada pesquisa ficam num arquivo em .cache_dados/, ao lado do
+Parquet, com a mesma assinatura (CSV + mapeamentos) no nome: todos os workers leem o
+mesmo arquivo e nenhum guarda o DataFrame inteiro. Cada coluna usada pelos gráficos
+é gravada como código inteiro e as categorias numa tabela à parte, de modo que cada
+tabela do cubo é um GROUP BY sobre inteiros e sai idêntica à do construir_cubo.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+
+import pandas as pd
+import numpy as np
+
+from dados import PASTA_CACHE, assinatura_dados, chave_regressao, codificar
+from estatisticas import somas_regressao
+from medicoes import secao_dos_secrets
+
+MOTORES = {'sqlite': '.sqlite', 'duckdb': '.duckdb'}
+
+TABELA_RESPOSTAS = 'respostas'
+TABELA_CATEGORIAS = 'categorias'
+
+def usa_banco_embarcado():
+    return bool(secao_dos_secrets('embarcado'))
+
+def motor_configurado():
+    motor = secao_dos_secrets('embarcado').get('motor', 'sqlite')
+    if motor not in MOTORES:
+        raise ValueError(f"Motor de banco embarcado desconhecido: {motor!r} (use 'sqlite' ou 'duckdb')")
+    if motor == 'duckdb':
+        _duckdb()
+    return motor
+
+def _duckdb():
+    """Módulo duckdb, importado só quando é o motor configurado (não pesa na partida da
+    página de gráficos nas demais configurações)."""
+    try:
+        import duckdb
+    except ImportError:
+        raise RuntimeError("O pacote duckdb não está instalado (pip install duckdb).") from None
+    return duckdb
+
+def _aspas(nome):
+    return '"' + str(nome).replace('"', '""') + '"'
+
+def _conectar(caminho, motor, somente_leitura=True):
+    if motor == 'duckdb':
+        return _duckdb().connect(caminho, read_only=somente_leitura)
+    if somente_leitura:
+        return sqlite3.connect(f"file:{caminho}?mode=ro", uri=True, check_same_thread=False)
+    return sqlite3.connect(caminho)
+
+
+# ==============================================================================
+# CONSTRUÇÃO DO ARQUIVO
+# ==============================================================================
+
+def caminho_banco(caminho_csv, versao, colunas, motor):
+    """.cache_dados/<csv>-<assinatura>-<colunas>.<motor>, ou None se o CSV não existir.
+
+    As colunas entram no nome: um gráfico novo no registro gera um arquivo novo.
+    """
+    chave = assinatura_dados(caminho_csv, versao)
+    if chave is None:
+        return None
+    chave_colunas = hashlib.sha256(json.dumps(sorted(colunas)).encode('utf-8')).hexdigest()[:8]
+    nome_base = os.path.splitext(os.path.basename(caminho_csv))[0]
+    return os.path.join(PASTA_CACHE, f"{nome_base}-{chave}-{chave_colunas}{MOTORES[motor]}")
+
+def _gravar_banco(caminho, motor, df, colunas):
+    """Grava códigos + categorias num arquivo temporário e o move para o lugar final."""
+    codigos, categorias = {}, []
+    for col in colunas:
+        if col not in df.columns:
+            continue
+        cods, cats = codificar(df[col])
+        codigos[col] = pd.Series(cods, dtype='Int64').mask(cods < 0)
+        categorias.append((col, json.dumps(cats.tolist(), ensure_ascii=False)))
+    tabela = pd.DataFrame(codigos)
+    tabela_categorias = pd.DataFrame(categorias, columns=['coluna', 'valores'])
+
+    os.makedirs(PASTA_CACHE, exist_ok=True)
+    temporario = f"{caminho}.{os.getpid()}.tmp"
+    if os.path.exists(temporario):
+        os.remove(temporario)
+    try:
+        conexao = _conectar(temporario, motor, somente_leitura=False)
+        try:
+            if motor == 'duckdb':
+                conexao.register('tabela_df', tabela)
+                conexao.register('categorias_df', tabela_categorias)
+                conexao.execute(f"CREATE TABLE {TABELA_RESPOSTAS} AS SELECT * FROM tabela_df")
+                conexao.execute(f"CREATE TABLE {TABELA_CATEGORIAS} AS SELECT * FROM categorias_df")
+            else:
+                tabela.to_sql(TABELA_RESPOSTAS, conexao, index=False)
+                tabela_categorias.to_sql(TABELA_CATEGORIAS, conexao, index=False)
+                conexao.commit()
+        finally:
+            conexao.close()
+        os.replace(temporario, caminho)
+    finally:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+
+    # Versões antigas do mesmo CSV (outra assinatura ou outras colunas)
+    prefixo = os.path.basename(caminho).rsplit('-', 2)[0] + '-'
+    for nome in os.listdir(PASTA_CACHE):
+        antigo = os.path.join(PASTA_CACHE, nome)
+        if nome.startswith(prefixo) and nome.endswith(MOTORES[motor]) and antigo != caminho:
+            try:
+                os.remove(antigo)
+            except OSError:
+                pass
+
+def banco_do_dataset(caminho_csv, versao, colunas, carregar, motor):
+    """Caminho do arquivo do banco, criando-o a partir do DataFrame preparado se preciso.
+
+    Retorna None quando os dados não puderam ser carregados.
+    """
+    caminho = caminho_banco(caminho_csv, versao, colunas, motor)
+    if caminho is None:
+        return None
+    if not os.path.exists(caminho):
+        df = carregar()
+        if df is None:
+            return None
+        _gravar_banco(caminho, motor, df, colunas)
+    return caminho
+
+# ==============================================================================
+# CONSULTAS
+# ==============================================================================
+
+def _categorias(conexao):
+    linhas = conexao.execute(f"SELECT coluna, valores FROM {TABELA_CATEGORIAS}").fetchall()
+    return {coluna: json.loads(valores) for coluna, valores in linhas}
+
+def cubo_do_banco(caminho, motor, contagens, cruzamentos, regressoes=()):
+    """Cubo de contagens (mesmo formato do construir_cubo) com um GROUP BY por tabela."""
+    conexao = _conectar(caminho, motor)
+    try:
+        return _cubo_da_conexao(conexao, contagens, cruzamentos, regressoes)
+    finally:
+        conexao.close()
+
+def _cubo_da_conexao(conexao, contagens, cruzamentos, regressoes=()):
+    categorias = _categorias(conexao)
+    cubo = {}
+    for col in contagens:
+        if col not in categorias:
+            continue
+        cats = categorias[col]
+        contagem = np.zeros(len(cats), dtype=np.int64)
+        linhas = conexao.execute(
+            f"SELECT {_aspas(col)}, COUNT(*) FROM {TABELA_RESPOSTAS} "
+            f"WHERE {_aspas(col)} IS NOT NULL GROUP BY 1"
+        ).fetchall()
+        for codigo, total in linhas:
+            contagem[codigo] = total
+        cubo[col] = pd.Series(contagem, index=pd.Index(cats, name=col), name='count')
+
+    for col_a, col_b in cruzamentos:
+        if col_a not in categorias or col_b not in categorias:
+            continue
+        cats_a, cats_b = categorias[col_a], categorias[col_b]
+        plano = np.zeros((len(cats_a), len(cats_b)), dtype=np.int64)
+        linhas = conexao.execute(
+            f"SELECT {_aspas(col_a)}, {_aspas(col_b)}, COUNT(*) FROM {TABELA_RESPOSTAS} "
+            f"WHERE {_aspas(col_a)} IS NOT NULL AND {_aspas(col_b)} IS NOT NULL GROUP BY 1, 2"
+        ).fetchall()
+        for codigo_a, codigo_b, total in linhas:
+            plano[codigo_a, codigo_b] = total
+        cubo[(col_a, col_b)] = pd.DataFrame(
+            plano,
+            index=pd.Index(cats_a, name=col_a),
+            columns=pd.Index(cats_b, name=col_b)
+        )
+
+    for col_x, col_y in regressoes:
+        if col_x not in categorias or col_y not in categorias:
+            continue
+        # Somas de regressão a partir das combinações distintas de (x, y) e suas contagens
+        linhas = conexao.execute(
+            f"SELECT {_aspas(col_x)}, {_aspas(col_y)}, COUNT(*) FROM {TABELA_RESPOSTAS} "
+            f"WHERE {_aspas(col_x)} IS NOT NULL AND {_aspas(col_y)} IS NOT NULL GROUP BY 1, 2"
+        ).fetchall()
+        pares = np.array(linhas, dtype=np.int64).reshape(-1, 3)
+        cubo[chave_regressao(col_x, col_y)] = somas_regressao(
+            np.asarray(categorias[col_x], dtype=float)[pares[:, 0]],
+            np.asarray(categorias[col_y], dtype=float)[pares[:, 1]],
+            pares[:, 2],
+        )
+    return cubo
+
+def _ler_codigos(conexao, motor, colunas):
+    """Códigos das colunas como DataFrame (NA onde a resposta falta), lidos em bloco."""
+    sql = f"SELECT {', '.join(map(_aspas, colunas))} FROM {TABELA_RESPOSTAS}"
+    if motor == 'duckdb':
+        return conexao.execute(sql).df()
+    return pd.read_sql_query(sql, conexao)
+
+def dataframe_do_banco(caminho, motor, colunas):
+    """Valores originais de algumas colunas, linha a linha (para gráficos com usa_dataframe).
+
+    Colunas de texto voltam como categóricas (pd.Categorical.from_codes, como no
+    modo compacto) e as numéricas como números; nenhuma linha passa pelo Python.
+    """
+    conexao = _conectar(caminho, motor)
+    try:
+        categorias = _categorias(conexao)
+        colunas = [col for col in colunas if col in categorias]
+        if not colunas:
+            return pd.DataFrame()
+        tabela = _ler_codigos(conexao, motor, colunas)
+    finally:
+        conexao.close()
+    dados = {}
+    for col in colunas:
+        valores = pd.Index(categorias[col])
+        codigos = tabela[col].fillna(-1).to_numpy(dtype=np.int64)
+        if pd.api.types.is_numeric_dtype(valores.dtype):
+            coluna = pd.Series(valores.take(np.where(codigos >= 0, codigos, 0)), name=col)
+            dados[col] = coluna.where(codigos >= 0)
+        else:
+            dados[col] = pd.Categorical.from_codes(codigos, categories=valores)
+    return pd.DataFrame(dados)
@@ -0,0 +1,234 @@
+"""Benchmark de escala: tempo, vazão e pico de memória de cada etapa, com dados sintéticos.
+
+Para cada tamanho pedido, gera (ou reaproveita) os CSVs de dados_sinteticos.py em
+dados_sinteticos/<linhas>/ e mede, em cada pesquisa: o loader lendo o CSV, o loader
+lendo o cache Parquet, a montagem do cubo, os testes e o bootstrap das tabelas
+cruzadas e a figura de cada gráfico do registro (construtor_da_figura + JSON, como
+no cache de figuras). O tempo é o melhor de algumas repetições; o pico de memória
+vem de uma execução a mais, com tracemalloc.
+
+Os resultados são acrescentados a benchmarks/resultados.jsonl com o commit atual,
+e cada medida é comparada com a última do mesmo tamanho e etapa: o que ficou mais
+lento além do limite aparece como regressão (e o comando sai com código 1).
+
+Uso:
+    python benchmark.py --tamanhos 1000,100000,1000000 --repeticoes 3
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+import pandas as pd
+
+from medicoes import silenciar_fora_do_app
+
+silenciar_fora_do_app()
+
+from dados import PASTA_CACHE, assinatura_dados, construir_cubo
+from dados_sinteticos import ARQUIVOS_REAIS, gerar_conjunto
+from estatisticas import intervalos_bootstrap
+from graficos import (
+    DATASETS, agregacoes_do_registro, construtor_da_figura, grafico_disponivel, graficos_do_dataset,
+    regressoes_do_registro, tabela_do_grafico, testes_do_cubo
+)
+
+PASTA_PROJETO = os.path.dirname(os.path.abspath(__file__))
+PASTA_DADOS = os.path.join(PASTA_PROJETO, 'dados_sinteticos')
+ARQUIVO_RESULTADOS = os.path.join(PASTA_PROJETO, 'benchmarks', 'resultados.jsonl')
+
+TAMANHOS_PADRAO = '1000,100000'
+LIMITE_REGRESSAO_PADRAO = 0.2
+
+# Diferenças menores que isso são ruído de medição, não regressão
+TOLERANCIA_SEGUNDOS = 0.005
+
+def medir(executar, preparar=None, repeticoes=3):
+    """(melhor tempo em segundos, pico de memória em MB) de executar()."""
+    tempos = []
+    for _ in range(repeticoes):
+        if preparar:
+            preparar()
+        inicio = time.perf_counter()
+        executar()
+        tempos.append(time.perf_counter() - inicio)
+
+    if preparar:
+        preparar()
+    tracemalloc.start()
+    try:
+        executar()
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return min(tempos), pico / 1e6
+
+def _figura_em_json(fig):
+    return fig.to_json() if fig is not None else None
+
+def medir_dataset(dataset, repeticoes):
+    """Medidas de todas as etapas de um dataset, lido dos CSVs da pasta atual."""
+    info = DATASETS[dataset]
+    carregar = info['carregar']
+    medidas = []
+
+    def registrar(etapa, executar, preparar=None):
+        segundos, pico = medir(executar, preparar, repeticoes)
+        medidas.append({'dataset': dataset, 'etapa': etapa, 'segundos': segundos, 'pico_mb': pico})
+
+    def sem_cache():
+        shutil.rmtree(PASTA_CACHE, ignore_errors=True)
+        carregar.clear()
+
+    registrar('carregar_csv', carregar, sem_cache)
+    # O Parquet ficou gravado pela etapa anterior
+    registrar('carregar_parquet', carregar, carregar.clear)
+
+    df = carregar()
+    if df is None:
+        raise RuntimeError(info['erro'])
+    contagens, cruzamentos = agregacoes_do_registro(dataset)
+    regressoes = regressoes_do_registro(dataset)
+    registrar('construir_cubo', lambda: construir_cubo(df, contagens, cruzamentos, regressoes=regressoes))
+
+    # O cubo como o app o entrega às figuras: com os testes e a assinatura dos dados
+    cubo = construir_cubo(df, contagens, cruzamentos, regressoes=regressoes)
+    registrar('testes', lambda: testes_do_cubo(cubo))
+    cubo['_testes'] = testes_do_cubo(cubo)
+    cubo['_assinatura'] = assinatura_dados(info['arquivo'], info['versao'])
+    tabelas = {
+        grafico['id']: tabela_do_grafico(grafico, cubo)
+        for grafico in graficos_do_dataset(dataset)
+        if grafico.get('intervalos') and grafico_disponivel(grafico, cubo)
+    }
+    registrar('bootstrap', lambda: intervalos_bootstrap(tabelas))
+
+    for grafico in graficos_do_dataset(dataset):
+        if not grafico_disponivel(grafico, cubo):
+            continue
+        # A mesma função que o app chama no cache de figuras (anotações, DataFrame
+        # dos gráficos com usa_dataframe); a 1ª chamada aquece os caches de dados
+        construir = construtor_da_figura(grafico)
+        args = grafico.get('args', ())
+        construir(cubo, *args)
+        registrar(f"figura:{grafico['id']}", lambda c=construir, a=args: _figura_em_json(c(cubo, *a)))
+
+    for medida in medidas:
+        medida['linhas_lidas'] = len(df)
+        medida['linhas_por_segundo'] = len(df) / medida['segundos'] if medida['segundos'] else None
+    return medidas
+
+def preparar_dados(linhas, semente, regerar=False):
+    """Pasta com os CSVs sintéticos do tamanho pedido (gerados só se ainda não existirem)."""
+    pasta = os.path.join(PASTA_DADOS, str(linhas))
+    existentes = all(os.path.exists(os.path.join(pasta, arquivo)) for arquivo in ARQUIVOS_REAIS)
+    if regerar or not existentes:
+        print(f"Gerando {linhas} linha(s) sintéticas em {pasta}...", file=sys.stderr)
+        gerar_conjunto(pasta, linhas, semente)
+    return pasta
+
+def _commit_atual():
+    try:
+        saida = subprocess.run(
+            ['git', 'describe', '--always', '--dirty'], cwd=PASTA_PROJETO,
+            capture_output=True, text=True, timeout=10
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return saida.stdout.strip() or None
+
+def ultimas_medidas(caminho):
+    """Última medida registrada de cada (linhas, dataset, etapa)."""
+    ultimas = {}
+    if not os.path.exists(caminho):
+        return ultimas
+    with open(caminho, encoding='utf-8') as f:
+        for linha in f:
+            if linha.strip():
+                medida = json.loads(linha)
+                ultimas[(medida['linhas'], medida['dataset'], medida['etapa'])] = medida
+    return ultimas
+
+def salvar_medidas(caminho, medidas):
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    with open(caminho, 'a', encoding='utf-8') as f:
+        for medida in medidas:
+            f.write(json.dumps(medida, ensure_ascii=False) + '\n')
+
+def comparar(medida, anterior, limite):
+    """Variação em relação à medida anterior e se ela conta como regressão."""
+    if anterior is None or not anterior['segundos']:
+        return None, False
+    variacao = medida['segundos'] / anterior['segundos'] - 1
+    regressao = variacao > limite and medida['segundos'] - anterior['segundos'] > TOLERANCIA_SEGUNDOS
+    return variacao, regressao
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mede loaders, cubo e gráficos com dados sintéticos de vários tamanhos.")
+    parser.add_argument('--tamanhos', default=TAMANHOS_PADRAO,
+                        help=f"Linhas por CSV, separadas por vírgula (padrão: {TAMANHOS_PADRAO})")
+    parser.add_argument('--repeticoes', type=int, default=3, help="Repetições de cada medida; vale a melhor (padrão: 3)")
+    parser.add_argument('--datasets', default=None, help="Datasets separados por vírgula (padrão: todos)")
+    parser.add_argument('--semente', type=int, default=0, help="Semente dos dados sintéticos (padrão: 0)")
+    parser.add_argument('--regerar', action='store_true', help="Gera os CSVs sintéticos de novo mesmo se já existirem")
+    parser.add_argument('--resultados', default=ARQUIVO_RESULTADOS, help="Arquivo JSONL onde as medidas são acrescentadas")
+    parser.add_argument('--limite-regressao', type=float, default=LIMITE_REGRESSAO_PADRAO,
+                        help=f"Piora relativa que conta como regressão (padrão: {LIMITE_REGRESSAO_PADRAO})")
+    parser.add_argument('--sem-salvar', action='store_true', help="Só compara, sem gravar as medidas")
+    args = parser.parse_args(argv)
+
+    try:
+        tamanhos = [int(t) for t in args.tamanhos.split(',') if t.strip()]
+    except ValueError:
+        parser.error("--tamanhos deve ser uma lista de inteiros separados por vírgula")
+    if any(t <= 0 for t in tamanhos):
+        parser.error("--tamanhos deve ter apenas valores positivos")
+    if args.repeticoes < 1:
+        parser.error("--repeticoes deve ser pelo menos 1")
+    datasets = [d.strip() for d in args.datasets.split(',')] if args.datasets else list(DATASETS)
+    desconhecidos = set(datasets) - set(DATASETS)
+    if desconhecidos:
+        parser.error(f"Dataset(s) desconhecido(s): {', '.join(sorted(desconhecidos))}")
+
+    caminho_resultados = os.path.abspath(args.resultados)
+    anteriores = ultimas_medidas(caminho_resultados)
+    contexto = {
+        'quando': datetime.now().isoformat(timespec='seconds'),
+        'commit': _commit_atual(),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+    }
+
+    medidas, regressoes = [], 0
+    print(f"{'dataset':<8} {'etapa':<44} {'linhas':>10} {'segundos':>10} {'linhas/s':>12} {'pico MB':>9}  variação")
+    for linhas in tamanhos:
+        pasta = preparar_dados(linhas, args.semente, args.regerar)
+        # Os loaders leem os CSVs (e gravam o cache) relativos à pasta atual, como no app
+        os.chdir(pasta)
+        for dataset in datasets:
+            for medida in medir_dataset(dataset, args.repeticoes):
+                medida = dict(contexto, linhas=linhas, **medida)
+                variacao, regressao = comparar(medida, anteriores.get((linhas, dataset, medida['etapa'])),
+                                               args.limite_regressao)
+                regressoes += regressao
+                texto_variacao = '' if variacao is None else f"{variacao:+.0%}" + ('  REGRESSÃO' if regressao else '')
+                vazao = medida['linhas_por_segundo']
+                print(f"{dataset:<8} {medida['etapa']:<44} {linhas:>10} {medida['segundos']:>10.4f} "
+                      f"{vazao if vazao is not None else float('nan'):>12,.0f} {medida['pico_mb']:>9.1f}  {texto_variacao}")
+                medidas.append(medida)
+
+    if not args.sem_salvar:
+        salvar_medidas(caminho_resultados, medidas)
+        print(f"{len(medidas)} medida(s) acrescentada(s) a {caminho_resultados}")
+    if regressoes:
+        print(f"{regressoes} regressão(ões) acima de {args.limite_regressao:.0%}", file=sys.stderr)
+    return 1 if regressoes else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,304 @@
+"""Gera uma versão estática (só HTML/CSS/JS) das três páginas do dashboard.
+
+As páginas saem dos mesmos blocos de conteudo.py e os gráficos do mesmo registro
+de graficos.py, já agregados: o resultado pode ser servido por qualquer servidor
+de arquivos, sem sessão Python por leitor. O site só é reconstruído quando a
+assinatura (dados + código + fotos) muda.
+
+Uso:
+    python construir_site.py --saida site [--forcar]
+"""
+import argparse
+import hashlib
+import html
+import json
+import os
+import re
+import shutil
+import sys
+import tempfile
+import textwrap
+import time
+import unicodedata
+
+from medicoes import silenciar_fora_do_app
+
+silenciar_fora_do_app()
+
+import plotly
+from plotly.offline import get_plotlyjs
+
+from conteudo import CSS_PERSONALIZADO, PAGINAS, RODAPE, TITULO_PAGINA, TITULO_SIDEBAR
+from fotos import codificar_miniatura
+from graficos import DATASETS, carregar_cubo, construtor_da_figura, grafico_disponivel, graficos_do_dataset
+
+PASTA_PROJETO = os.path.dirname(os.path.abspath(__file__))
+
+MANIFESTO = 'manifesto.json'
+
+# Layout do site estático: o CSS do app usa as classes do Streamlit (.stApp, stSidebar),
+# aqui só recriamos a estrutura mínima que o Streamlit monta em volta dele
+ESTILO_SITE = """
+body { margin: 0; }
+.stApp { display: flex; min-height: 100vh; color: #ffffff; }
+[data-testid="stSidebar"] { width: 260px; flex-shrink: 0; padding: 1.5rem; box-sizing: border-box; }
+[data-testid="stSidebar"] h1 { font-size: 1.6rem; padding: 1rem; }
+.navegacao a { display: block; color: #ffffff; text-decoration: none; padding: 0.6rem 1rem;
+    border-radius: 10px; margin: 0.3rem 0; }
+.navegacao a.atual, .navegacao a:hover { background-color: rgba(0, 78, 146, 0.5); }
+main { flex: 1; max-width: 1200px; margin: 0 auto; padding: 2rem 3rem; box-sizing: border-box; }
+main hr { border: none; border-top: 1px solid rgba(255, 255, 255, 0.3); }
+.colunas { display: flex; gap: 1.5rem; }
+.colunas > div { flex: 1; min-width: 0; }
+.abas a { color: #0099ff; margin-right: 1.5rem; font-weight: 600; }
+details.grafico { background: rgba(0, 78, 146, 0.2); border-radius: 10px; margin: 0.8rem 0; padding: 0.6rem 1rem; }
+details.grafico summary { cursor: pointer; font-weight: 600; }
+.aviso, .erro { border-radius: 8px; padding: 1rem; margin: 0.8rem 0; }
+.aviso { background: rgba(255, 189, 69, 0.2); color: #ffe08a; }
+.erro { background: rgba(255, 75, 75, 0.2); color: #ffb3b3; }
+"""
+
+# Os gráficos só são desenhados quando o leitor abre o <details>, como os expanders do app
+SCRIPT_GRAFICOS = """
+document.querySelectorAll('details.grafico').forEach(function (detalhe) {
+    detalhe.addEventListener('toggle', function () {
+        var alvo = detalhe.querySelector('.plotly-alvo');
+        if (!detalhe.open || alvo.dataset.desenhado) { return; }
+        var fig = JSON.parse(document.getElementById('fig-' + alvo.dataset.grafico).textContent);
+        Plotly.newPlot(alvo, fig.data, fig.layout, {responsive: true});
+        alvo.dataset.desenhado = '1';
+    });
+});
+"""
+
+def _hash_arquivo(caminho):
+    sha = hashlib.sha256()
+    with open(caminho, 'rb') as f:
+        for bloco in iter(lambda: f.read(1 << 20), b''):
+            sha.update(bloco)
+    return sha.hexdigest()
+
+def _fotos_das_paginas(blocos):
+    for bloco in blocos:
+        if bloco[0] == 'autora':
+            yield bloco[1]
+        elif bloco[0] == 'colunas':
+            for blocos_da_coluna in bloco[1]:
+                yield from _fotos_das_paginas(blocos_da_coluna)
+
+def arquivos_fonte():
+    """Módulos do projeto carregados neste processo: este script e tudo o que ele importa
+    (conteudo, graficos, dados, estatisticas...), sem uma lista para manter em dia."""
+    caminhos = {
+        os.path.abspath(modulo.__file__) for modulo in list(sys.modules.values())
+        if getattr(modulo, '__file__', None)
+    }
+    return sorted(caminho for caminho in caminhos if os.path.dirname(caminho) == PASTA_PROJETO)
+
+def assinatura_site():
+    """Hash de tudo que entra no site: dados (CSV ou MySQL), código das páginas/gráficos e fotos."""
+    partes = [f"plotly={plotly.__version__}"]
+    for dataset in DATASETS:
+        # A assinatura do cubo identifica os dados de origem, venham do CSV ou do banco
+        cubo = carregar_cubo(dataset)
+        partes.append(f"{dataset}={cubo.get('_assinatura') if cubo is not None else None}")
+    # Depois de carregar_cubo: os módulos importados só na carga dos dados também entram
+    for caminho in arquivos_fonte():
+        partes.append(f"{os.path.basename(caminho)}={_hash_arquivo(caminho)}")
+    for pagina in PAGINAS.values():
+        for foto in _fotos_das_paginas(pagina):
+            partes.append(f"{foto}={_hash_arquivo(foto) if os.path.exists(foto) else None}")
+    return hashlib.sha256('\n'.join(partes).encode('utf-8')).hexdigest()[:16]
+
+def arquivo_da_pagina(indice, rotulo):
+    """index.html para a primeira página; as demais pelo nome sem emoji/acentos (graficos.html...)."""
+    if indice == 0:
+        return 'index.html'
+    sem_acento = unicodedata.normalize('NFD', rotulo).encode('ascii', 'ignore').decode('ascii')
+    return re.sub(r'[^a-z0-9]+', '-', sem_acento.lower()).strip('-') + '.html'
+
+def markdown_para_html(texto):
+    """Converte o markdown simples usado nas páginas (títulos, ---, parágrafos e **negrito**)."""
+    partes = []
+    for paragrafo in re.split(r'\n\s*\n', textwrap.dedent(texto).strip()):
+        paragrafo = paragrafo.strip()
+        titulo = re.match(r'^(#{1,6})\s+(.*)$', paragrafo)
+        if paragrafo == '---':
+            partes.append('<hr>')
+            continue
+        conteudo = html.escape(titulo.group(2).strip() if titulo else paragrafo, quote=False)
+        conteudo = re.sub(r'\*\*(.+?)\*\*', r'<strong>\1</strong>', conteudo)
+        if titulo:
+            nivel = len(titulo.group(1))
+            partes.append(f"<h{nivel}>{conteudo}</h{nivel}>")
+        else:
+            partes.append(f"<p>{conteudo}</p>")
+    return '\n'.join(partes)
+
+class _Construtor:
+    """Estado de uma construção: pasta de destino e imagens já gravadas."""
+
+    def __init__(self, pasta):
+        self.pasta = pasta
+        self.imagens = {}
+
+    def foto(self, caminho):
+        if caminho not in self.imagens:
+            conteudo, extensao, _ = codificar_miniatura(caminho)
+            nome = f"img/{hashlib.sha256(conteudo).hexdigest()[:16]}.{extensao}"
+            os.makedirs(os.path.join(self.pasta, 'img'), exist_ok=True)
+            with open(os.path.join(self.pasta, nome), 'wb') as f:
+                f.write(conteudo)
+            self.imagens[caminho] = nome
+        return self.imagens[caminho]
+
+    def blocos(self, blocos):
+        partes = []
+        for bloco in blocos:
+            tipo = bloco[0]
+            if tipo == 'markdown':
+                partes.append(markdown_para_html(bloco[1]))
+            elif tipo == 'html':
+                partes.append(textwrap.dedent(bloco[1]).strip())
+            elif tipo == 'colunas':
+                colunas = ''.join(f"<div>{self.blocos(b)}</div>" for b in bloco[1])
+                partes.append(f'<div class="colunas">{colunas}</div>')
+            elif tipo == 'autora':
+                _, foto, modelo, aviso = bloco
+                try:
+                    partes.append(textwrap.dedent(modelo).strip().format(img_src=self.foto(foto)))
+                except OSError:
+                    partes.append(f'<div class="aviso">{html.escape(aviso)}</div>')
+            elif tipo == 'graficos':
+                partes.append(self.graficos())
+        return '\n'.join(partes)
+
+    def graficos(self):
+        """As abas do app viram seções com âncoras; cada gráfico vai pré-agregado em JSON."""
+        abas = ''.join(f'<a href="#{dataset}">{html.escape(info["aba"])}</a>' for dataset, info in DATASETS.items())
+        partes = [f'<nav class="abas">{abas}</nav>']
+        for dataset, info in DATASETS.items():
+            partes.append(f'<section id="{dataset}">')
+            partes.append(markdown_para_html(info['cabecalho']))
+            cubo = carregar_cubo(dataset)
+            if cubo is None:
+                partes.append(f'<div class="erro">{html.escape(info["erro"])}</div></section>')
+                continue
+            for grafico in graficos_do_dataset(dataset):
+                fig = None
+                if grafico_disponivel(grafico, cubo):
+                    fig = construtor_da_figura(grafico)(cubo, *grafico.get('args', ()))
+                    aviso = grafico.get('aviso_sem_dados', "Não há dados válidos para exibir o gráfico.")
+                else:
+                    aviso = grafico['aviso']
+                if fig is None:
+                    corpo = f'<div class="aviso">{html.escape(aviso)}</div>'
+                else:
+                    # "</" escapado para o JSON não fechar a tag <script> antes da hora
+                    dados_fig = fig.to_json().replace('</', '<\\/')
+                    corpo = (f'<div class="plotly-alvo" data-grafico="{grafico["id"]}"></div>'
+                             f'<script type="application/json" id="fig-{grafico["id"]}">{dados_fig}</script>')
+                partes.append(f'<details class="grafico"><summary>{html.escape(grafico["titulo"])}</summary>{corpo}</details>')
+            partes.append('</section>')
+        return '\n'.join(partes)
+
+    def pagina(self, rotulo, blocos, navegacao, arquivo_css, arquivo_plotly):
+        usa_graficos = any(bloco[0] == 'graficos' for bloco in blocos)
+        links = ''.join(
+            f'<a href="{arquivo}" class="{"atual" if r == rotulo else ""}">{html.escape(r)}</a>'
+            for r, arquivo in navegacao
+        )
+        scripts = (f'<script src="{arquivo_plotly}"></script>\n<script>{SCRIPT_GRAFICOS}</script>'
+                   if usa_graficos else '')
+        return f"""<!DOCTYPE html>
+<html lang="pt-BR">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{html.escape(TITULO_PAGINA)}</title>
+<link rel="stylesheet" href="{arquivo_css}">
+</head>
+<body>
+<div class="stApp">
+<aside data-testid="stSidebar">
+{markdown_para_html(TITULO_SIDEBAR)}
+<hr>
+<nav class="navegacao">{links}</nav>
+</aside>
+<main>
+{self.blocos(blocos)}
+{self.blocos(RODAPE)}
+</main>
+</div>
+{scripts}
+</body>
+</html>
+"""
+
+def construir_site(pasta_saida, forcar=False):
+    """Gera o site em pasta_saida; retorna False se a assinatura não mudou (nada a fazer)."""
+    assinatura = assinatura_site()
+    caminho_manifesto = os.path.join(pasta_saida, MANIFESTO)
+    if not forcar and os.path.exists(caminho_manifesto):
+        try:
+            with open(caminho_manifesto, encoding='utf-8') as f:
+                if json.load(f).get('assinatura') == assinatura:
+                    return False
+        except (OSError, ValueError):
+            pass
+
+    # Montamos numa pasta temporária e trocamos no fim: o servidor nunca vê um site pela metade
+    pasta_pai = os.path.dirname(os.path.abspath(pasta_saida))
+    os.makedirs(pasta_pai, exist_ok=True)
+    temporaria = tempfile.mkdtemp(prefix='.site-', dir=pasta_pai)
+    construtor = _Construtor(temporaria)
+
+    # Nomes com a assinatura/versão: o navegador pode guardar em cache sem prazo
+    arquivo_css = f"estilo-{assinatura}.css"
+    with open(os.path.join(temporaria, arquivo_css), 'w', encoding='utf-8') as f:
+        css_app = re.sub(r'</?style>', '', CSS_PERSONALIZADO)
+        f.write(textwrap.dedent(css_app).strip() + '\n' + ESTILO_SITE)
+    arquivo_plotly = f"plotly-{plotly.__version__}.min.js"
+    with open(os.path.join(temporaria, arquivo_plotly), 'w', encoding='utf-8') as f:
+        f.write(get_plotlyjs())
+
+    navegacao = [(rotulo, arquivo_da_pagina(i, rotulo)) for i, rotulo in enumerate(PAGINAS)]
+    for rotulo, arquivo in navegacao:
+        with open(os.path.join(temporaria, arquivo), 'w', encoding='utf-8') as f:
+            f.write(construtor.pagina(rotulo, PAGINAS[rotulo], navegacao, arquivo_css, arquivo_plotly))
+
+    with open(os.path.join(temporaria, MANIFESTO), 'w', encoding='utf-8') as f:
+        json.dump({
+            'assinatura': assinatura,
+            'gerado_em': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'paginas': dict(navegacao),
+        }, f, ensure_ascii=False, indent=2)
+
+    antiga = None
+    if os.path.exists(pasta_saida):
+        antiga = f"{temporaria}-antigo"
+        os.replace(pasta_saida, antiga)
+    os.replace(temporaria, pasta_saida)
+    if antiga:
+        shutil.rmtree(antiga, ignore_errors=True)
+    return True
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera a versão estática do dashboard.")
+    parser.add_argument('--saida', default='site', help="Pasta de destino (padrão: site)")
+    parser.add_argument('--forcar', action='store_true', help="Reconstrói mesmo se nada mudou")
+    args = parser.parse_args(argv)
+
+    # CSVs, fotos e arquivos-fonte têm caminho relativo à pasta do app
+    pasta_saida = os.path.abspath(args.saida)
+    os.chdir(PASTA_PROJETO)
+
+    inicio = time.perf_counter()
+    if construir_site(pasta_saida, args.forcar):
+        print(f"Site gerado em {pasta_saida} ({time.perf_counter() - inicio:.1f}s)")
+    else:
+        print(f"Site em {pasta_saida} já está atualizado (use --forcar para reconstruir)")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
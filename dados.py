@@ -0,0 +1,1273 @@
+"""Carregamento e preparo dos dados das pesquisas Survey_AI e Impact_AI_v2.
+
+Também monta o cubo de contagens que os gráficos consultam. Usado pelo app
+Streamlit e pela exportação em lote (exportar.py).
+"""
+import csv
+import hashlib
+import html
+import io
+import os
+import re
+import unicodedata
+from functools import lru_cache
+import streamlit as st
+import pandas as pd
+import numpy as np
+
+from estatisticas import somas_regressao
+from medicoes import medir_etapa
+
+# ==============================================================================
+# CACHE COLUNAR DOS DADOS PREPARADOS
+# ==============================================================================
+
+# Pasta onde ficam os DataFrames já preparados (Parquet), um arquivo por CSV
+PASTA_CACHE = '.cache_dados'
+
+# Incrementar quando a lógica de preparo mudar sem que os mapeamentos mudem
+VERSAO_PREPARO = 2
+
+# Modo compacto dos DataFrames preparados (ver compactar_dados): inteiros no menor
+# tipo que cabe, texto repetido como categórico e sem as colunas originais já
+# traduzidas. False mantém tudo como sai do preparo (útil para explorar os dados).
+MODO_COMPACTO = True
+
+# Colunas de texto com até esta fração de valores distintos viram categóricas
+FRACAO_MAX_CATEGORIAS = 0.5
+
+def ler_csv(caminho, **opcoes):
+    """pd.read_csv em utf-8 ou, se o arquivo não for utf-8, em latin-1.
+
+    A codificação usada fica em df.attrs['codificacao'] ('utf-8-sig' se o arquivo
+    começa com BOM).
+    """
+    try:
+        df = pd.read_csv(caminho, encoding='utf-8', **opcoes)
+        with open(caminho, 'rb') as f:
+            codificacao = 'utf-8-sig' if f.read(3) == b'\xef\xbb\xbf' else 'utf-8'
+    except UnicodeDecodeError:
+        df = pd.read_csv(caminho, encoding='latin-1', **opcoes)
+        codificacao = 'latin-1'
+    df.attrs['codificacao'] = codificacao
+    return df
+
+def _hash_arquivo(caminho, tamanho_bloco=1 << 20):
+    """Hash SHA-256 do conteúdo do arquivo, lido em blocos para não carregar tudo na memória."""
+    h = hashlib.sha256()
+    with open(caminho, 'rb') as f:
+        for bloco in iter(lambda: f.read(tamanho_bloco), b''):
+            h.update(bloco)
+    return h.hexdigest()
+
+def _versao_mapeamentos(*mapeamentos):
+    """Versão dos mapeamentos: muda sempre que algum dicionário de tradução é alterado."""
+    h = hashlib.sha256(f"{VERSAO_PREPARO}:{MODO_COMPACTO}".encode('utf-8'))
+    for mapeamento in mapeamentos:
+        h.update(repr(mapeamento).encode('utf-8'))
+    return h.hexdigest()
+
+def versao_do_arquivo(caminho):
+    """Identifica o arquivo sem lê-lo (tamanho e data de modificação); None se não existir."""
+    try:
+        info = os.stat(caminho)
+    except OSError:
+        return None
+    return (info.st_size, info.st_mtime_ns)
+
+def assinatura_dados(caminho_csv, versao):
+    """Identifica o conteúdo do CSV + versão dos mapeamentos (None se o CSV não puder ser lido)."""
+    try:
+        hash_csv = _hash_arquivo(caminho_csv)
+    except OSError:
+        return None
+    return hashlib.sha256(f"{hash_csv}:{versao}".encode('utf-8')).hexdigest()[:16]
+
+def _caminho_cache_colunar(caminho_csv, versao):
+    """Caminho do Parquet correspondente ao conteúdo atual do CSV + versão dos mapeamentos.
+
+    Retorna None se o CSV não puder ser lido (o loader trata o erro normalmente).
+    """
+    chave = assinatura_dados(caminho_csv, versao)
+    if chave is None:
+        return None
+    nome_base = os.path.splitext(os.path.basename(caminho_csv))[0]
+    return os.path.join(PASTA_CACHE, f"{nome_base}-{chave}.parquet")
+
+def _ler_cache_colunar(caminho_cache, colunas=None):
+    """Lê o Parquet do cache; com colunas, lê só essas (poda colunar)."""
+    if caminho_cache is None or not os.path.exists(caminho_cache):
+        return None
+    try:
+        return pd.read_parquet(caminho_cache, columns=colunas)
+    except Exception:
+        # Cache corrompido ou pyarrow indisponível: reconstruímos a partir do CSV
+        return None
+
+def ler_dados_preparados(caminho_csv, versao, colunas=None):
+    """DataFrame preparado direto do cache colunar, ou None se ainda não houver cache."""
+    return _ler_cache_colunar(_caminho_cache_colunar(caminho_csv, versao), colunas)
+
+def _salvar_cache_colunar(caminho_cache, df):
+    """Grava o DataFrame preparado e remove versões antigas do mesmo CSV.
+
+    A escrita é feita em arquivo temporário + os.replace para que outro worker
+    nunca leia um Parquet pela metade.
+    """
+    if caminho_cache is None:
+        return
+    pasta = os.path.dirname(caminho_cache)
+    temporario = f"{caminho_cache}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(pasta, exist_ok=True)
+        df.to_parquet(temporario, index=False)
+        os.replace(temporario, caminho_cache)
+    except Exception:
+        # Sem pyarrow ou com colunas de tipos mistos o app segue funcionando, só sem cache
+        if os.path.exists(temporario):
+            os.remove(temporario)
+        return
+
+    prefixo = os.path.basename(caminho_cache).rsplit('-', 1)[0] + '-'
+    for nome in os.listdir(pasta):
+        antigo = os.path.join(pasta, nome)
+        if nome.startswith(prefixo) and nome.endswith('.parquet') and antigo != caminho_cache:
+            try:
+                os.remove(antigo)
+            except OSError:
+                pass
+
+# ==============================================================================
+# PARTIÇÕES POR ONDA (ver ondas.py)
+# ==============================================================================
+
+# Cada onda de uma pesquisa tem a sua pasta: <PASTA_ONDAS>/<dataset>/onda=<id>/
+PASTA_ONDAS = os.path.join(PASTA_CACHE, 'ondas')
+
+def caminho_da_particao(dataset, id_onda, caminho_csv, versao):
+    """Parquet da onda para o conteúdo atual do CSV + versão dos mapeamentos (None se o CSV não puder ser lido)."""
+    chave = assinatura_dados(caminho_csv, versao)
+    if chave is None:
+        return None
+    return os.path.join(PASTA_ONDAS, dataset, f"onda={id_onda}", f"dados-{chave}.parquet")
+
+def ler_particao(caminho_csv, caminho_particao, preparar, traduzidas=(), colunas=None):
+    """DataFrame preparado de uma onda, da sua partição ou, na primeira vez, do CSV.
+
+    Com colunas, lê só essas do Parquet. Retorna None se o CSV não puder ser lido.
+    A partição de cada onda é gravada e invalidada sozinha: as das outras ondas
+    não são tocadas.
+    """
+    with medir_etapa('ler_particao', arquivo=caminho_csv) as medida:
+        df = _ler_cache_colunar(caminho_particao, colunas)
+        medida['linhas'] = None if df is None else len(df)
+    if df is not None:
+        return df
+
+    with medir_etapa('ler_csv', arquivo=caminho_csv) as medida:
+        try:
+            df = ler_csv(caminho_csv)
+        except (OSError, pd.errors.ParserError, pd.errors.EmptyDataError):
+            return None
+        medida['linhas'] = len(df)
+    with medir_etapa('preparar', arquivo=caminho_csv, linhas=len(df)):
+        df = preparar(df)
+        if MODO_COMPACTO:
+            df = compactar_dados(df, traduzidas)
+    with medir_etapa('salvar_particao', arquivo=caminho_csv, linhas=len(df)):
+        _salvar_cache_colunar(caminho_particao, df)
+    return df[[col for col in colunas if col in df.columns]] if colunas is not None else df
+
+# ==============================================================================
+# LEITURA INCREMENTAL (RESPOSTAS ACRESCENTADAS NO FIM DO CSV)
+# ==============================================================================
+
+# Bytes do fim do trecho já lido que são conferidos para saber se o arquivo só cresceu
+TAMANHO_CONFERENCIA = 4096
+
+def _cabecalho_csv(primeira_linha):
+    try:
+        texto = primeira_linha.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        texto = primeira_linha.decode('latin-1')
+    return next(csv.reader([texto.rstrip('\r\n')]), [])
+
+def abrir_leitura(caminho_csv, tamanho_bloco=1 << 20):
+    """Posição de leitura no fim do CSV, com o hash de tudo o que já foi lido.
+
+    Retorna None se o arquivo não puder ser lido.
+    """
+    h = hashlib.sha256()
+    posicao = 0
+    conferencia = b''
+    try:
+        with open(caminho_csv, 'rb') as f:
+            primeira_linha = f.readline()
+            f.seek(0)
+            for bloco in iter(lambda: f.read(tamanho_bloco), b''):
+                h.update(bloco)
+                posicao += len(bloco)
+                conferencia = (conferencia + bloco)[-TAMANHO_CONFERENCIA:]
+            mtime = os.fstat(f.fileno()).st_mtime_ns
+    except OSError:
+        return None
+    return {
+        'posicao': posicao, 'hash': h, 'conferencia': conferencia, 'mtime': mtime,
+        'colunas': _cabecalho_csv(primeira_linha),
+    }
+
+def leitura_em_dia(caminho_csv, leitura):
+    """True se o arquivo continua do mesmo tamanho e com a mesma data da leitura."""
+    try:
+        info = os.stat(caminho_csv)
+    except OSError:
+        return False
+    return info.st_size == leitura['posicao'] and info.st_mtime_ns == leitura['mtime']
+
+def assinatura_da_leitura(leitura, versao):
+    """A mesma assinatura que assinatura_dados daria para o trecho já lido do CSV."""
+    return hashlib.sha256(f"{leitura['hash'].hexdigest()}:{versao}".encode('utf-8')).hexdigest()[:16]
+
+def _ler_trecho_csv(trecho, colunas):
+    try:
+        return pd.read_csv(io.BytesIO(trecho), header=None, names=colunas, encoding='utf-8')
+    except UnicodeDecodeError:
+        return pd.read_csv(io.BytesIO(trecho), header=None, names=colunas, encoding='latin-1')
+    except pd.errors.EmptyDataError:
+        # Só linhas em branco
+        return pd.DataFrame(columns=colunas)
+
+def ler_respostas_novas(caminho_csv, leitura):
+    """Linhas acrescentadas ao fim do CSV desde a leitura, ainda sem preparo.
+
+    Retorna (DataFrame das linhas novas, leitura atualizada); o DataFrame vem
+    vazio se nada mudou. Retorna None quando é preciso recarregar tudo: o arquivo
+    encolheu, foi reescrito, não pôde ser lido ou tem linhas malformadas. Uma
+    última linha ainda sem quebra de linha fica para a próxima leitura.
+    """
+    posicao = leitura['posicao']
+    conferencia = leitura['conferencia']
+    sem_novas = (pd.DataFrame(columns=leitura['colunas']), leitura)
+    try:
+        with open(caminho_csv, 'rb') as f:
+            tamanho = os.fstat(f.fileno()).st_size
+            if tamanho < posicao:
+                return None
+            if tamanho == posicao:
+                return sem_novas if os.fstat(f.fileno()).st_mtime_ns == leitura['mtime'] else None
+            f.seek(posicao - len(conferencia))
+            if f.read(len(conferencia)) != conferencia:
+                return None
+            trecho = f.read()
+            mtime = os.fstat(f.fileno()).st_mtime_ns
+    except OSError:
+        return None
+
+    # O arquivo terminava sem quebra de linha: o acréscimo precisa começar por uma
+    inicio = 0
+    if conferencia and not conferencia.endswith(b'\n'):
+        if trecho in (b'\r', b''):
+            return sem_novas
+        if trecho.startswith(b'\r\n'):
+            inicio = 2
+        elif trecho.startswith(b'\n'):
+            inicio = 1
+        else:
+            return None
+
+    fim = trecho.rfind(b'\n') + 1
+    if fim <= inicio:
+        return sem_novas
+    lido = trecho[:fim]
+    try:
+        df_novas = _ler_trecho_csv(lido[inicio:], leitura['colunas'])
+    except (pd.errors.ParserError, ValueError):
+        return None
+
+    h = leitura['hash'].copy()
+    h.update(lido)
+    nova_leitura = dict(
+        leitura, posicao=posicao + fim, hash=h, mtime=mtime,
+        conferencia=(conferencia + lido)[-TAMANHO_CONFERENCIA:]
+    )
+    return df_novas, nova_leitura
+
+# ==============================================================================
+# MAPEAMENTOS DO SURVEY_AI
+# ==============================================================================
+
+ARQUIVO_SURVEY = 'Survey_AI.csv'
+
+# Renomear e mapear colunas (baseado em graficos_output_survey_ai.ipynb)
+COLUNAS_SURVEY = {
+    'Q1.AI_knowledge': 'Conhecimento_IA',
+    'Q3#2.Job_replacement': 'Substituicao_Emprego',
+    'Q3#3.Problem_solving': 'Resolucao_Problemas',
+    'Q3#4.AI_rulling_society': 'IA_Governa_Sociedade',
+    'Q4#3.Economic_growth': 'Crescimento_Economico',
+    'Q4#4.Job_loss': 'Perda_Emprego',
+    'Q5.Feelings': 'Sentimentos_IA',
+    'Q12.Gender': 'Genero',
+    'Q13.Year_of_study': 'Ano_Estudo',
+    'Q14.Major': 'Curso',
+    'Q15.Passed_exams': 'Exames_Aprovados',
+    'Q16.GPA': 'GPA'
+}
+
+SENTIMENTOS_MAP = {1: 'Otimista', 2: 'Ansioso', 3: 'Indiferente', 4: 'Cético'}
+
+GENERO_MAP = {1: 'Masculino', 2: 'Feminino'}
+
+# Mapeamento de cursos (ajuste os nomes conforme necessário)
+CURSO_MAP = {
+    1: 'Curso 1',  # Ajuste para o nome real do curso
+    2: 'Curso 2',  # Ajuste para o nome real do curso
+    3: 'Curso 3'   # Ajuste para o nome real do curso
+}
+
+LIKERT_MAP = {
+    1: 'Discordo Fortemente', 2: 'Discordo', 3: 'Neutro', 4: 'Concordo', 5: 'Concordo Fortemente'
+}
+
+COLUNAS_LIKERT_SURVEY = [
+    ('Substituicao_Emprego', 'Substituicao_Emprego_Desc'),
+    ('Resolucao_Problemas', 'Resolucao_Problemas_Desc'),
+    ('IA_Governa_Sociedade', 'IA_Governa_Sociedade_Desc'),
+    ('Crescimento_Economico', 'Crescimento_Economico_Desc'),
+    ('Perda_Emprego', 'Perda_Emprego_Desc')
+]
+
+# Itens das perguntas de múltipla escolha (texto do questionário -> tradução), na ordem da pergunta
+FONTES_IA_MAP = {
+    'Internet': 'Internet',
+    'Books/Scientific papers (physical/online format)': 'Livros/Artigos',
+    'Social media': 'Redes Sociais',
+    'Discussions with family/friends': 'Discussões',
+    "I don't inform myself about AI": 'Não me informo',
+}
+
+DOMINIOS_IA_MAP = {
+    'Education': 'Educação',
+    'Medicine': 'Medicina',
+    'Agriculture': 'Agricultura',
+    'Constructions': 'Construção Civil',
+    'Construction': 'Construção Civil',
+    'Marketing': 'Marketing',
+    'Public Administration': 'Administração Pública',
+    'Art': 'Arte',
+}
+
+# Campos de múltipla escolha (itens separados por ';') -> coluna com a combinação de
+# itens de cada resposta, traduzidos e na ordem da pergunta (ver MÚLTIPLA ESCOLHA)
+MULTIPLA_ESCOLHA_SURVEY = {
+    'Q2.AI_sources': {'destino': 'Fontes_IA_Combinacao', 'mapa': FONTES_IA_MAP},
+    'Q6.Domains': {'destino': 'Dominios_IA_Combinacao', 'mapa': DOMINIOS_IA_MAP},
+}
+
+VERSAO_MAPEAMENTOS_SURVEY = _versao_mapeamentos(
+    COLUNAS_SURVEY, SENTIMENTOS_MAP, GENERO_MAP, CURSO_MAP, LIKERT_MAP, COLUNAS_LIKERT_SURVEY,
+    MULTIPLA_ESCOLHA_SURVEY
+)
+
+# Colunas originais que o modo compacto descarta, pois já têm a versão _Desc (ou a combinação)
+TRADUZIDAS_SURVEY = (
+    ['Sentimentos_IA', 'Genero', 'Curso'] + [orig for orig, _ in COLUNAS_LIKERT_SURVEY] + list(MULTIPLA_ESCOLHA_SURVEY)
+)
+
+# Função para carregar e preparar os dados do Survey_AI.csv
+@st.cache_data
+def load_and_prepare_survey_data():
+    # Se o CSV e os mapeamentos não mudaram, o Parquet já tem o resultado final
+    caminho_cache = _caminho_cache_colunar(ARQUIVO_SURVEY, VERSAO_MAPEAMENTOS_SURVEY)
+    with medir_etapa('ler_cache_colunar', arquivo=ARQUIVO_SURVEY) as medida:
+        df = _ler_cache_colunar(caminho_cache)
+        medida['linhas'] = None if df is None else len(df)
+    if df is not None:
+        return df
+
+    with medir_etapa('ler_csv', arquivo=ARQUIVO_SURVEY) as medida:
+        try:
+            # Caminho relativo: espera o arquivo na mesma pasta do app.py
+            df = ler_csv(ARQUIVO_SURVEY)
+        except FileNotFoundError:
+            st.error("Arquivo 'Survey_AI.csv' não encontrado. Coloque o arquivo na mesma pasta do app ou ajuste o caminho no código.")
+            return None
+        except Exception as e:
+            st.error(f"Erro ao carregar 'Survey_AI.csv': {e}. Não foi possível carregar os dados.")
+            return None
+        medida['linhas'] = len(df)
+
+    with medir_etapa('preparar', arquivo=ARQUIVO_SURVEY, linhas=len(df)):
+        df = prepare_survey_data(df)
+        if MODO_COMPACTO:
+            df = compactar_dados(df, TRADUZIDAS_SURVEY)
+    with medir_etapa('salvar_cache_colunar', arquivo=ARQUIVO_SURVEY, linhas=len(df)):
+        _salvar_cache_colunar(caminho_cache, df)
+    return df
+
+def prepare_survey_data(df, pesos=None):
+    # `pesos` (ver prepare_impact_data) não muda nada aqui: não há texto livre sem tradução
+    # Aplicar o mapeamento apenas se as colunas existirem
+    cols_to_rename = {k: v for k, v in COLUNAS_SURVEY.items() if k in df.columns}
+    df.rename(columns=cols_to_rename, inplace=True)
+
+    # Mapeamento de valores para melhor visualização
+    if 'Sentimentos_IA' in df.columns:
+        df['Sentimentos_IA_Desc'] = df['Sentimentos_IA'].map(SENTIMENTOS_MAP)
+
+    if 'Genero' in df.columns:
+        df['Genero_Desc'] = df['Genero'].map(GENERO_MAP)
+
+    if 'Curso' in df.columns:
+        df['Curso_Desc'] = df['Curso'].map(CURSO_MAP)
+        # Se não tiver mapeamento, usar o valor original
+        df['Curso_Desc'] = df['Curso_Desc'].fillna(df['Curso'])
+
+    for col_orig, col_desc in COLUNAS_LIKERT_SURVEY:
+        if col_orig in df.columns:
+            df[col_desc] = df[col_orig].map(LIKERT_MAP)
+
+    for col_orig, espec in MULTIPLA_ESCOLHA_SURVEY.items():
+        if col_orig in df.columns:
+            df[espec['destino']] = combinacoes_multipla_escolha(df[col_orig], espec['mapa'])
+
+    # Converter GPA para numérico se existir
+    if 'GPA' in df.columns:
+        df['GPA'] = pd.to_numeric(df['GPA'], errors='coerce')
+
+    # Converter Exames_Aprovados para numérico se existir
+    if 'Exames_Aprovados' in df.columns:
+        df['Exames_Aprovados'] = pd.to_numeric(df['Exames_Aprovados'], errors='coerce')
+
+    return df
+
+# ==============================================================================
+# TEXTO LIVRE (NORMALIZAÇÃO E APROXIMAÇÃO POR TRIGRAMAS)
+# ==============================================================================
+
+# Incrementar quando normalizar_texto_livre, a comparação por trigramas ou o rótulo
+# das respostas sem tradução mudarem
+VERSAO_TEXTO_LIVRE = 2
+
+# Letras que o NFKD não decompõe em letra base + acento
+LETRAS_SEM_DECOMPOSICAO = str.maketrans({
+    'ı': 'i', 'ø': 'o', 'ß': 'ss', 'æ': 'ae', 'œ': 'oe', 'đ': 'd', 'ł': 'l', 'þ': 'th',
+})
+
+# Quantas grafias distintas ficam guardadas por processo
+MAX_GRAFIAS_EM_CACHE = 1 << 16
+
+def normalizar_texto_livre(texto):
+    """Forma comparável de uma resposta livre: sem entidades HTML ("&amp;"), sem acentos,
+    em minúsculas, com pontuação virando espaço (exceto "&") e espaços simples."""
+    texto = html.unescape(str(texto))
+    texto = unicodedata.normalize('NFKD', texto.lower())
+    texto = ''.join(c for c in texto if not unicodedata.combining(c)).translate(LETRAS_SEM_DECOMPOSICAO)
+    return ' '.join(re.sub(r'[^\w&]+|_', ' ', texto).split())
+
+def _palavras(texto):
+    """Quantas palavras o texto normalizado tem ("&" não conta)."""
+    return len(re.findall(r'[^\W_]+', texto))
+
+def _trigramas(texto):
+    """Trigramas de caracteres do texto, com espaços nas pontas para pesar o início e o fim."""
+    texto = f"  {texto} "
+    return frozenset(texto[i:i + 3] for i in range(len(texto) - 2))
+
+@lru_cache(maxsize=32)
+def _indice_trigramas(chaves):
+    """Índice invertido trigrama -> posições das chaves, o número de trigramas e o de palavras de cada chave.
+
+    Montado uma vez por mapa; cada consulta só compara a grafia com as chaves que
+    têm algum trigrama em comum com ela.
+    """
+    trigramas = [_trigramas(chave) for chave in chaves]
+    indice = {}
+    for posicao, grupo in enumerate(trigramas):
+        for trigrama in grupo:
+            indice.setdefault(trigrama, []).append(posicao)
+    return indice, [len(grupo) for grupo in trigramas], [_palavras(chave) for chave in chaves]
+
+def chave_mais_proxima(texto, chaves, similaridade_min):
+    """Chave mais parecida com o texto (Dice dos trigramas), ou None abaixo de similaridade_min.
+
+    Só concorrem chaves com o mesmo número de palavras do texto: um erro de digitação
+    troca letras, não palavras ("intern doctor" não é "intern" nem "doctor").
+    """
+    indice, tamanhos, palavras = _indice_trigramas(chaves)
+    trigramas = _trigramas(texto)
+    palavras_texto = _palavras(texto)
+    comuns = {}
+    for trigrama in trigramas:
+        for posicao in indice.get(trigrama, ()):
+            if palavras[posicao] == palavras_texto:
+                comuns[posicao] = comuns.get(posicao, 0) + 1
+    melhor, melhor_similaridade = None, 0.0
+    # Em caso de empate fica a chave declarada primeiro no mapa
+    for posicao in sorted(comuns):
+        similaridade = 2 * comuns[posicao] / (len(trigramas) + tamanhos[posicao])
+        if similaridade > melhor_similaridade:
+            melhor, melhor_similaridade = chaves[posicao], similaridade
+    return melhor if melhor_similaridade >= similaridade_min else None
+
+@lru_cache(maxsize=MAX_GRAFIAS_EM_CACHE)
+def canonizar_texto_livre(bruto, chaves, similaridade_min):
+    """Chave do mapa que corresponde à resposta livre, ou a própria resposta normalizada.
+
+    O resultado fica guardado por grafia distinta: com milhões de linhas, cada
+    grafia é normalizada e comparada com o índice uma única vez por processo.
+    """
+    texto = normalizar_texto_livre(bruto)
+    if not texto or texto in chaves:
+        return texto
+    return chave_mais_proxima(texto, chaves, similaridade_min) or texto
+
+# ==============================================================================
+# MAPEAMENTOS DO IMPACT_AI_V2
+# ==============================================================================
+
+ARQUIVO_IMPACT = 'The impact of artificial intelligence on society.csv'
+
+# Renomear e mapear colunas (baseado em graficos_output_impact_ai_v2.ipynb)
+COLUNAS_IMPACT = {
+    'How much knowledge do you have about artificial intelligence (AI) technologies?': 'Conhecimento_IA',
+    'Do you generally trust artificial intelligence (AI)?': 'Confiança_IA',
+    'Do you think artificial intelligence (AI) will be generally beneficial or harmful to humanity?': 'Impacto_Humanidade',
+    'I think artificial intelligence (AI) could threaten individual freedoms.': 'Ameaça_Liberdades',
+    'Could artificial intelligence (AI) completely eliminate some professions?': 'Elimina_Profissões',
+    'Do you think your own job could be affected by artificial intelligence (AI)?': 'Afeta_Emprego_Pessoal',
+    'Do you believe that artificial intelligence (AI) should be limited by ethical rules?': 'Limites_Éticos',
+    'Could artificial intelligence (AI) one day become conscious like humans?': 'IA_Consciente',
+    'What is your occupation? (optional)': 'Profissao',
+    'How often do you use technological devices?': 'Frequencia_Dispositivos',
+    'Please rate how actively you use AI-powered products in your daily life on a scale from 1 to 5.': 'Uso_IA_Produtos'
+}
+
+# Coluna usada com o nome original do questionário
+COLUNA_IDADE = 'What is your age range?'
+
+# Mapeamento de valores para melhor visualização
+# Normalizamos espaços e consideramos todas as alternativas do questionário.
+CONFIANCA_MAP = {
+    "I trust it": "Confio",
+    "I don't trust it": "Não Confio",
+    "I don't trust it at all": "Não Confio",
+    "I'm undecided": "Neutro",
+}
+
+IMPACTO_MAP = {
+    "Definitely beneficial": "Definitivamente Benéfica",
+    "More beneficial than harmful": "Mais Benéfica",
+    "Both beneficial and harmful": "Ambos",
+    "More harmful than beneficial": "Mais Prejudicial",
+    "Definitely harmful": "Definitivamente Prejudicial",
+    "I have no idea": "Não Sei",
+}
+
+# Mapeamento para as colunas de concordância/discordância
+# Existem várias variações de texto no CSV original
+# (ex.: "Strongly disagree", "I disagree"), então
+# normalizamos tudo para minúsculas antes de mapear.
+AGREE_MAP_NORMALIZED = {
+    "strongly agree": "Concordo Fortemente",
+    "agree": "Concordo",
+    # respostas neutras/indecisas serão exibidas como "Neutro" no gráfico
+    "i'm undecided": "Neutro",
+    "undecided": "Neutro",
+    "i disagree": "Discordo",
+    "disagree": "Discordo",
+    "strongly disagree": "Discordo Fortemente",
+}
+
+# Tradução das respostas sobre eliminação de profissões
+ELIMINA_PROF_MAP = {
+    "Absolutely Can't handle it": "Com certeza não eliminará profissões",
+    "Can't handle it": "Provavelmente não eliminará profissões",
+    "Removes": "Eliminará algumas profissões",
+    "Definitely Removes": "Com certeza eliminará profissões",
+    "I have no idea": "Não sei se eliminará profissões",
+}
+
+# Tradução das respostas sobre afetação do próprio emprego
+AFETA_EMPREGO_MAP = {
+    "Definitely I don't think so": "Com certeza não será afetado",
+    "I don't think so": "Acho que não será afetado",
+    "I'm undecided": "Estou indeciso(a)",
+    "Think": "Talvez seja afetado",
+    "I definitely think": "Com certeza será afetado",
+}
+
+# Tradução das respostas sobre IA consciente
+IA_CONSCIENTE_MAP = {
+    "Becomes": "Sim, se tornará consciente",
+    "Definitely Becomes": "Com certeza se tornará consciente",
+    "Can't": "Não pode se tornar consciente",
+    "It certainly can't be": "Certamente não pode se tornar consciente",
+    "I'm undecided": "Estou indeciso(a)",
+}
+
+# Tradução do nível de educação
+EDUCACAO_MAP = {
+    "Primary education": "Ensino Fundamental",
+    "High school": "Ensino Médio",
+    "Bachelor's degree": "Graduação",
+    "n Bachelor's degree": "Em Graduação",
+}
+
+# Tradução do gênero (mesmas categorias do Genero_Desc do Survey_AI, para o filtro global)
+GENERO_IMPACT_MAP = {
+    "male": "Masculino",
+    "female": "Feminino",
+}
+
+# Tradução do status de emprego
+EMPREGO_MAP = {
+    "Student": "Estudante",
+    "Employed": "Empregado",
+    "Unemployed": "Desempregado",
+}
+
+# Tradução de profissões (texto livre). As chaves estão na forma de normalizar_texto_livre
+# (sem acentos, entidades HTML ou pontuação); grafias próximas das chaves são
+# aproximadas pelo índice de trigramas (ver canonizar_texto_livre).
+PROFISSAO_MAP = {
+    "student": "Estudante",
+    "ogrenci": "Estudante",
+    "engineer": "Engenheiro(a)",
+    "muhendis": "Engenheiro(a)",
+    "housewife": "Dona de Casa",
+    "ev hanimi": "Dona de Casa",
+    "teacher": "Professor(a)",
+    "ogretmen": "Professor(a)",
+    "textile": "Têxtil",
+    "sales & marketing": "Vendas e Marketing",
+    "marketing": "Vendas e Marketing",
+    "child development": "Desenvolvimento Infantil",
+    "accounting": "Contabilidade",
+    "accountant": "Contabilidade",
+    "office driver": "Motorista",
+    "driver": "Motorista",
+    "merchandising": "Merchandising",
+    "real estate agent": "Corretor(a) de Imóveis",
+    "insurance agent": "Corretor(a) de Seguros",
+    "sigortaci": "Corretor(a) de Seguros",
+    "intern": "Estagiário(a)",
+    "civil servant": "Servidor(a) Público(a)",
+    "retired": "Aposentado(a)",
+    "manager": "Gerente",
+    "chemist": "Químico(a)",
+    "security": "Segurança",
+    "audiology": "Fonoaudiologia",
+    "doctor": "Médico(a)",
+    "nurse": "Enfermeiro(a)",
+}
+
+# Semelhança mínima (Dice dos trigramas) para uma grafia desconhecida cair numa chave do PROFISSAO_MAP
+# (0.6 juntava "management" a "manager"; erros de digitação como "enginer" passam de 0.8)
+SIMILARIDADE_MIN_PROFISSAO = 0.7
+
+# Tradução da frequência de uso de dispositivos tecnológicos
+FREQ_MAP = {
+    "Between 0 to 2 hours per day": "0 a 2 horas por dia",
+    "Between 2 to 5 hours per day": "2 a 5 horas por dia",
+    "Between 5 to 10 hours per day": "5 a 10 horas por dia",
+    "More than 10 hours per day": "Mais de 10 horas por dia",
+}
+
+# Ordem das respostas de cada pergunta (escala Likert / ordinal), usada nas colunas _Desc
+ORDEM_LIKERT = ['Discordo Fortemente', 'Discordo', 'Neutro', 'Concordo', 'Concordo Fortemente']
+ORDEM_CONFIANCA = ['Não Confio', 'Neutro', 'Confio']
+ORDEM_IMPACTO = [
+    'Definitivamente Prejudicial', 'Mais Prejudicial', 'Ambos', 'Mais Benéfica',
+    'Definitivamente Benéfica', 'Não Sei'
+]
+ORDEM_ELIMINA_PROF = [
+    'Com certeza não eliminará profissões', 'Provavelmente não eliminará profissões',
+    'Não sei se eliminará profissões', 'Eliminará algumas profissões', 'Com certeza eliminará profissões'
+]
+ORDEM_AFETA_EMPREGO = [
+    'Com certeza não será afetado', 'Acho que não será afetado', 'Estou indeciso(a)',
+    'Talvez seja afetado', 'Com certeza será afetado'
+]
+ORDEM_IA_CONSCIENTE = [
+    'Certamente não pode se tornar consciente', 'Não pode se tornar consciente', 'Estou indeciso(a)',
+    'Sim, se tornará consciente', 'Com certeza se tornará consciente'
+]
+ORDEM_EDUCACAO = ['Ensino Fundamental', 'Ensino Médio', 'Em Graduação', 'Graduação']
+ORDEM_EMPREGO = ['Estudante', 'Empregado', 'Desempregado']
+ORDEM_FREQ = ['0 a 2 horas por dia', '2 a 5 horas por dia', '5 a 10 horas por dia', 'Mais de 10 horas por dia']
+
+# Registro único de traduções do Impact_AI_v2: coluna de origem -> coluna _Desc.
+#   mapa:        dicionário de tradução (aplicado ao valor sem espaços nas pontas)
+#   ordem:       ordem das categorias traduzidas (gera categórico ordenado)
+#   minusculas:  normaliza para minúsculas antes de mapear
+#   fallback:    'original' mantém o valor bruto, 'titulo' usa o valor bruto com .title()
+#                (ver _rotulos_das_grafias)
+#   normalizada: nome de uma coluna extra com o valor normalizado (antes da tradução)
+#   aproximada:  texto livre; normaliza com normalizar_texto_livre e aproxima grafias
+#                parecidas das chaves do mapa (o valor é a semelhança mínima)
+TRADUCOES_IMPACT = [
+    {'origem': 'Confiança_IA', 'destino': 'Confiança_IA_Desc', 'mapa': CONFIANCA_MAP, 'ordem': ORDEM_CONFIANCA},
+    {'origem': 'Impacto_Humanidade', 'destino': 'Impacto_Humanidade_Desc', 'mapa': IMPACTO_MAP, 'ordem': ORDEM_IMPACTO},
+    {'origem': 'Ameaça_Liberdades', 'destino': 'Ameaça_Liberdades_Desc', 'mapa': AGREE_MAP_NORMALIZED,
+     'ordem': ORDEM_LIKERT, 'minusculas': True},
+    {'origem': 'Limites_Éticos', 'destino': 'Limites_Éticos_Desc', 'mapa': AGREE_MAP_NORMALIZED,
+     'ordem': ORDEM_LIKERT, 'minusculas': True},
+    {'origem': 'Elimina_Profissões', 'destino': 'Elimina_Profissões_Desc', 'mapa': ELIMINA_PROF_MAP,
+     'ordem': ORDEM_ELIMINA_PROF},
+    {'origem': 'Afeta_Emprego_Pessoal', 'destino': 'Afeta_Emprego_Pessoal_Desc', 'mapa': AFETA_EMPREGO_MAP,
+     'ordem': ORDEM_AFETA_EMPREGO},
+    {'origem': 'IA_Consciente', 'destino': 'IA_Consciente_Desc', 'mapa': IA_CONSCIENTE_MAP,
+     'ordem': ORDEM_IA_CONSCIENTE},
+    {'origem': 'What is your education level?', 'destino': 'Nivel_Educacao_Desc', 'mapa': EDUCACAO_MAP,
+     'ordem': ORDEM_EDUCACAO},
+    {'origem': 'What is your employment status?', 'destino': 'Status_Emprego_Desc', 'mapa': EMPREGO_MAP,
+     'ordem': ORDEM_EMPREGO},
+    {'origem': 'What is your gender?', 'destino': 'Genero_Desc', 'mapa': GENERO_IMPACT_MAP, 'minusculas': True,
+     'fallback': 'original'},
+    {'origem': 'Profissao', 'destino': 'Profissao_Desc', 'mapa': PROFISSAO_MAP,
+     'aproximada': SIMILARIDADE_MIN_PROFISSAO, 'fallback': 'titulo', 'normalizada': 'Profissao_Normalizada'},
+    {'origem': 'Frequencia_Dispositivos', 'destino': 'Frequencia_Dispositivos_Desc', 'mapa': FREQ_MAP,
+     'ordem': ORDEM_FREQ, 'fallback': 'original'},
+]
+
+# Faixas de uso de produtos de IA (escala 1-5)
+FAIXAS_USO_IA = ['Muito Baixo (1)', 'Baixo (2)', 'Médio (3)', 'Alto (4)', 'Muito Alto (5)']
+
+# Mapear conhecimento textual para faixas (Baixo/Médio/Alto)
+FAIXAS_CONHECIMENTO_MAP = {
+    "I have no knowledge": "Baixo",
+    "I've heard a little about it": "Baixo",
+    "I have basic knowledge": "Médio",
+    "I have a good level of knowledge": "Alto",
+}
+ORDEM_FAIXAS_CONHECIMENTO = ['Baixo', 'Médio', 'Alto']
+
+VERSAO_MAPEAMENTOS_IMPACT = _versao_mapeamentos(
+    COLUNAS_IMPACT, TRADUCOES_IMPACT, FAIXAS_USO_IA, FAIXAS_CONHECIMENTO_MAP, VERSAO_TEXTO_LIVRE
+)
+
+# Colunas originais que o modo compacto descarta (traduzidas ou convertidas em faixas)
+TRADUZIDAS_IMPACT = [espec['origem'] for espec in TRADUCOES_IMPACT] + ['Uso_IA_Produtos', 'Conhecimento_IA']
+
+def _categorias_traduzidas(traduzidos, ordem):
+    """Categorias finais: a ordem declarada seguida de valores extras (fallback), sem duplicatas."""
+    extras = pd.Index(traduzidos).dropna().unique()
+    if ordem is None:
+        return extras.sort_values()
+    return pd.Index(ordem).append(extras.difference(ordem, sort=False))
+
+def _aplicar_traducao(serie, espec, pesos=None):
+    """Traduz uma coluna pelos códigos do categórico.
+
+    Cada valor distinto é normalizado e traduzido uma única vez; as linhas apenas
+    reaproveitam os códigos inteiros, sem criar novas strings por linha.
+    pesos: quantas respostas cada linha representa (None = uma).
+    Retorna (coluna traduzida, coluna normalizada ou None).
+    """
+    cat = pd.Categorical(serie)
+    brutos = pd.Index(cat.categories.astype(str))
+    if espec.get('aproximada'):
+        chaves = tuple(espec['mapa'])
+        normalizados = pd.Index([canonizar_texto_livre(bruto, chaves, espec['aproximada']) for bruto in brutos])
+    else:
+        normalizados = brutos.str.strip()
+        if espec.get('minusculas'):
+            normalizados = normalizados.str.lower()
+
+    traduzidos = pd.Series(normalizados.map(espec['mapa']), dtype=object)
+    fallback = espec.get('fallback')
+    if fallback == 'original':
+        traduzidos = traduzidos.fillna(pd.Series(brutos, dtype=object))
+    elif fallback == 'titulo':
+        traduzidos = traduzidos.fillna(_rotulos_das_grafias(brutos, normalizados, cat.codes, pesos))
+    # Garantir que valores vazios sejam tratados como NA
+    traduzidos = traduzidos.replace(['', 'nan', 'None'], np.nan)
+
+    ordem = espec.get('ordem')
+    traduzida = _recodificar(cat.codes, traduzidos, _categorias_traduzidas(traduzidos, ordem), ordem is not None)
+    normalizada = None
+    if espec.get('normalizada'):
+        normalizada = _recodificar(cat.codes, normalizados, pd.Index(normalizados).unique(), False)
+    return traduzida, normalizada
+
+def _rotulos_das_grafias(brutos, normalizados, codigos, pesos=None):
+    """Rótulo de cada valor bruto sem tradução: a grafia original com .title().
+
+    Grafias com o mesmo valor normalizado (caixa, acento, espaços) ficam numa só
+    categoria, com a grafia de mais respostas entre elas (a primeira, em empate); o
+    valor normalizado só serve para comparar.
+    """
+    validos = codigos >= 0
+    frequencias = np.bincount(
+        codigos[validos], weights=None if pesos is None else np.asarray(pesos)[validos], minlength=len(brutos)
+    )
+    grafias = pd.DataFrame({'normalizado': normalizados, 'frequencia': frequencias})
+    escolhida = (grafias.sort_values('frequencia', ascending=False, kind='stable')
+                 .reset_index().drop_duplicates('normalizado').set_index('normalizado')['index'])
+    rotulos = np.array([' '.join(html.unescape(bruto).split()).title() for bruto in brutos], dtype=object)
+    return pd.Series(rotulos[escolhida.reindex(normalizados).to_numpy()], dtype=object)
+
+def _recodificar(codigos, valores, categorias, ordenado):
+    """Monta um categórico a partir dos códigos originais e do valor novo de cada categoria."""
+    codigos_destino = categorias.get_indexer(valores)
+    novos_codigos = np.where(codigos >= 0, codigos_destino[codigos], -1)
+    return pd.Categorical.from_codes(novos_codigos, categories=categorias, ordered=ordenado)
+
+# Função para carregar e preparar os dados do Impact_AI_v2.csv
+@st.cache_data
+def load_and_prepare_impact_data():
+    # Se o CSV e os mapeamentos não mudaram, o Parquet já tem o resultado final
+    caminho_cache = _caminho_cache_colunar(ARQUIVO_IMPACT, VERSAO_MAPEAMENTOS_IMPACT)
+    with medir_etapa('ler_cache_colunar', arquivo=ARQUIVO_IMPACT) as medida:
+        df = _ler_cache_colunar(caminho_cache)
+        medida['linhas'] = None if df is None else len(df)
+    if df is not None:
+        return df
+
+    with medir_etapa('ler_csv', arquivo=ARQUIVO_IMPACT) as medida:
+        try:
+            # Caminho relativo: espera o arquivo na mesma pasta do app.py
+            df = ler_csv(ARQUIVO_IMPACT)
+        except FileNotFoundError:
+            st.error("Arquivo 'The impact of artificial intelligence on society.csv' não encontrado. Coloque o arquivo na mesma pasta do app ou ajuste o caminho no código.")
+            return None
+        except Exception as e:
+            st.error(f"Erro ao carregar 'The impact of artificial intelligence on society.csv': {e}. Não foi possível carregar os dados.")
+            return None
+        medida['linhas'] = len(df)
+
+    with medir_etapa('preparar', arquivo=ARQUIVO_IMPACT, linhas=len(df)):
+        df = prepare_impact_data(df)
+        if MODO_COMPACTO:
+            df = compactar_dados(df, TRADUZIDAS_IMPACT)
+    with medir_etapa('salvar_cache_colunar', arquivo=ARQUIVO_IMPACT, linhas=len(df)):
+        _salvar_cache_colunar(caminho_cache, df)
+    return df
+
+def prepare_impact_data(df, pesos=None):
+    # pesos: coluna com quantas respostas cada linha representa (resultado de um GROUP BY);
+    # o rótulo das profissões sem tradução é escolhido pelas respostas, não pelas linhas
+    valores_pesos = None if pesos is None else df[pesos].to_numpy()
+    cols_to_rename = {k: v for k, v in COLUNAS_IMPACT.items() if k in df.columns}
+    df.rename(columns=cols_to_rename, inplace=True)
+
+    for espec in TRADUCOES_IMPACT:
+        if espec['origem'] not in df.columns:
+            continue
+        traduzida, normalizada = _aplicar_traducao(df[espec['origem']], espec, valores_pesos)
+        if normalizada is not None:
+            df[espec['normalizada']] = normalizada
+        df[espec['destino']] = traduzida
+
+    # Criar categorias de uso de IA para melhor visualização
+    if 'Uso_IA_Produtos' in df.columns:
+        uso = pd.to_numeric(df['Uso_IA_Produtos'], errors='coerce')
+        df['Uso_IA_Categoria'] = pd.cut(uso, bins=[0, 1, 2, 3, 4, 5], labels=FAIXAS_USO_IA, include_lowest=True)
+
+    # Respostas fora das três faixas ficam como NA e não entram no gráfico
+    if 'Conhecimento_IA' in df.columns:
+        espec_faixa = {'mapa': FAIXAS_CONHECIMENTO_MAP, 'ordem': ORDEM_FAIXAS_CONHECIMENTO}
+        df['Conhecimento_IA_Faixa'], _ = _aplicar_traducao(df['Conhecimento_IA'], espec_faixa)
+
+    return df
+
+# ==============================================================================
+# PREPARO DE CADA PESQUISA
+# ==============================================================================
+
+# Como cada pesquisa é lida e preparada; o app (graficos.DATASETS), as ondas, a
+# fonte MySQL e os scripts de linha de comando usam todos este registro.
+#   arquivo:    CSV da pesquisa
+#   colunas:    renomeação das colunas do questionário
+#   carregar:   loader do app (com o cache Parquet)
+#   preparar:   preparo de um DataFrame lido do CSV, ou de um GROUP BY com
+#               pesos=<coluna das contagens>
+#   versao:     versão dos mapeamentos (entra nas assinaturas dos caches)
+#   traduzidas: colunas originais que o modo compacto descarta
+PREPARO = {
+    'survey': {
+        'arquivo': ARQUIVO_SURVEY,
+        'colunas': COLUNAS_SURVEY,
+        'carregar': load_and_prepare_survey_data,
+        'preparar': prepare_survey_data,
+        'versao': VERSAO_MAPEAMENTOS_SURVEY,
+        'traduzidas': TRADUZIDAS_SURVEY,
+    },
+    'impact': {
+        'arquivo': ARQUIVO_IMPACT,
+        'colunas': COLUNAS_IMPACT,
+        'carregar': load_and_prepare_impact_data,
+        'preparar': prepare_impact_data,
+        'versao': VERSAO_MAPEAMENTOS_IMPACT,
+        'traduzidas': TRADUZIDAS_IMPACT,
+    },
+}
+
+# ==============================================================================
+# MODO COMPACTO
+# ==============================================================================
+
+def compactar_dados(df, traduzidas=()):
+    """DataFrame preparado com menos memória, sem mudar nenhuma contagem.
+
+    - descarta as colunas originais listadas em `traduzidas` (as _Desc ficam);
+    - inteiros (escalas Likert, flags 0/1, ids) no menor tipo que cabe (int8...);
+    - texto com poucos valores distintos vira categórico (um código por linha).
+    """
+    df = df.drop(columns=[col for col in traduzidas if col in df.columns])
+    for col in df.columns:
+        serie = df[col]
+        if isinstance(serie.dtype, pd.CategoricalDtype) or pd.api.types.is_bool_dtype(serie.dtype):
+            continue
+        if pd.api.types.is_integer_dtype(serie.dtype):
+            df[col] = pd.to_numeric(serie, downcast='integer')
+        elif pd.api.types.is_object_dtype(serie.dtype) or pd.api.types.is_string_dtype(serie.dtype):
+            if serie.nunique(dropna=True) <= len(serie) * FRACAO_MAX_CATEGORIAS:
+                df[col] = serie.astype('category')
+    return df
+
+def relatorio_memoria(antes, depois):
+    """Bytes por coluna antes e depois da compactação (colunas removidas com depois = 0)."""
+    bytes_antes = antes.memory_usage(deep=True, index=False)
+    bytes_depois = depois.memory_usage(deep=True, index=False)
+    relatorio = pd.DataFrame({
+        'tipo_antes': antes.dtypes.astype(str),
+        'bytes_antes': bytes_antes,
+        'tipo_depois': depois.dtypes.astype(str).reindex(antes.columns, fill_value='(removida)'),
+        'bytes_depois': bytes_depois.reindex(antes.columns, fill_value=0),
+    })
+    relatorio['economia'] = 1 - relatorio['bytes_depois'] / relatorio['bytes_antes']
+    relatorio.index.name = 'coluna'
+    return relatorio.sort_values('bytes_antes', ascending=False)
+
+# ==============================================================================
+# CUBO DE CONTAGENS (AGREGAÇÕES COMPARTILHADAS PELOS GRÁFICOS)
+# ==============================================================================
+
+def codificar(serie):
+    """Códigos inteiros (-1 = ausente) e categorias de uma coluna."""
+    cat = serie.array if isinstance(serie.dtype, pd.CategoricalDtype) else pd.Categorical(serie)
+    categorias = cat.categories
+    if pd.api.types.is_integer_dtype(categorias.dtype):
+        # Colunas compactadas (int8...) mantêm no cubo as mesmas categorias int64 de antes
+        categorias = categorias.astype(np.int64)
+    return np.asarray(cat.codes, dtype=np.int64), categorias
+
+def chave_regressao(col_x, col_y):
+    """Chave no cubo das somas de regressão (estatisticas.somas_regressao) de y em função de x."""
+    return ('regressao', col_x, col_y)
+
+def construir_cubo(df, contagens, cruzamentos, pesos=None, regressoes=()):
+    """Monta de uma vez todas as tabelas de contagem usadas pelos gráficos.
+
+    Cada coluna é convertida em códigos inteiros uma única vez e cada tabela sai
+    de um np.bincount sobre esses códigos. Chaves: nome da coluna para contagens
+    simples e (coluna_linha, coluna_coluna) para tabelas cruzadas. Os loaders
+    acrescentam '_assinatura', que identifica o conteúdo dos dados de origem.
+
+    Com pesos (nome de uma coluna de df), cada linha conta como o seu peso: é o
+    caso de resultados já agregados por GROUP BY no banco de dados.
+
+    Cada par (x, y) de regressoes guarda em chave_regressao(x, y) as somas da
+    regressão linear, que também se somam entre cubos (ver estatisticas.py).
+    """
+    codificadas = {}
+    valores_pesos = None if pesos is None else df[pesos].to_numpy(dtype=np.int64)
+
+    def codigos_de(col):
+        if col not in df.columns:
+            return None
+        if col not in codificadas:
+            codificadas[col] = codificar(df[col])
+        return codificadas[col]
+
+    return _montar_cubo(codigos_de, contagens, cruzamentos, valores_pesos, regressoes)
+
+def _montar_cubo(codigos_de, contagens, cruzamentos, valores_pesos=None, regressoes=()):
+    """Tabelas do cubo a partir de codigos_de(col) -> (códigos, categorias) ou None."""
+    def contar(codigos, validos, tamanho):
+        if valores_pesos is None:
+            return np.bincount(codigos, minlength=tamanho)
+        return np.bincount(codigos, weights=valores_pesos[validos], minlength=tamanho).astype(np.int64)
+
+    cubo = {}
+    for col in contagens:
+        codificada = codigos_de(col)
+        if codificada is None:
+            continue
+        codigos, categorias = codificada
+        validos = codigos >= 0
+        contagem = contar(codigos[validos], validos, len(categorias))
+        cubo[col] = pd.Series(contagem, index=pd.Index(categorias, name=col), name='count')
+
+    for col_a, col_b in cruzamentos:
+        codificada_a, codificada_b = codigos_de(col_a), codigos_de(col_b)
+        if codificada_a is None or codificada_b is None:
+            continue
+        codigos_a, categorias_a = codificada_a
+        codigos_b, categorias_b = codificada_b
+        validos = (codigos_a >= 0) & (codigos_b >= 0)
+        combinados = codigos_a[validos].astype(np.int64, copy=False) * len(categorias_b) + codigos_b[validos]
+        plano = contar(combinados, validos, len(categorias_a) * len(categorias_b))
+        cubo[(col_a, col_b)] = pd.DataFrame(
+            plano.reshape(len(categorias_a), len(categorias_b)),
+            index=pd.Index(categorias_a, name=col_a),
+            columns=pd.Index(categorias_b, name=col_b)
+        )
+
+    for col_x, col_y in regressoes:
+        codificada_x, codificada_y = codigos_de(col_x), codigos_de(col_y)
+        if codificada_x is None or codificada_y is None:
+            continue
+        # Os valores saem das categorias: cada valor distinto é convertido uma vez
+        codigos_x, categorias_x = codificada_x
+        codigos_y, categorias_y = codificada_y
+        validos = (codigos_x >= 0) & (codigos_y >= 0)
+        cubo[chave_regressao(col_x, col_y)] = somas_regressao(
+            np.asarray(categorias_x, dtype=float)[codigos_x[validos]],
+            np.asarray(categorias_y, dtype=float)[codigos_y[validos]],
+            None if valores_pesos is None else valores_pesos[validos],
+        )
+    return cubo
+
+def _alinhar_indice(novas, atuais):
+    """Converte as categorias novas para o tipo das existentes quando não muda valores.
+
+    Ex.: coluna inteira que veio como float num trecho pequeno do CSV (1.0 -> 1).
+    """
+    if novas.dtype == atuais.dtype:
+        return novas
+    try:
+        convertidas = novas.astype(atuais.dtype)
+    except (TypeError, ValueError):
+        return novas
+    return convertidas if (convertidas == novas).all() else novas
+
+def _unir_categorias(atuais, novas):
+    """Categorias de um cubo somado, na mesma ordem que o construir_cubo daria.
+
+    Os dois cubos saem do mesmo preparo: começam pela ordem declarada (se houver)
+    e seguem com as demais categorias em ordem crescente. O início comum fica
+    como está e o restante das duas listas é unido e ordenado.
+    """
+    comum = 0
+    for atual, nova in zip(atuais, novas):
+        if atual != nova:
+            break
+        comum += 1
+    extras = novas[comum:].difference(atuais, sort=False)
+    if not len(extras):
+        return atuais
+    resto = atuais[comum:].append(extras)
+    try:
+        resto = resto.sort_values()
+    except TypeError:
+        # Categorias de tipos misturados: as novas ficam no fim
+        pass
+    return atuais[:comum].append(resto).rename(atuais.name)
+
+def somar_cubos(cubo, novo):
+    """Cubo com as contagens de `novo` (só as respostas novas) somadas às de `cubo`.
+
+    Os dois precisam ter sido montados com as mesmas agregações; chaves que não
+    são tabelas (como '_assinatura') são mantidas de `cubo`.
+    """
+    soma = dict(cubo)
+    for chave, tabela in cubo.items():
+        delta = novo.get(chave)
+        if delta is None or not isinstance(tabela, (pd.Series, pd.DataFrame)):
+            continue
+        if isinstance(tabela, pd.Series):
+            delta = delta.set_axis(_alinhar_indice(delta.index, tabela.index))
+            indice = _unir_categorias(tabela.index, delta.index)
+            soma[chave] = tabela.reindex(indice, fill_value=0) + delta.reindex(indice, fill_value=0)
+        else:
+            delta = delta.set_axis(_alinhar_indice(delta.index, tabela.index), axis=0)
+            delta = delta.set_axis(_alinhar_indice(delta.columns, tabela.columns), axis=1)
+            linhas = _unir_categorias(tabela.index, delta.index)
+            colunas = _unir_categorias(tabela.columns, delta.columns)
+            soma[chave] = (
+                tabela.reindex(index=linhas, columns=colunas, fill_value=0)
+                + delta.reindex(index=linhas, columns=colunas, fill_value=0)
+            )
+    return soma
+
+def contagem_do_cubo(cubo, col):
+    """Contagem simples sem as categorias que não tiveram respostas."""
+    contagem = cubo[col]
+    return contagem[contagem > 0]
+
+def cruzada_do_cubo(cubo, col_a, col_b, normalizar=False):
+    """Tabela cruzada como a de pd.crosstab; com normalizar=True, percentual por linha (1 casa)."""
+    tabela = cubo[(col_a, col_b)]
+    tabela = tabela.loc[tabela.sum(axis=1) > 0, tabela.sum(axis=0) > 0]
+    if normalizar:
+        tabela = (tabela.div(tabela.sum(axis=1), axis=0) * 100).round(1)
+    return tabela
+
+# ==============================================================================
+# MÚLTIPLA ESCOLHA
+# ==============================================================================
+
+SEPARADOR_MULTIPLA_ESCOLHA = ';'
+
+# Ordem dos itens de cada coluna de combinação (a dos mapas, sem repetir traduções)
+ORDEM_DOS_ITENS = {
+    espec['destino']: list(dict.fromkeys(espec['mapa'].values())) for espec in MULTIPLA_ESCOLHA_SURVEY.values()
+}
+
+def _itens_dos_textos(textos, mapa=None, separador=SEPARADOR_MULTIPLA_ESCOLHA):
+    """Itens (traduzidos e sem repetição) de cada texto de múltipla escolha."""
+    mapa = mapa or {}
+    itens = []
+    for texto in textos:
+        separados = (item.strip() for item in str(texto).split(separador))
+        itens.append(list(dict.fromkeys(mapa.get(item, item) for item in separados if item)))
+    return itens
+
+def _ordenar_itens(encontrados, ordem):
+    """Itens da ordem declarada que aparecem, seguidos dos demais em ordem alfabética."""
+    encontrados = set(encontrados)
+    conhecidos = [item for item in ordem if item in encontrados]
+    return conhecidos + sorted(encontrados.difference(conhecidos))
+
+def _scipy_sparse():
+    """scipy.sparse, importado só quando alguma matriz de múltipla escolha é usada."""
+    from scipy import sparse
+    return sparse
+
+def decodificar_multipla_escolha(serie, mapa=None, ordem=(), separador=SEPARADOR_MULTIPLA_ESCOLHA):
+    """Matriz indicadora (respostas x itens) de um campo de múltipla escolha, e a lista de itens.
+
+    Cada texto distinto é separado uma única vez (pd.factorize); a matriz de todas
+    as respostas sai de uma só indexação das linhas dos textos distintos pelos
+    códigos das respostas. A matriz é esparsa (scipy.sparse, CSR) e as respostas
+    vazias ficam com a linha zerada.
+    """
+    codigos, distintos = pd.factorize(serie)
+    itens_por_texto = _itens_dos_textos(distintos, mapa, separador)
+    itens = _ordenar_itens((item for itens_do_texto in itens_por_texto for item in itens_do_texto), ordem)
+    posicao = {item: i for i, item in enumerate(itens)}
+
+    # Uma linha por texto distinto e uma linha zerada no fim, para as respostas vazias
+    linhas = np.repeat(np.arange(len(distintos)), [len(itens_do_texto) for itens_do_texto in itens_por_texto])
+    colunas = np.array([posicao[item] for itens_do_texto in itens_por_texto for item in itens_do_texto], dtype=np.int64)
+    forma = (len(distintos) + 1, len(itens))
+    indices = np.where(codigos >= 0, codigos, len(distintos))
+    por_texto = _scipy_sparse().csr_matrix((np.ones(len(colunas), dtype=np.int64), (linhas, colunas)), shape=forma)
+    return por_texto[indices], itens
+
+def combinacoes_multipla_escolha(serie, mapa=None, separador=SEPARADOR_MULTIPLA_ESCOLHA):
+    """Combinação de itens de cada resposta, traduzidos e na ordem do mapa, como um texto só.
+
+    Respostas com os mesmos itens em ordens diferentes viram a mesma combinação,
+    e o cubo conta a coluna como qualquer outra (ver coocorrencia_do_cubo).
+    """
+    codigos, distintos = pd.factorize(serie)
+    ordem = list(dict.fromkeys((mapa or {}).values()))
+    combinacoes = np.array([
+        separador.join(_ordenar_itens(itens_do_texto, ordem)) or None
+        for itens_do_texto in _itens_dos_textos(distintos, mapa, separador)
+    ] + [None], dtype=object)
+    return pd.Series(combinacoes[np.where(codigos >= 0, codigos, len(distintos))], index=serie.index)
+
+def coocorrencia(matriz, pesos=None):
+    """Matriz item x item de respostas que marcaram os dois itens (na diagonal, o total do item).
+
+    Um único produto de matrizes esparsas; com pesos, cada linha conta como o seu peso.
+    """
+    ponderada = matriz if pesos is None else matriz.multiply(np.asarray(pesos)[:, None]).tocsr()
+    return np.asarray((matriz.T @ ponderada).todense(), dtype=np.int64)
+
+def coocorrencia_do_cubo(cubo, col):
+    """Coocorrência (DataFrame item x item) a partir da contagem das combinações de `col` no cubo.
+
+    Só as combinações distintas são decodificadas, cada uma pesando o número de
+    respostas que a escolheram.
+    """
+    contagem = contagem_do_cubo(cubo, col)
+    matriz, itens = decodificar_multipla_escolha(
+        pd.Series(contagem.index.astype(str)), ordem=ORDEM_DOS_ITENS.get(col, ())
+    )
+    return pd.DataFrame(
+        coocorrencia(matriz, contagem.to_numpy()), index=pd.Index(itens, name=col), columns=pd.Index(itens, name=col)
+    )
+
+# ==============================================================================
+# ÍNDICE DOS FILTROS
+# ==============================================================================
+
+def _codigos_compactos(codigos, categorias):
+    """Códigos no menor inteiro com sinal que comporta as categorias (e o -1 de NA)."""
+    for tipo in (np.int8, np.int16, np.int32):
+        if len(categorias) <= np.iinfo(tipo).max:
+            return codigos.astype(tipo)
+    return codigos
+
+def construir_indice(df, colunas, colunas_filtro, colunas_dataframe=()):
+    """Índice para recortar o cubo por filtros sem voltar ao DataFrame.
+
+    Guarda os códigos inteiros de cada coluna (como no construir_cubo) e, para
+    cada coluna de filtro, um bitmap por valor (np.packbits de "a linha tem esse
+    valor"). As colunas de usa_dataframe ficam como estão, na mesma ordem de linhas.
+    """
+    codificadas = {}
+    for col in colunas:
+        if col in df.columns:
+            codigos, categorias = codificar(df[col])
+            codificadas[col] = (_codigos_compactos(codigos, categorias), categorias)
+    bitmaps = {}
+    for col in colunas_filtro:
+        if col in codificadas:
+            codigos, categorias = codificadas[col]
+            bitmaps[col] = {valor: np.packbits(codigos == i) for i, valor in enumerate(categorias)}
+    return {
+        'linhas': len(df),
+        'codificadas': codificadas,
+        'bitmaps': bitmaps,
+        'dataframe': df[[col for col in colunas_dataframe if col in df.columns]].reset_index(drop=True),
+    }
+
+def mascara_do_indice(indice, filtros):
+    """Linhas que passam em todos os filtros ((coluna, valores), ...) como array booleano.
+
+    Dentro de um filtro os bitmaps dos valores escolhidos são unidos (OU) e entre
+    filtros intersectados (E), tudo sobre os bits compactados. Colunas fora do
+    índice são ignoradas; None quando nenhum filtro se aplica.
+    """
+    combinada = None
+    for coluna, valores in filtros:
+        bitmaps = indice['bitmaps'].get(coluna)
+        if bitmaps is None:
+            continue
+        do_filtro = np.zeros((indice['linhas'] + 7) // 8, dtype=np.uint8)
+        for valor in valores:
+            bitmap = bitmaps.get(valor)
+            if bitmap is not None:
+                np.bitwise_or(do_filtro, bitmap, out=do_filtro)
+        if combinada is None:
+            combinada = do_filtro
+        else:
+            np.bitwise_and(combinada, do_filtro, out=combinada)
+    if combinada is None:
+        return None
+    return np.unpackbits(combinada, count=indice['linhas']).astype(bool)
+
+def cubo_do_indice(indice, contagens, cruzamentos, mascara=None, regressoes=()):
+    """Cubo (como o do construir_cubo) só com as linhas da máscara.
+
+    A máscara é aplicada uma única vez aos códigos de cada coluna, e as tabelas
+    de todos os gráficos são contadas sobre esses códigos já recortados.
+    """
+    recortadas = {}
+
+    def codigos_de(col):
+        if col not in indice['codificadas']:
+            return None
+        if col not in recortadas:
+            codigos, categorias = indice['codificadas'][col]
+            recortadas[col] = (codigos if mascara is None else codigos[mascara], categorias)
+        return recortadas[col]
+
+    return _montar_cubo(codigos_de, contagens, cruzamentos, regressoes=regressoes)
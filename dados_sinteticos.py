@@ -0,0 +1,138 @@
+"""Gera versões sintéticas dos CSVs das pesquisas, em qualquer tamanho.
+
+Os arquivos saem com o mesmo nome, cabeçalho, codificação e vocabulário dos CSVs
+reais, então o app e o benchmark.py os leem sem nenhuma mudança. Cada linha nova
+parte de uma resposta real sorteada; uma fração dos grupos de colunas é trocada
+pelos de outra resposta sorteada, o que cria combinações novas sem perder de
+todo as relações entre as perguntas. Campos de múltipla escolha (Q2.AI_sources,
+Q6.Domains) são sorteados junto com as flags 0/1 correspondentes, para que o
+texto separado por ';' e as flags continuem coerentes.
+
+Uso:
+    python dados_sinteticos.py --linhas 100000 --saida dados_sinteticos/100000
+"""
+import argparse
+import os
+import sys
+import time
+
+import pandas as pd
+import numpy as np
+
+from medicoes import silenciar_fora_do_app
+
+silenciar_fora_do_app()
+
+from dados import ARQUIVO_IMPACT, ARQUIVO_SURVEY, ler_csv
+
+ARQUIVOS_REAIS = [ARQUIVO_SURVEY, ARQUIVO_IMPACT]
+
+# Campo de múltipla escolha -> prefixo das colunas de flags que o acompanham
+CAMPOS_MULTIPLOS = {
+    'Q2.AI_sources': 'Q2#',
+    'Q6.Domains': 'Q6#',
+}
+
+COLUNA_ID = 'ID'
+
+# Fração dos grupos de colunas de cada linha que vem de outra resposta sorteada
+MISTURA_PADRAO = 0.3
+
+LINHAS_POR_BLOCO = 500_000
+
+def _grupos_de_colunas(colunas):
+    """Colunas sorteadas juntas: cada campo de múltipla escolha com suas flags, as demais sozinhas."""
+    grupos, agrupadas = [], set()
+    for campo, prefixo in CAMPOS_MULTIPLOS.items():
+        if campo in colunas:
+            grupo = [campo] + [col for col in colunas if col.startswith(prefixo)]
+            grupos.append(grupo)
+            agrupadas.update(grupo)
+    grupos.extend([col] for col in colunas if col not in agrupadas and col != COLUNA_ID)
+    return grupos
+
+def _casas_decimais(serie):
+    valores = serie.dropna().astype(str)
+    return int(valores.str.partition('.')[2].str.len().max() or 0)
+
+def _continuas(real):
+    """Colunas numéricas não inteiras (ex.: Q16.GPA) e as casas decimais de cada uma."""
+    continuas = {}
+    for col in real.columns:
+        serie = real[col]
+        if pd.api.types.is_float_dtype(serie) and (serie.dropna() % 1 != 0).any():
+            continuas[col] = _casas_decimais(serie)
+    return continuas
+
+def gerar_bloco(real, grupos, continuas, linhas, primeiro_id, rng, mistura=MISTURA_PADRAO):
+    """`linhas` respostas sintéticas com ids a partir de primeiro_id."""
+    base = rng.integers(0, len(real), size=linhas)
+    dados = {COLUNA_ID: np.arange(primeiro_id, primeiro_id + linhas)} if COLUNA_ID in real.columns else {}
+    for grupo in grupos:
+        origem = np.where(rng.random(linhas) < mistura, rng.integers(0, len(real), size=linhas), base)
+        for col in grupo:
+            dados[col] = real[col].to_numpy()[origem]
+
+    for col, casas in continuas.items():
+        # Ruído pequeno, dentro da faixa observada, para não repetir só os valores reais
+        serie = real[col].dropna()
+        ruido = rng.normal(0, serie.std() * 0.1 if len(serie) > 1 else 0, size=linhas)
+        valores = np.clip(dados[col] + ruido, serie.min(), serie.max()).round(casas)
+        dados[col] = np.where(pd.isna(dados[col]), np.nan, valores)
+    return pd.DataFrame(dados, columns=real.columns)
+
+def gerar_csv(caminho_real, destino, linhas, semente=0, mistura=MISTURA_PADRAO):
+    """Grava em `destino` um CSV sintético com `linhas` respostas, em blocos."""
+    real = ler_csv(caminho_real)
+    encoding = real.attrs['codificacao']
+    grupos = _grupos_de_colunas(list(real.columns))
+    continuas = _continuas(real)
+    rng = np.random.default_rng(semente)
+
+    os.makedirs(os.path.dirname(destino) or '.', exist_ok=True)
+    temporario = f"{destino}.{os.getpid()}.tmp"
+    try:
+        with open(temporario, 'w', encoding=encoding, newline='') as f:
+            for inicio in range(0, linhas, LINHAS_POR_BLOCO) if linhas else [0]:
+                tamanho = min(LINHAS_POR_BLOCO, linhas - inicio)
+                bloco = gerar_bloco(real, grupos, continuas, tamanho, inicio + 1, rng, mistura)
+                bloco.to_csv(f, index=False, header=inicio == 0, lineterminator='\r\n')
+        os.replace(temporario, destino)
+    finally:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+    return destino
+
+def gerar_conjunto(pasta, linhas, semente=0, mistura=MISTURA_PADRAO):
+    """Gera os dois CSVs sintéticos em `pasta`, com os nomes dos arquivos reais."""
+    pasta_reais = os.path.dirname(os.path.abspath(__file__))
+    gerados = []
+    for i, arquivo in enumerate(ARQUIVOS_REAIS):
+        gerados.append(gerar_csv(
+            os.path.join(pasta_reais, arquivo), os.path.join(pasta, arquivo),
+            linhas, semente + i, mistura
+        ))
+    return gerados
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera CSVs sintéticos com o formato das pesquisas reais.")
+    parser.add_argument('--linhas', type=int, required=True, help="Respostas por arquivo")
+    parser.add_argument('--saida', default=None, help="Pasta de destino (padrão: dados_sinteticos/<linhas>)")
+    parser.add_argument('--semente', type=int, default=0, help="Semente do sorteio (padrão: 0)")
+    parser.add_argument('--mistura', type=float, default=MISTURA_PADRAO,
+                        help=f"Fração das colunas vinda de outra resposta (padrão: {MISTURA_PADRAO})")
+    args = parser.parse_args(argv)
+    if args.linhas < 0:
+        parser.error("--linhas não pode ser negativo")
+    if not 0 <= args.mistura <= 1:
+        parser.error("--mistura deve estar entre 0 e 1")
+
+    pasta = os.path.abspath(args.saida or os.path.join('dados_sinteticos', str(args.linhas)))
+    inicio = time.perf_counter()
+    for caminho in gerar_conjunto(pasta, args.linhas, args.semente, args.mistura):
+        print(f"{caminho} ({os.path.getsize(caminho) / 1e6:.1f} MB)")
+    print(f"{args.linhas} linha(s) por arquivo em {time.perf_counter() - inicio:.1f}s")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,229 @@
+"""Estatísticas calculadas sobre o cubo, sem voltar às linhas dos dados.
+
+Regressão linear: as somas de um par de colunas numéricas (n, Σx, Σy, Σx², Σxy,
+Σy²) se somam entre trechos de dados. O cubo as guarda como qualquer contagem,
+soma as das respostas acrescentadas ao CSV e as recalcula para cada combinação de
+filtros; a reta, o r, o p-valor e a banda de confiança saem dessas seis somas.
+
+Tabelas cruzadas: qui-quadrado, teste G, V de Cramér e resíduos padronizados de
+todas as tabelas de um cubo numa única passada vetorizada (testes_das_cruzadas), e
+intervalos bootstrap dos percentuais por linha, com sorteios multinomiais sobre as
+contagens (intervalos_bootstrap).
+
+As distribuições t e qui-quadrado vêm do scipy.stats, importado só na primeira conta.
+"""
+import math
+
+import pandas as pd
+import numpy as np
+
+CAMPOS_SOMAS = ['n', 'soma_x', 'soma_y', 'soma_xx', 'soma_xy', 'soma_yy']
+
+NIVEL_CONFIANCA = 0.95
+
+# Nível de significância das anotações e limite dos resíduos padronizados destacados
+ALFA = 0.05
+LIMITE_RESIDUO = 1.96
+
+# Contagem esperada abaixo da qual a aproximação do qui-quadrado fica fraca
+ESPERADO_MINIMO = 5
+
+REAMOSTRAS_BOOTSTRAP = 2000
+
+# A partir de quantas células sorteadas (reamostras x células, somando as tabelas)
+# o bootstrap é dividido entre processos, quando há um executor. Medido: cada
+# sorteio custa ~150 ns em série e o pool já iniciado acrescenta ~10 ms por chamada
+# (iniciar o pool com spawn custa ~1,5 s, uma vez por processo do app). Com 1 milhão
+# (~0,15 s em série) dois processos já economizam várias vezes esse custo; abaixo
+# disso, como nos ~290 mil dos gráficos do Impact_AI_v2, fica tudo em série.
+SORTEIOS_PARA_PARALELIZAR = 1_000_000
+
+def somas_regressao(x, y, pesos=None):
+    """Somas dos pares (x, y) sem NA, como Series indexada por CAMPOS_SOMAS.
+
+    Com pesos, cada par conta como o seu peso (linhas já agregadas por GROUP BY).
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    pesos = np.ones(len(x)) if pesos is None else np.asarray(pesos, dtype=float)
+    validos = ~(np.isnan(x) | np.isnan(y))
+    x, y, pesos = x[validos], y[validos], pesos[validos]
+    valores = [pesos.sum(), pesos @ x, pesos @ y, pesos @ (x * x), pesos @ (x * y), pesos @ (y * y)]
+    return pd.Series(valores, index=pd.Index(CAMPOS_SOMAS), name='somas', dtype=float)
+
+def _scipy_stats():
+    """scipy.stats, importado só quando um p-valor é calculado (o import leva ~1 s)."""
+    from scipy import stats
+    return stats
+
+def p_valor_t(t, gl):
+    """P(|T| >= |t|) para a t de Student com gl graus de liberdade (bicaudal)."""
+    return float(2 * _scipy_stats().t.sf(abs(t), gl))
+
+def quantil_t(probabilidade, gl):
+    """t com P(T <= t) = probabilidade."""
+    return float(_scipy_stats().t.ppf(probabilidade, gl))
+
+def regressao_das_somas(somas, nivel=NIVEL_CONFIANCA):
+    """Reta de mínimos quadrados (como np.polyfit grau 1) e sua incerteza, a partir das somas.
+
+    Retorna dict com n, inclinacao, intercepto, r, p_valor (da inclinação) e o que
+    banda_de_confianca precisa; None se não houver pelo menos dois x distintos.
+    """
+    n = float(somas['n'])
+    if n < 2:
+        return None
+    media_x, media_y = somas['soma_x'] / n, somas['soma_y'] / n
+    sxx = somas['soma_xx'] - somas['soma_x'] * media_x
+    syy = somas['soma_yy'] - somas['soma_y'] * media_y
+    sxy = somas['soma_xy'] - somas['soma_x'] * media_y
+    if sxx <= 0:
+        return None
+    inclinacao = sxy / sxx
+    gl = n - 2
+    residuos = max(syy - inclinacao * sxy, 0.0)
+    erro_padrao = math.sqrt(residuos / gl) if gl > 0 else math.nan
+    if gl <= 0:
+        p_valor = math.nan
+    elif erro_padrao == 0:
+        p_valor = 0.0
+    else:
+        p_valor = p_valor_t(inclinacao / (erro_padrao / math.sqrt(sxx)), gl)
+    return {
+        'n': n,
+        'inclinacao': inclinacao,
+        'intercepto': media_y - inclinacao * media_x,
+        'r': sxy / math.sqrt(sxx * syy) if syy > 0 else math.nan,
+        'p_valor': p_valor,
+        'nivel': nivel,
+        'media_x': media_x,
+        'sxx': sxx,
+        'erro_padrao': erro_padrao,
+        't_critico': quantil_t(0.5 + nivel / 2, gl) if gl > 0 else math.nan,
+    }
+
+def banda_de_confianca(regressao, x):
+    """(ŷ, limite inferior, limite superior) da média prevista em cada x."""
+    x = np.asarray(x, dtype=float)
+    previsto = regressao['intercepto'] + regressao['inclinacao'] * x
+    meia_largura = regressao['t_critico'] * regressao['erro_padrao'] * np.sqrt(
+        1 / regressao['n'] + (x - regressao['media_x']) ** 2 / regressao['sxx']
+    )
+    return previsto, previsto - meia_largura, previsto + meia_largura
+
+# ==============================================================================
+# TESTES DAS TABELAS CRUZADAS
+# ==============================================================================
+
+def p_valor_qui2(estatistica, gl):
+    """P(X >= estatistica) para a qui-quadrado com gl graus de liberdade (NaN sem graus de liberdade)."""
+    estatistica = np.asarray(estatistica, dtype=float)
+    gl = np.asarray(gl)
+    with np.errstate(invalid='ignore'):
+        return np.where((gl > 0) & np.isfinite(estatistica), _scipy_stats().chi2.sf(estatistica, np.maximum(gl, 1)), np.nan)
+
+def testes_das_cruzadas(tabelas):
+    """Qui-quadrado, G, V de Cramér e resíduos de várias tabelas de contagem de uma vez.
+
+    tabelas: chave -> DataFrame de contagens (como as tabelas cruzadas do cubo).
+    As tabelas são empilhadas num único array (completado com zeros) e todas as
+    contas saem de operações sobre ele; linhas e colunas sem respostas não contam
+    nos graus de liberdade. Retorna chave -> dict com n, qui2, g, gl, p_qui2, p_g,
+    v_cramer, fracao_esperados_baixos e residuos (resíduos padronizados ajustados,
+    DataFrame com o formato da tabela).
+    """
+    chaves = list(tabelas)
+    if not chaves:
+        return {}
+    formatos = [tabelas[chave].shape for chave in chaves]
+    observados = np.zeros((len(chaves), max(f[0] for f in formatos), max(f[1] for f in formatos)))
+    for i, chave in enumerate(chaves):
+        linhas, colunas = formatos[i]
+        observados[i, :linhas, :colunas] = tabelas[chave].to_numpy(dtype=float)
+
+    soma_linhas = observados.sum(axis=2, keepdims=True)
+    soma_colunas = observados.sum(axis=1, keepdims=True)
+    n = observados.sum(axis=(1, 2), keepdims=True)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        esperados = soma_linhas * soma_colunas / n
+        com_esperado = esperados > 0
+        qui2 = np.where(com_esperado, (observados - esperados) ** 2 / esperados, 0).sum(axis=(1, 2))
+        g = 2 * np.where(observados > 0, observados * np.log(observados / esperados), 0).sum(axis=(1, 2))
+        residuos = (observados - esperados) / np.sqrt(
+            esperados * (1 - soma_linhas / n) * (1 - soma_colunas / n)
+        )
+        linhas_validas = (soma_linhas[:, :, 0] > 0).sum(axis=1)
+        colunas_validas = (soma_colunas[:, 0, :] > 0).sum(axis=1)
+        gl = np.maximum(linhas_validas - 1, 0) * np.maximum(colunas_validas - 1, 0)
+        menor_lado = np.minimum(linhas_validas, colunas_validas) - 1
+        v_cramer = np.sqrt(qui2 / (n[:, 0, 0] * menor_lado))
+        baixos = (com_esperado & (esperados < ESPERADO_MINIMO)).sum(axis=(1, 2))
+        esperados_baixos = baixos / com_esperado.sum(axis=(1, 2))
+    p_qui2, p_g = p_valor_qui2(qui2, gl), p_valor_qui2(g, gl)
+
+    resultados = {}
+    for i, chave in enumerate(chaves):
+        tabela = tabelas[chave]
+        linhas, colunas = formatos[i]
+        graus = int(gl[i])
+        resultados[chave] = {
+            'n': float(n[i, 0, 0]),
+            'qui2': float(qui2[i]),
+            'g': float(g[i]),
+            'gl': graus,
+            'p_qui2': float(p_qui2[i]),
+            'p_g': float(p_g[i]),
+            'v_cramer': float(v_cramer[i]) if graus else math.nan,
+            'fracao_esperados_baixos': float(esperados_baixos[i]) if graus else math.nan,
+            'residuos': pd.DataFrame(residuos[i, :linhas, :colunas], index=tabela.index, columns=tabela.columns),
+        }
+    return resultados
+
+# ==============================================================================
+# INTERVALOS BOOTSTRAP DOS PERCENTUAIS
+# ==============================================================================
+
+def _intervalo_da_tabela(contagens, reamostras, nivel, semente):
+    """(inferior, superior), em %, dos percentuais por linha de uma tabela de contagens.
+
+    Cada reamostra sorteia, para cada linha, uma multinomial com o total e as
+    proporções observadas da linha: o mesmo que reamostrar as respostas, sem
+    passar por elas. Linhas sem respostas ficam NaN.
+    """
+    contagens = np.asarray(contagens, dtype=np.int64)
+    totais = contagens.sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        proporcoes = np.where(totais[:, None] > 0, contagens / np.maximum(totais, 1)[:, None], 0.0)
+        rng = np.random.default_rng(semente)
+        sorteios = rng.multinomial(totais, proporcoes, size=(reamostras, len(totais)))
+        percentuais = sorteios / totais[None, :, None] * 100
+    alfa = 1 - nivel
+    inferior, superior = np.quantile(percentuais, [alfa / 2, 1 - alfa / 2], axis=0)
+    return inferior, superior
+
+def intervalos_bootstrap(tabelas, reamostras=REAMOSTRAS_BOOTSTRAP, nivel=NIVEL_CONFIANCA, semente=0,
+                         executor=None):
+    """Intervalos bootstrap dos percentuais por linha de várias tabelas de contagem.
+
+    tabelas: chave -> DataFrame de contagens. Retorna chave -> (inferior, superior),
+    DataFrames em % com o formato da tabela. Com um executor (ex.: ProcessPoolExecutor)
+    e trabalho acima de SORTEIOS_PARA_PARALELIZAR, as tabelas são distribuídas entre
+    os processos; cada tabela tem a sua semente, então o resultado é o mesmo.
+    """
+    chaves = list(tabelas)
+    sementes = np.random.SeedSequence(semente).spawn(len(chaves))
+    tarefas = [(tabelas[chave].to_numpy(), reamostras, nivel, s) for chave, s in zip(chaves, sementes)]
+    sorteios = sum(reamostras * tabelas[chave].size for chave in chaves)
+    if executor is not None and len(chaves) > 1 and sorteios >= SORTEIOS_PARA_PARALELIZAR:
+        resultados = list(executor.map(_intervalo_da_tabela, *zip(*tarefas)))
+    else:
+        resultados = [_intervalo_da_tabela(*tarefa) for tarefa in tarefas]
+
+    intervalos = {}
+    for chave, (inferior, superior) in zip(chaves, resultados):
+        tabela = tabelas[chave]
+        intervalos[chave] = (
+            pd.DataFrame(inferior, index=tabela.index, columns=tabela.columns),
+            pd.DataFrame(superior, index=tabela.index, columns=tabela.columns),
+        )
+    return intervalos
@@ -0,0 +1,148 @@
+"""Exporta todos os gráficos do registro como arquivos estáticos (HTML/SVG/PNG).
+
+Roda sem servidor Streamlit e sem internet: os dados vêm dos mesmos loaders do
+app e o HTML usa uma cópia local do plotly.js gravada na pasta de saída.
+
+Uso:
+    python exportar.py --saida graficos_exportados --formatos html,svg,png --processos 4
+
+SVG/PNG usam o kaleido (>= 1), que renderiza num Google Chrome já instalado na
+máquina; sem ele, `plotly_get_chrome` baixa uma cópia para o kaleido usar.
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from medicoes import silenciar_fora_do_app
+
+silenciar_fora_do_app()
+
+from graficos import DATASETS, GRAFICOS, carregar_cubo, construtor_da_figura, grafico_disponivel
+
+FORMATOS = ('html', 'svg', 'png')
+
+# Cubos de contagem recebidos pelo worker na inicialização (um por dataset)
+_cubos_do_worker = {}
+
+def _iniciar_worker(cubos):
+    _cubos_do_worker.update(cubos)
+
+def verificar_exportacao_estatica():
+    """Renderiza uma figura vazia para confirmar que o kaleido e o Chrome funcionam.
+
+    Retorna None se der certo ou a mensagem de erro a mostrar.
+    """
+    import plotly.graph_objects as go
+    try:
+        go.Figure().to_image(format='svg')
+    except Exception as e:
+        detalhe = str(e).strip().splitlines()[0] if str(e).strip() else type(e).__name__
+        return (f"SVG/PNG não podem ser gerados: {detalhe}\n"
+                "O kaleido (>= 1) precisa do Google Chrome; instale-o ou rode `plotly_get_chrome`.")
+    return None
+
+def exportar_grafico(id_grafico, formatos, pasta_saida):
+    """Monta a figura de um gráfico e grava um arquivo por formato.
+
+    Retorna (id, arquivos gravados, lista de erros).
+    """
+    grafico = next(g for g in GRAFICOS if g['id'] == id_grafico)
+    cubo = _cubos_do_worker.get(grafico['dataset'])
+    if not grafico_disponivel(grafico, cubo):
+        return id_grafico, [], [grafico['aviso']]
+
+    fig = construtor_da_figura(grafico)(cubo, *grafico.get('args', ()))
+    if fig is None:
+        return id_grafico, [], [grafico.get('aviso_sem_dados', "Não há dados válidos para exibir o gráfico.")]
+
+    arquivos, erros = [], []
+    for formato in formatos:
+        destino = os.path.join(pasta_saida, f"{id_grafico}.{formato}")
+        try:
+            if formato == 'html':
+                # 'directory': o plotly.min.js fica ao lado do HTML, sem depender de CDN
+                fig.write_html(destino, include_plotlyjs='directory', full_html=True)
+            else:
+                # SVG/PNG dependem do kaleido e do Chrome (checados em main)
+                fig.write_image(destino, format=formato)
+        except Exception as e:
+            erros.append(f"{formato}: {str(e).strip().splitlines()[0] if str(e).strip() else type(e).__name__}")
+            continue
+        arquivos.append(destino)
+    return id_grafico, arquivos, erros
+
+def exportar_todos(pasta_saida, formatos=('html',), processos=None, ids=None):
+    """Exporta os gráficos do registro (todos ou só os ids pedidos) em paralelo.
+
+    Os cubos são montados uma vez aqui e enviados a cada worker na inicialização;
+    com processos=1 tudo roda no processo atual.
+    """
+    os.makedirs(pasta_saida, exist_ok=True)
+    selecionados = [g for g in GRAFICOS if ids is None or g['id'] in ids]
+    datasets = {g['dataset'] for g in selecionados}
+
+    cubos = {}
+    for dataset in DATASETS:
+        if dataset not in datasets:
+            continue
+        cubo = carregar_cubo(dataset)
+        if cubo is None:
+            print(f"Aviso: {DATASETS[dataset]['erro']}", file=sys.stderr)
+        cubos[dataset] = cubo
+
+    tarefas = [(g['id'], tuple(formatos), pasta_saida) for g in selecionados]
+    if processos == 1:
+        _iniciar_worker(cubos)
+        return [exportar_grafico(*tarefa) for tarefa in tarefas]
+
+    with ProcessPoolExecutor(max_workers=processos, initializer=_iniciar_worker, initargs=(cubos,)) as pool:
+        futuros = [pool.submit(exportar_grafico, *tarefa) for tarefa in tarefas]
+        return [futuro.result() for futuro in futuros]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Exporta os gráficos do dashboard como arquivos estáticos.")
+    parser.add_argument('--saida', default='graficos_exportados', help="Pasta de destino (padrão: graficos_exportados)")
+    parser.add_argument('--formatos', default='html', help="Formatos separados por vírgula: html, svg, png (padrão: html)")
+    parser.add_argument('--processos', type=int, default=None, help="Número de processos (padrão: um por CPU; 1 = sem paralelismo)")
+    parser.add_argument('--graficos', default=None, help="Ids dos gráficos separados por vírgula (padrão: todos)")
+    args = parser.parse_args(argv)
+
+    formatos = [f.strip().lower() for f in args.formatos.split(',') if f.strip()]
+    invalidos = [f for f in formatos if f not in FORMATOS]
+    if invalidos:
+        parser.error(f"Formato(s) não suportado(s): {', '.join(invalidos)}")
+    ids = {i.strip() for i in args.graficos.split(',')} if args.graficos else None
+    if ids:
+        desconhecidos = ids - {g['id'] for g in GRAFICOS}
+        if desconhecidos:
+            parser.error(f"Gráfico(s) desconhecido(s): {', '.join(sorted(desconhecidos))}")
+
+    # Checa o kaleido/Chrome uma vez, em vez de um erro por arquivo
+    if any(f != 'html' for f in formatos):
+        erro = verificar_exportacao_estatica()
+        if erro:
+            print(erro, file=sys.stderr)
+            return 1
+
+    # Os CSVs têm caminho relativo à pasta do app, como no Streamlit
+    pasta_saida = os.path.abspath(args.saida)
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    inicio = time.perf_counter()
+    resultados = exportar_todos(pasta_saida, formatos, args.processos, ids)
+    total_arquivos = 0
+    falhas = 0
+    for id_grafico, arquivos, erros in resultados:
+        total_arquivos += len(arquivos)
+        for erro in erros:
+            falhas += 1
+            print(f"[{id_grafico}] {erro}", file=sys.stderr)
+
+    print(f"{total_arquivos} arquivo(s) de {len(resultados)} gráfico(s) em {pasta_saida} "
+          f"({time.perf_counter() - inicio:.1f}s)")
+    return 1 if falhas else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,359 @@
+"""Fonte de dados MySQL/MariaDB para as pesquisas (alternativa aos CSVs).
+
+Ativada pela seção [mysql] do .streamlit/secrets.toml; só os datasets listados
+em [mysql.tabelas] são lidos do banco, os demais continuam vindo do CSV:
+
+    [mysql]
+    host = "localhost"
+    port = 3306
+    user = "congresso"
+    password = "..."
+    database = "projeto_congresso"
+    tamanho_pool = 4        # conexões mantidas abertas por processo
+    ttl_segundos = 600      # por quanto tempo um cubo consultado vale
+
+    [mysql.tabelas]
+    survey = "survey_ai"
+    impact = "impact_ai"
+
+As tabelas usam os nomes já renomeados das colunas (COLUNAS_SURVEY/COLUNAS_IMPACT),
+pois o MySQL limita nomes a 64 caracteres. Para criá-las a partir dos CSVs:
+
+    python fonte_mysql.py importar [--datasets survey,impact]
+
+Cada tabela do cubo vira um GROUP BY no servidor: só as combinações distintas de
+respostas e suas contagens trafegam, e a tradução (mapas, ordens) é aplicada a
+esse resultado pequeno com as mesmas funções de preparo dos CSVs. Os filtros
+globais viram um WHERE nesses mesmos GROUP BY.
+
+Os testes contra um servidor de verdade (tests/test_fonte_mysql.py) rodam quando
+MYSQL_TESTE_HOST aponta para um MySQL/MariaDB local (ver o módulo de testes).
+"""
+import argparse
+import hashlib
+import queue
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+import streamlit as st
+import pandas as pd
+
+from dados import COLUNAS_LIKERT_SURVEY, MULTIPLA_ESCOLHA_SURVEY, PREPARO, TRADUCOES_IMPACT, construir_cubo, ler_csv
+from medicoes import medir_etapa, secao_dos_secrets
+
+TTL_PADRAO_SEGUNDOS = 600
+TAMANHO_POOL_PADRAO = 4
+
+# Colunas derivadas no preparo -> coluna da tabela de onde vêm (as demais são a própria coluna)
+ORIGEM_DAS_COLUNAS = {
+    'survey': {
+        'Sentimentos_IA_Desc': 'Sentimentos_IA',
+        'Genero_Desc': 'Genero',
+        'Curso_Desc': 'Curso',
+        **{col_desc: col_orig for col_orig, col_desc in COLUNAS_LIKERT_SURVEY},
+        **{espec['destino']: col_orig for col_orig, espec in MULTIPLA_ESCOLHA_SURVEY.items()},
+    },
+    'impact': {
+        **{espec['destino']: espec['origem'] for espec in TRADUCOES_IMPACT},
+        'Uso_IA_Categoria': 'Uso_IA_Produtos',
+        'Conhecimento_IA_Faixa': 'Conhecimento_IA',
+    },
+}
+
+# Coluna com a contagem de cada combinação no resultado do GROUP BY
+COLUNA_PESO = '_peso'
+
+def usa_mysql(dataset):
+    return dataset in secao_dos_secrets('mysql').get('tabelas', {})
+
+# ==============================================================================
+# POOL DE CONEXÕES
+# ==============================================================================
+
+@st.cache_resource
+def _pool_mysql():
+    """Conexões livres + semáforo limitando quantas ficam abertas ao mesmo tempo."""
+    tamanho = int(secao_dos_secrets('mysql').get('tamanho_pool', TAMANHO_POOL_PADRAO))
+    return {'livres': queue.LifoQueue(), 'vagas': threading.BoundedSemaphore(tamanho)}
+
+def _nova_conexao():
+    # Importado só aqui: sem [mysql] nos secrets a página de gráficos não precisa dele
+    try:
+        import pymysql
+    except ImportError:
+        raise RuntimeError("O pacote PyMySQL não está instalado (pip install PyMySQL).") from None
+    config = secao_dos_secrets('mysql')
+    return pymysql.connect(
+        host=config.get('host', 'localhost'),
+        port=int(config.get('port', 3306)),
+        user=config.get('user'),
+        password=config.get('password', ''),
+        database=config.get('database'),
+        charset='utf8mb4',
+        autocommit=True,
+        connect_timeout=10,
+    )
+
+def _descartar(conexao):
+    try:
+        conexao.close()
+    except Exception:
+        # Conexão já quebrada: close() também pode falhar, e ela sai do pool do mesmo jeito
+        pass
+
+def _conexao_livre(pool):
+    """Conexão livre do pool que ainda responde, ou None (as quebradas são fechadas)."""
+    try:
+        conexao = pool['livres'].get_nowait()
+    except queue.Empty:
+        return None
+    try:
+        conexao.ping(reconnect=True)
+    except Exception:
+        _descartar(conexao)
+        return None
+    return conexao
+
+@contextmanager
+def conexao_mysql():
+    """Empresta uma conexão do pool; ela volta ao pool no fim, ou é descartada se der erro."""
+    pool = _pool_mysql()
+    pool['vagas'].acquire()
+    try:
+        conexao = _conexao_livre(pool) or _nova_conexao()
+        try:
+            yield conexao
+        except BaseException:
+            _descartar(conexao)
+            raise
+        pool['livres'].put(conexao)
+    finally:
+        pool['vagas'].release()
+
+# ==============================================================================
+# CONSULTAS
+# ==============================================================================
+
+def _identificador(nome):
+    return '`' + str(nome).replace('`', '``') + '`'
+
+def _como_texto(valor):
+    # CAST(... AS BINARY) devolve bytes: agrupamos sem a collation da tabela (que
+    # ignoraria maiúsculas e espaços finais) e tratamos tudo como o texto do CSV
+    if isinstance(valor, (bytes, bytearray)):
+        valor = valor.decode('utf-8')
+    return None if valor in ('', None) else valor
+
+def _tipos_como_no_csv(df):
+    """Converte colunas só com números para numérico, como o read_csv faria."""
+    for col in df.columns:
+        if col == COLUNA_PESO:
+            continue
+        try:
+            df[col] = pd.to_numeric(df[col])
+        except (ValueError, TypeError):
+            pass
+    return df
+
+def _executar(sql, condicao=None):
+    """Executa o SELECT com o WHERE de _condicao_dos_filtros (se houver) e devolve as linhas."""
+    texto, parametros = condicao or ('', [])
+    with conexao_mysql() as conexao, conexao.cursor() as cursor:
+        cursor.execute(sql.replace('{where}', texto), parametros or None)
+        return cursor.fetchall()
+
+def consultar_agrupado(tabela, colunas, condicao=None):
+    """SELECT colunas, COUNT(*) ... GROUP BY colunas, como DataFrame com a coluna _peso.
+
+    condicao é o WHERE dos filtros (_condicao_dos_filtros): só as respostas que
+    passam neles entram nas contagens, ainda no servidor.
+    """
+    selecao = ', '.join(f"CAST({_identificador(col)} AS BINARY)" for col in colunas)
+    sql = (f"SELECT {selecao}, COUNT(*) FROM {_identificador(tabela)}{{where}} "
+           f"GROUP BY {', '.join(str(i + 1) for i in range(len(colunas)))}")
+    with medir_etapa('consultar_mysql', tabela=tabela, colunas=len(colunas)) as medida:
+        linhas = _executar(sql, condicao)
+        medida['linhas'] = len(linhas)
+    registros = [[_como_texto(v) for v in linha[:-1]] + [int(linha[-1])] for linha in linhas]
+    return _tipos_como_no_csv(pd.DataFrame(registros, columns=[*colunas, COLUNA_PESO]))
+
+def consultar_colunas(tabela, colunas, condicao=None):
+    """SELECT de algumas colunas, linha a linha (para gráficos que precisam dos dados brutos)."""
+    selecao = ', '.join(f"CAST({_identificador(col)} AS BINARY)" for col in colunas)
+    with medir_etapa('consultar_mysql', tabela=tabela, colunas=len(colunas)) as medida:
+        linhas = _executar(f"SELECT {selecao} FROM {_identificador(tabela)}{{where}}", condicao)
+        medida['linhas'] = len(linhas)
+    registros = [[_como_texto(v) for v in linha] for linha in linhas]
+    return _tipos_como_no_csv(pd.DataFrame(registros, columns=list(colunas)))
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _assinatura_tabela(tabela, versao, janela):
+    """Assinatura da tabela, calculada uma vez por janela de TTL (para todos os filtros).
+
+    Vem dos metadados do information_schema (última alteração, linhas e bytes), sem
+    ler a tabela. Se o servidor não informa a última alteração (InnoDB antigo ou
+    recém-reiniciado), a janela entra na assinatura e os caches valem só por ela.
+    """
+    with conexao_mysql() as conexao, conexao.cursor() as cursor:
+        cursor.execute(
+            "SELECT UPDATE_TIME, TABLE_ROWS, DATA_LENGTH FROM information_schema.TABLES "
+            "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s", (tabela,)
+        )
+        alterada, quantas, tamanho = cursor.fetchone() or (None, None, None)
+    marca = f"{alterada}:{quantas}:{tamanho}" if alterada is not None else f"janela {janela}"
+    config = secao_dos_secrets('mysql')
+    chave = f"mysql:{config.get('host')}/{config.get('database')}.{tabela}:{marca}:{versao}"
+    return hashlib.sha256(chave.encode('utf-8')).hexdigest()[:16]
+
+def _origem(dataset, col):
+    return ORIGEM_DAS_COLUNAS[dataset].get(col, col)
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _textos_gravados(tabela, origem, janela):
+    """Textos distintos de uma coluna da tabela, consultados uma vez por janela de TTL."""
+    linhas = _executar(f"SELECT DISTINCT CAST({_identificador(origem)} AS BINARY) FROM {_identificador(tabela)}")
+    return [texto for texto in (_como_texto(linha[0]) for linha in linhas) if texto is not None]
+
+def _valores_gravados(dataset, tabela, coluna, valores, janela):
+    """Textos gravados na coluna de origem cujo valor preparado (em `coluna`) está em valores.
+
+    Os filtros escolhem valores já traduzidos ('Feminino'); o WHERE precisa dos
+    textos da tabela ('Female', 'female '...). Os textos distintos passam pelo
+    mesmo preparo dos dados, e ficam os que viram algum dos valores escolhidos.
+    """
+    origem = _origem(dataset, coluna)
+    textos = _textos_gravados(tabela, origem, janela)
+    if not textos:
+        return []
+    preparado = PREPARO[dataset]['preparar'](_tipos_como_no_csv(pd.DataFrame({origem: textos})))
+    escolhidos = preparado[coluna].isin(valores).to_numpy()
+    return [texto for texto, escolhido in zip(textos, escolhidos) if escolhido]
+
+def _condicao_dos_filtros(dataset, tabela, filtros, janela):
+    """WHERE (texto, parâmetros) com os filtros ((coluna, valores), ...), ou None sem filtros."""
+    if not filtros:
+        return None
+    condicoes, parametros = [], []
+    for coluna, valores in filtros:
+        gravados = _valores_gravados(dataset, tabela, coluna, valores, janela)
+        if not gravados:
+            return ' WHERE FALSE', []
+        origem = _identificador(_origem(dataset, coluna))
+        condicoes.append(f"CAST({origem} AS BINARY) IN ({', '.join(['%s'] * len(gravados))})")
+        parametros.extend(texto.encode('utf-8') for texto in gravados)
+    return ' WHERE ' + ' AND '.join(condicoes), parametros
+
+def _janela_ttl():
+    """Número da janela de TTL atual: muda a cada ttl_segundos e invalida o cache.
+
+    Lido a cada chamada (e não no decorador) para respeitar mudanças nos secrets.
+    """
+    ttl = float(secao_dos_secrets('mysql').get('ttl_segundos', TTL_PADRAO_SEGUNDOS))
+    return int(time.time() // ttl)
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _cubo_mysql(dataset, contagens, cruzamentos, regressoes, janela, assinatura, filtros=()):
+    """Cubo de contagens calculado no servidor: um GROUP BY por tabela do cubo.
+
+    Com filtros, todos os GROUP BY levam o mesmo WHERE e '_respostas' é o total
+    de respostas que passam neles.
+    """
+    tabela = secao_dos_secrets('mysql')['tabelas'][dataset]
+    preparo = PREPARO[dataset]
+    condicao = _condicao_dos_filtros(dataset, tabela, filtros, janela)
+    cubo = {}
+    for par in regressoes:
+        # Somas de regressão das combinações distintas de (x, y), com as contagens como pesos
+        origens = list(dict.fromkeys(_origem(dataset, col) for col in par))
+        agrupado = preparo['preparar'](consultar_agrupado(tabela, origens, condicao), pesos=COLUNA_PESO)
+        cubo.update(construir_cubo(agrupado, [], [], pesos=COLUNA_PESO, regressoes=[par]))
+    for agregacao in [*contagens, *cruzamentos]:
+        colunas = list(agregacao) if isinstance(agregacao, tuple) else [agregacao]
+        origens = list(dict.fromkeys(_origem(dataset, col) for col in colunas))
+        agrupado = preparo['preparar'](consultar_agrupado(tabela, origens, condicao), pesos=COLUNA_PESO)
+        parcial = construir_cubo(
+            agrupado,
+            [agregacao] if not isinstance(agregacao, tuple) else [],
+            [agregacao] if isinstance(agregacao, tuple) else [],
+            pesos=COLUNA_PESO,
+        )
+        cubo.update(parcial)
+    if filtros:
+        linhas = _executar(f"SELECT COUNT(*) FROM {_identificador(tabela)}{{where}}", condicao)
+        cubo['_respostas'] = int(linhas[0][0])
+        cubo['_filtros'] = filtros
+    cubo['_assinatura'] = assinatura
+    return cubo
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _dataframe_mysql(dataset, colunas, janela, filtros=()):
+    """DataFrame preparado só com as colunas pedidas (e as de origem delas)."""
+    tabela = secao_dos_secrets('mysql')['tabelas'][dataset]
+    origens = list(dict.fromkeys(_origem(dataset, col) for col in colunas))
+    condicao = _condicao_dos_filtros(dataset, tabela, filtros, janela)
+    return PREPARO[dataset]['preparar'](consultar_colunas(tabela, origens, condicao))
+
+def cubo_mysql(dataset, contagens, cruzamentos, regressoes=(), filtros=()):
+    """Cubo do dataset (só das respostas que passam nos filtros ((coluna, valores), ...), se houver)."""
+    janela = _janela_ttl()
+    tabela = secao_dos_secrets('mysql')['tabelas'][dataset]
+    assinatura = _assinatura_tabela(tabela, PREPARO[dataset]['versao'], janela)
+    return _cubo_mysql(dataset, contagens, cruzamentos, tuple(regressoes), janela, assinatura, tuple(filtros))
+
+def dataframe_mysql(dataset, colunas, filtros=()):
+    return _dataframe_mysql(dataset, colunas, _janela_ttl(), tuple(filtros))
+
+# ==============================================================================
+# IMPORTAÇÃO DOS CSVs (para montar um banco local de testes)
+# ==============================================================================
+
+def importar_csv(dataset):
+    """Recria a tabela do dataset com o conteúdo do CSV (texto, nomes de coluna renomeados).
+
+    Retorna (linhas importadas, colunas ignoradas).
+    """
+    tabela = secao_dos_secrets('mysql')['tabelas'][dataset]
+    preparo = PREPARO[dataset]
+    df = ler_csv(preparo['arquivo'], dtype=str).rename(columns=preparo['colunas'])
+    # Perguntas sem nome curto e com mais de 64 caracteres (limite do MySQL) não
+    # são usadas por nenhum gráfico e ficam de fora da tabela
+    ignoradas = [col for col in df.columns if len(col) > 64]
+    df = df.drop(columns=ignoradas)
+
+    colunas = ', '.join(f"{_identificador(col)} TEXT" for col in df.columns)
+    marcadores = ', '.join(['%s'] * len(df.columns))
+    linhas = [[None if pd.isna(v) else v for v in linha] for linha in df.itertuples(index=False)]
+    with conexao_mysql() as conexao, conexao.cursor() as cursor:
+        cursor.execute(f"DROP TABLE IF EXISTS {_identificador(tabela)}")
+        cursor.execute(f"CREATE TABLE {_identificador(tabela)} ({colunas}) CHARACTER SET utf8mb4")
+        cursor.executemany(
+            f"INSERT INTO {_identificador(tabela)} ({', '.join(map(_identificador, df.columns))}) VALUES ({marcadores})",
+            linhas,
+        )
+    return len(linhas), ignoradas
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Ferramentas da fonte de dados MySQL.")
+    sub = parser.add_subparsers(dest='comando', required=True)
+    importar = sub.add_parser('importar', help="Cria as tabelas configuradas a partir dos CSVs")
+    importar.add_argument('--datasets', default=','.join(PREPARO), help="Datasets separados por vírgula")
+    args = parser.parse_args(argv)
+
+    tabelas = secao_dos_secrets('mysql').get('tabelas', {})
+    if not tabelas:
+        parser.error("Configure [mysql] e [mysql.tabelas] em .streamlit/secrets.toml")
+    for dataset in args.datasets.split(','):
+        dataset = dataset.strip()
+        if dataset not in tabelas:
+            print(f"{dataset}: sem tabela em [mysql.tabelas], ignorado", file=sys.stderr)
+            continue
+        linhas, ignoradas = importar_csv(dataset)
+        print(f"{dataset}: {linhas} linha(s) em {tabelas[dataset]}")
+        for col in ignoradas:
+            print(f"  coluna ignorada (nome com mais de 64 caracteres): {col}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
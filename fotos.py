@@ -0,0 +1,62 @@
+"""Miniaturas das fotos das autoras exibidas na página Sobre."""
+from PIL import Image, ImageOps, UnidentifiedImageError, features
+try:
+    # Fotos em HEIC (ex.: a da Mirian, exportada do celular) só abrem no PIL com o pillow-heif
+    from pillow_heif import register_heif_opener
+    register_heif_opener()
+except ImportError:
+    pass
+import base64
+import hashlib
+import os
+import streamlit as st
+from io import BytesIO
+
+# Pasta servida pelo Streamlit como arquivos estáticos (server.enableStaticServing)
+PASTA_ESTATICA = 'static'
+
+# As fotos aparecem com 100px no CSS (.profile-img); geramos 2x para telas de alta densidade
+LADO_MINIATURA_PX = 200
+
+def codificar_miniatura(caminho):
+    """Miniatura quadrada em WebP (ou JPEG progressivo): retorna (bytes, extensão, mime).
+
+    Se o PIL não reconhecer o formato do arquivo, devolve o arquivo original como estava.
+    """
+    try:
+        with Image.open(caminho) as img:
+            img = ImageOps.exif_transpose(img).convert('RGB')
+            img = ImageOps.fit(img, (LADO_MINIATURA_PX, LADO_MINIATURA_PX), Image.Resampling.LANCZOS)
+            buffer = BytesIO()
+            if features.check('webp'):
+                img.save(buffer, format='WEBP', quality=82, method=6)
+                return buffer.getvalue(), 'webp', 'image/webp'
+            img.save(buffer, format='JPEG', quality=85, optimize=True, progressive=True)
+            return buffer.getvalue(), 'jpg', 'image/jpeg'
+    except UnidentifiedImageError:
+        with open(caminho, 'rb') as f:
+            return f.read(), 'jpeg', 'image/jpeg'
+
+@st.cache_resource
+def _foto_src(caminho, modificado_em):
+    """Codifica a foto uma vez por processo e devolve o src para a tag <img>.
+
+    Com o static serving habilitado a miniatura vira um arquivo em static/ (o
+    navegador guarda em cache); sem ele, um data URI pequeno.
+    """
+    conteudo, extensao, mime = codificar_miniatura(caminho)
+    if st.get_option('server.enableStaticServing'):
+        nome = f"{hashlib.sha256(conteudo).hexdigest()[:16]}.{extensao}"
+        destino = os.path.join(PASTA_ESTATICA, nome)
+        if not os.path.exists(destino):
+            os.makedirs(PASTA_ESTATICA, exist_ok=True)
+            temporario = f"{destino}.{os.getpid()}.tmp"
+            with open(temporario, 'wb') as f:
+                f.write(conteudo)
+            os.replace(temporario, destino)
+        return f"app/static/{nome}"
+    return f"data:{mime};base64,{base64.b64encode(conteudo).decode('utf-8')}"
+
+def foto_autora_src(caminho):
+    # A data de modificação entra na chave para regenerar a miniatura se a foto mudar
+    return _foto_src(caminho, os.path.getmtime(caminho))
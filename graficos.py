@@ -0,0 +1,1734 @@
+"""Figuras Plotly dos gráficos e o registro que liga cada gráfico aos seus dados."""
+import hashlib
+import json
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+import numpy as np
+
+from dados import (
+    COLUNA_IDADE, FAIXAS_USO_IA, MODO_COMPACTO, ORDEM_FREQ, ORDEM_LIKERT, PREPARO, abrir_leitura,
+    assinatura_da_leitura, assinatura_dados, chave_regressao, compactar_dados, construir_cubo, construir_indice,
+    contagem_do_cubo, coocorrencia_do_cubo, cruzada_do_cubo, cubo_do_indice, decodificar_multipla_escolha,
+    leitura_em_dia, ler_dados_preparados, ler_respostas_novas, mascara_do_indice, somar_cubos, versao_do_arquivo
+)
+from banco_embarcado import (
+    banco_do_dataset, cubo_do_banco, dataframe_do_banco, motor_configurado, usa_banco_embarcado
+)
+from fonte_mysql import cubo_mysql, dataframe_mysql, usa_mysql
+from ondas import dados_da_onda, versao_da_onda
+from estatisticas import (
+    ALFA, ESPERADO_MINIMO, LIMITE_RESIDUO, NIVEL_CONFIANCA, banda_de_confianca, intervalos_bootstrap,
+    regressao_das_somas, somas_regressao, testes_das_cruzadas
+)
+from medicoes import medir_etapa
+
+# ==============================================================================
+# CACHE DE FIGURAS
+# ==============================================================================
+
+# Memória máxima ocupada pelos JSONs das figuras em cache (compartilhado entre sessões)
+LIMITE_CACHE_FIGURAS_BYTES = 64 * 1024 * 1024
+
+@st.cache_resource
+def _cache_de_figuras():
+    """LRU de figuras serializadas, único por processo e compartilhado por todas as sessões."""
+    return {'figuras': OrderedDict(), 'bytes': 0, 'lock': threading.Lock()}
+
+def _buscar_figura(chave):
+    cache = _cache_de_figuras()
+    with cache['lock']:
+        texto = cache['figuras'].get(chave)
+        if texto is not None:
+            cache['figuras'].move_to_end(chave)
+        return texto
+
+def _guardar_figura(chave, texto):
+    """Guarda o JSON da figura, descartando as menos usadas recentemente acima do limite."""
+    if len(texto) > LIMITE_CACHE_FIGURAS_BYTES:
+        return
+    cache = _cache_de_figuras()
+    with cache['lock']:
+        anterior = cache['figuras'].pop(chave, None)
+        if anterior is not None:
+            cache['bytes'] -= len(anterior)
+        cache['figuras'][chave] = texto
+        cache['bytes'] += len(texto)
+        while cache['bytes'] > LIMITE_CACHE_FIGURAS_BYTES:
+            _, descartado = cache['figuras'].popitem(last=False)
+            cache['bytes'] -= len(descartado)
+
+def figura_em_json(id_grafico, cubo, construir, *args, filtros=()):
+    """JSON da figura de um gráfico, montada com o Plotly só quando não está em cache.
+
+    A chave combina o id do gráfico, a assinatura dos dados do cubo, os filtros
+    ativos, os argumentos extras e o código da função que monta a figura.
+    Retorna None quando construir() não tem dados para montar a figura.
+    """
+    assinatura = cubo.get('_assinatura') if cubo is not None else None
+    chave = (id_grafico, assinatura, tuple(filtros), args, getattr(construir, '__code__', None))
+
+    texto = _buscar_figura(chave) if assinatura is not None else None
+    if texto is None:
+        with medir_etapa('figura', grafico=id_grafico):
+            fig = construir(cubo, *args)
+        if fig is None:
+            return None
+        with medir_etapa('serializar', grafico=id_grafico) as medida:
+            texto = fig.to_json()
+            medida['bytes'] = len(texto)
+        if assinatura is not None:
+            _guardar_figura(chave, texto)
+    return texto
+
+def exibir_figura(id_grafico, cubo, construir, *args, filtros=()):
+    """Exibe a figura (do cache, se possível); retorna False se não houver dados."""
+    texto = figura_em_json(id_grafico, cubo, construir, *args, filtros=filtros)
+    if texto is None:
+        return False
+    with medir_etapa('exibir', grafico=id_grafico):
+        st.plotly_chart(json.loads(texto), use_container_width=True)
+    return True
+
+# ==============================================================================
+# GRÁFICOS DO SURVEY_AI (Notebook 1)
+# ==============================================================================
+
+def figura_conhecimento_ia(cubo):
+    # Contagem de frequência
+    conhecimento_counts = contagem_do_cubo(cubo, 'Conhecimento_IA')
+    
+    # Criar o gráfico de barras com Plotly
+    fig = px.bar(
+        conhecimento_counts,
+        x=conhecimento_counts.index,
+        y=conhecimento_counts.values,
+        labels={'x': 'Nível de Conhecimento (Escala 1-10)', 'y': 'Contagem de Respondentes'},
+        title='Distribuição do Nível de Conhecimento sobre IA',
+        color=conhecimento_counts.values,
+        color_continuous_scale=px.colors.sequential.Viridis
+    )
+    
+    fig.update_layout(
+        template='plotly_dark',
+        xaxis={'tickmode': 'linear'},
+        yaxis={'gridcolor': 'rgba(255,255,255,0.1)'},
+        plot_bgcolor='rgba(0, 0, 0, 0.1)',
+        paper_bgcolor='rgba(0, 4, 40, 0.3)',
+        font=dict(color='white', size=12)
+    )
+    
+    return fig
+
+def figura_sentimentos_ia(cubo):
+    # Contagem de frequência
+    sentimentos_counts = contagem_do_cubo(cubo, 'Sentimentos_IA_Desc').sort_values(ascending=False, kind='stable')
+    
+    # Criar o gráfico de pizza com Plotly
+    fig = px.pie(
+        sentimentos_counts,
+        names=sentimentos_counts.index,
+        values=sentimentos_counts.values,
+        title='Sentimentos Predominantes em Relação à IA',
+        hole=0.3,
+        color_discrete_sequence=px.colors.sequential.RdBu
+    )
+    
+    fig.update_traces(textinfo='percent+label', pull=[0.1, 0, 0, 0])
+    
+    fig.update_layout(
+        template='plotly_dark',
+        plot_bgcolor='rgba(0, 0, 0, 0.1)',
+        paper_bgcolor='rgba(0, 4, 40, 0.3)',
+        font=dict(color='white', size=12)
+    )
+    
+    return fig
+
+def figura_conhecimento_por_genero(cubo):
+    # Tabela cruzada gênero vs nível de conhecimento (já ordenada pelo nível)
+    cross = cruzada_do_cubo(cubo, 'Genero_Desc', 'Conhecimento_IA')
+
+    fig = px.bar(
+        cross,
+        x=cross.index,
+        y=cross.columns,
+        title='Distribuição do Nível de Conhecimento sobre IA por Gênero',
+        labels={
+            'Genero_Desc': 'Gênero',
+            'value': 'Número de Respondentes',
+            'variable': 'Nível de Conhecimento (1-10)'
+        },
+        color_discrete_sequence=px.colors.sequential.Viridis,
+        barmode='group'
+    )
+
+    fig.update_layout(
+        template='plotly_dark',
+        xaxis={'gridcolor': 'rgba(255,255,255,0.1)'},
+        yaxis={'gridcolor': 'rgba(255,255,255,0.1)'},
+        plot_bgcolor='rgba(0, 0, 0, 0.1)',
+        paper_bgcolor='rgba(0, 4, 40, 0.3)',
+        font=dict(color='white', size=12)
+    )
+
+    return fig
+
+def figura_likert_scale(cubo, column, title):
+    # Definir a ordem correta para a escala Likert
+    order = ORDEM_LIKERT
+    
+    # Contagem de frequência
+    counts = cubo[column].reindex(order, fill_value=0)
+    
+    # Criar o gráfico de barras com Plotly
+    fig = px.bar(
+        counts,
+        x=counts.index,
+        y=counts.values,
+        labels={'x': 'Nível de Concordância', 'y': 'Contagem de Respondentes'},
+        title=title,
+        color=counts.values,
+        color_continuous_scale=px.colors.sequential.Plasma
+    )
+    
+    fig.update_layout(
+        template='plotly_dark',
+        xaxis={'categoryorder': 'array', 'categoryarray': order},
+        yaxis={'gridcolor': 'rgba(255,255,255,0.1)'},
+        plot_bgcolor='rgba(0, 0, 0, 0.1)',
+        paper_bgcolor='rgba(0, 4, 40, 0.3)',
+        font=dict(color='white', size=12)
+    )
+    
+    return fig
+
+def figura_conhecimento_vs_sentimento(cubo):
+    # Contar quantas pessoas estão em cada nível de conhecimento por sentimento
+    df_count = cubo[('Sentimentos_IA_Desc', 'Conhecimento_IA')].stack().rename('Quantidade').reset_index()
+    df_count = df_count[df_count['Quantidade'] > 0]
+    
+    # Criar gráfico de linha (estilo sugerido)
+    fig = px.line(
+        df_count,
+        x='Conhecimento_IA',
+        y='Quantidade',
+        color='Sentimentos_IA_Desc',
+        markers=True,  # Adiciona pontos nas linhas
+        title='Quantidade de Respondentes por Nível de Conhecimento e Sentimento',
+        labels={
+            'Conhecimento_IA': 'Nível de Conhecimento (1-10)',
+            'Quantidade': 'Número de Pessoas',
+            'Sentimentos_IA_Desc': 'Sentimento'
+        },
+        color_discrete_sequence=px.colors.qualitative.Set1
+    )
+    
+    fig.update_traces(
+        mode='lines+markers',
+        hovertemplate='<b>%{fullData.name}</b><br>Conhecimento: %{x}<br>Pessoas: %{y}<extra></extra>'
+    )
+    
+    fig.update_layout(
+        template='plotly_dark',
+        yaxis={'gridcolor': 'rgba(255,255,255,0.1)'},
+        plot_bgcolor='rgba(0, 0, 0, 0.1)',
+        paper_bgcolor='rgba(0, 4, 40, 0.3)',
+        font=dict(color='white', size=12),
+        hovermode='x unified'
+    )
+    
+    return fig
+
+# ==============================================================================
+# GRÁFICOS DO IMPACT_AI_V2 (Notebook 2)
+# ==============================================================================
+
+def figura_confianca_ia(cubo):
+    # Contagem de frequência
+    confianca_counts = contagem_do_cubo(cubo, 'Confiança_IA_Desc').sort_values(ascending=False, kind='stable')
+    
+    # Criar o gráfico de barras com Plotly
+    fig = px.bar(
+        confianca_counts,
+        x=confianca_counts.index,
+        y=confianca_counts.values,
+        labels={'x': 'Nível de Confiança', 'y': 'Contagem de Respondentes'},
+        title='Confiança Geral na Inteligência Artificial',
+        color=confianca_counts.values,
+        color_continuous_scale=px.colors.sequential.Sunset
+    )
+    
+    fig.update_layout(
+        template='plotly_dark',
+        yaxis={'gridcolor': 'rgba(255,255,255,0.1)'},
+        plot_bgcolor='rgba(0, 0, 0, 0.1)',
+        paper_bgcolor='rgba(0, 4, 40, 0.3)',
+        font=dict(color='white', size=12)
+    )
+    
+    return fig
+
+def figura_uso_ia_vs_confianca(cubo):
+    # Tabela cruzada (somente respostas válidas nas duas perguntas)
+    cross = cruzada_do_cubo(cubo, 'Confiança_IA_Desc', 'Uso_IA_Categoria')
+
+    if cross.empty:
+        return None
+
+    # Ordem das categorias de uso
+    cross = cross.reindex(columns=FAIXAS_USO_IA, fill_value=0)
+
+    fig = px.bar(
+        cross,
+        x=cross.index,
+        y=cross.columns,
+        title='Distribuição do Uso de Produtos de IA por Nível de Confiança',
+        labels={
+            'Confiança_IA_Desc': 'Nível de Confiança na IA',
+            'value': 'Número de Respondentes',
+            'variable': 'Nível de Uso de Produtos de IA'
+        },
+        color_discrete_sequence=px.colors.sequential.Viridis,
+        barmode='group'
+    )
+
+    fig.update_layout(
+        template='plotly_dark',
+        xaxis={'gridcolor': 'rgba(255,255,255,0.1)'},
+        yaxis={'gridcolor': 'rgba(255,255,255,0.1)'},
+        plot_bgcolor='rgba(0, 0, 0, 0.1)',
+        paper_bgcolor='rgba(0, 4, 40, 0.3)',
+        font=dict(color='white', size=12)
+    )
+
+    return fig
+
+def figura_profissoes_vs_emprego(cubo):
+    # Tabela cruzada em porcentagem por faixa etária
+    cross = cruzada_do_cubo(cubo, COLUNA_IDADE, 'Elimina_Profissões_Desc', normalizar=True)
+
+    fig = px.bar(
+        cross,
+        x=cross.index,
+        y=cross.columns,
+        title='Percepção de Eliminação de Profissões pela IA por Faixa Etária',
+        labels={
+            'index': 'Faixa etária',
+            'value': 'Percentual dentro de cada faixa etária'
+        },
+        color_discrete_sequence=px.colors.sequential.Plasma
+    )
+
+    fig.update_layout(
+        template='plotly_dark',
+        barmode='stack',
+        xaxis={'title': 'Faixa etária'},
+        yaxis={
+            'gridcolor': 'rgba(255,255,255,0.1)',
+            'title': 'Percentual dentro de cada faixa etária'
+        },
+        plot_bgcolor='rgba(0, 0, 0, 0.1)',
+        paper_bgcolor='rgba(0, 4, 40, 0.3)',
+        font=dict(color='white', size=12)
+    )
+
+    return fig
+
+def figura_impacto_por_conhecimento(cubo):
+    # As faixas Baixo/Médio/Alto são calculadas no carregamento (prepare_impact_data)
+    cross = cruzada_do_cubo(cubo, 'Conhecimento_IA_Faixa', 'Impacto_Humanidade_Desc', normalizar=True)
+
+    fig = px.bar(
+        cross,
+        x=cross.index,
+        y=cross.columns,
+        title='Percepção de Impacto da IA na Humanidade por Nível de Conhecimento',
+        labels={
+            'Conhecimento_IA_Faixa': 'Nível de Conhecimento em IA',
+            'value': 'Percentual dentro de cada faixa de conhecimento'
+        },
+        color_discrete_sequence=px.colors.sequential.Sunset
+    )
+
+    fig.update_layout(
+        template='plotly_dark',
+        barmode='stack',
+        yaxis={'gridcolor': 'rgba(255,255,255,0.1)'},
+        plot_bgcolor='rgba(0, 0, 0, 0.1)',
+        paper_bgcolor='rgba(0, 4, 40, 0.3)',
+        font=dict(color='white', size=12)
+    )
+
+    return fig
+
+def figura_curso_vs_substituicao_emprego(cubo):
+    # Tabela cruzada usando a coluna descritiva, na ordem das categorias Likert
+    cross = cruzada_do_cubo(cubo, 'Curso_Desc', 'Substituicao_Emprego_Desc')
+    cross = cross.reindex(columns=ORDEM_LIKERT, fill_value=0)
+
+    fig = px.bar(
+        cross,
+        x=cross.index,
+        y=cross.columns,
+        title='Percepção de Substituição de Empregos pela IA por Curso',
+        labels={
+            'Curso': 'Curso',
+            'value': 'Número de Respondentes',
+            'variable': 'Nível de Concordância'
+        },
+        color_discrete_sequence=px.colors.sequential.Plasma,
+        barmode='group'
+    )
+
+    fig.update_layout(
+        template='plotly_dark',
+        xaxis={'gridcolor': 'rgba(255,255,255,0.1)'},
+        yaxis={'gridcolor': 'rgba(255,255,255,0.1)'},
+        plot_bgcolor='rgba(0, 0, 0, 0.1)',
+        paper_bgcolor='rgba(0, 4, 40, 0.3)',
+        font=dict(color='white', size=12)
+    )
+
+    return fig
+
+# Acima de LIMITE_PONTOS_SVG o scatter de GPA passa a ser desenhado em WebGL, e acima
+# de LIMITE_PONTOS_WEBGL vira um mapa de calor de contagens calculadas no servidor
+# (o tamanho da figura deixa de crescer com o número de respostas)
+LIMITE_PONTOS_SVG = 5_000
+LIMITE_PONTOS_WEBGL = 100_000
+FAIXAS_GPA = 40
+
+def _grade_gpa_conhecimento(x, y, faixas=FAIXAS_GPA):
+    """Contagens por (nível de conhecimento, faixa de GPA), com as bordas das faixas e os níveis."""
+    bordas = np.histogram_bin_edges(x, bins=faixas)
+    faixa = np.clip(np.searchsorted(bordas, x, side='right') - 1, 0, len(bordas) - 2)
+    niveis, nivel = np.unique(y, return_inverse=True)
+    contagens = np.bincount(nivel * (len(bordas) - 1) + faixa, minlength=len(niveis) * (len(bordas) - 1))
+    return bordas, niveis, contagens.reshape(len(niveis), -1)
+
+def _figura_gpa_em_grade(x, y, titulo, rotulos):
+    bordas, niveis, contagens = _grade_gpa_conhecimento(x, y)
+    centros = (bordas[:-1] + bordas[1:]) / 2
+    fig = go.Figure(go.Heatmap(
+        x=centros,
+        y=niveis,
+        z=np.where(contagens > 0, contagens, np.nan),
+        colorscale='Viridis',
+        colorbar=dict(title='Respostas'),
+        hovertemplate='GPA %{x:.2f}<br>Conhecimento %{y}<br>%{z} resposta(s)<extra></extra>',
+        name='Respostas'
+    ))
+    fig.update_layout(title=titulo, xaxis_title=rotulos['GPA'], yaxis_title=rotulos['Conhecimento_IA'])
+    return fig
+
+def figura_gpa_vs_conhecimento(df, somas=None):
+    """Scatter de GPA x conhecimento com a reta de tendência e sua banda de confiança.
+
+    somas são as somas de regressão do cubo (chave_regressao('GPA', 'Conhecimento_IA')),
+    já restritas aos filtros ativos; sem elas, são calculadas a partir de df.
+    """
+    if df is None or 'GPA' not in df.columns or 'Conhecimento_IA' not in df.columns:
+        return None
+
+    # Filtrar valores válidos
+    df_clean = df[df['GPA'].notna() & df['Conhecimento_IA'].notna()].copy()
+    
+    if len(df_clean) == 0:
+        return None
+
+    titulo = 'Relação entre GPA e Nível de Conhecimento sobre IA'
+    rotulos = {
+        'GPA': 'GPA (Grade Point Average)',
+        'Conhecimento_IA': 'Nível de Conhecimento sobre IA (1-10)'
+    }
+    x_vals = df_clean['GPA'].to_numpy(dtype=float)
+    y_vals = df_clean['Conhecimento_IA'].to_numpy(dtype=float)
+
+    if len(df_clean) > LIMITE_PONTOS_WEBGL:
+        # Muitas respostas: só a grade de contagens vai para o navegador
+        fig = _figura_gpa_em_grade(x_vals, y_vals, titulo, rotulos)
+    else:
+        fig = px.scatter(
+            df_clean,
+            x='GPA',
+            y='Conhecimento_IA',
+            title=titulo,
+            labels=rotulos,
+            color='Conhecimento_IA',
+            color_continuous_scale=px.colors.sequential.Viridis,
+            render_mode='webgl' if len(df_clean) > LIMITE_PONTOS_SVG else 'svg'
+        )
+
+    # Reta de tendência das somas acumuladas (sem statsmodels e sem reajustar os pontos)
+    if somas is None:
+        somas = somas_regressao(x_vals, y_vals)
+    regressao = regressao_das_somas(somas)
+    if regressao is not None:
+        line_x = np.linspace(x_vals.min(), x_vals.max(), 100)
+        line_y, inferior, superior = banda_de_confianca(regressao, line_x)
+
+        if np.isfinite(regressao['t_critico']):
+            # Banda de confiança da média prevista: limite superior e inferior preenchido até ele
+            fig.add_trace(go.Scatter(
+                x=line_x, y=superior, mode='lines', line=dict(width=0),
+                hoverinfo='skip', showlegend=False
+            ))
+            fig.add_trace(go.Scatter(
+                x=line_x, y=inferior, mode='lines', line=dict(width=0),
+                fill='tonexty', fillcolor='rgba(0, 153, 255, 0.2)',
+                name=f"IC {regressao['nivel']:.0%} da tendência", hoverinfo='skip'
+            ))
+
+        fig.add_trace(go.Scatter(
+            x=line_x,
+            y=line_y,
+            mode='lines',
+            name=(f"Linha de Tendência (inclinação {regressao['inclinacao']:.2f}, "
+                  f"r = {regressao['r']:.2f}, p = {regressao['p_valor']:.3g})"),
+            line=dict(color='#0099ff', width=2, dash='dash'),
+            showlegend=True
+        ))
+
+    fig.update_layout(
+        template='plotly_dark',
+        xaxis={'gridcolor': 'rgba(255,255,255,0.1)'},
+        yaxis={'gridcolor': 'rgba(255,255,255,0.1)', 'dtick': 1},
+        plot_bgcolor='rgba(0, 0, 0, 0.1)',
+        paper_bgcolor='rgba(0, 4, 40, 0.3)',
+        font=dict(color='white', size=12)
+    )
+
+    return fig
+
+def figura_fontes_ia(cubo):
+    # Quantas pessoas marcaram cada fonte: a diagonal da coocorrência das combinações
+    coocorrencia = coocorrencia_do_cubo(cubo, 'Fontes_IA_Combinacao')
+    fontes_counts = dict(zip(coocorrencia.index, np.diag(coocorrencia.to_numpy()).tolist()))
+
+    if len(fontes_counts) == 0:
+        return None
+
+    # Criar DataFrame para o gráfico
+    df_fontes = pd.DataFrame({
+        'Fonte': list(fontes_counts.keys()),
+        'Quantidade': list(fontes_counts.values())
+    }).sort_values('Quantidade', ascending=False)
+
+    # Criar gráfico de barras
+    fig = px.bar(
+        df_fontes,
+        x='Fonte',
+        y='Quantidade',
+        title='Fontes de Informação sobre IA Utilizadas pelos Respondentes',
+        labels={
+            'Fonte': 'Fonte de Informação',
+            'Quantidade': 'Número de Respondentes'
+        },
+        color='Quantidade',
+        color_continuous_scale=px.colors.sequential.Plasma
+    )
+
+    fig.update_layout(
+        template='plotly_dark',
+        xaxis={'gridcolor': 'rgba(255,255,255,0.1)', 'tickangle': -45},
+        yaxis={'gridcolor': 'rgba(255,255,255,0.1)'},
+        plot_bgcolor='rgba(0, 0, 0, 0.1)',
+        paper_bgcolor='rgba(0, 4, 40, 0.3)',
+        font=dict(color='white', size=12),
+        showlegend=False
+    )
+
+    return fig
+
+# Combinações mais frequentes mostradas no gráfico UpSet (as demais ficam de fora)
+MAX_COMBINACOES_UPSET = 15
+
+def figura_combinacoes(cubo, coluna, titulo):
+    """Gráfico UpSet das combinações de itens de uma pergunta de múltipla escolha.
+
+    Em cima, quantas respostas escolheram exatamente cada combinação; embaixo, os
+    itens de cada combinação (pontos ligados), com o total de cada item no eixo.
+    """
+    combinacoes = contagem_do_cubo(cubo, coluna).sort_values(ascending=False, kind='stable')
+    if combinacoes.empty:
+        return None
+    total = int(combinacoes.sum())
+    coocorrencia = coocorrencia_do_cubo(cubo, coluna)
+    itens = list(coocorrencia.index)
+    totais_itens = np.diag(coocorrencia.to_numpy())
+    combinacoes = combinacoes.head(MAX_COMBINACOES_UPSET)
+    matriz, itens_combinacoes = decodificar_multipla_escolha(
+        pd.Series(combinacoes.index.astype(str)), ordem=itens
+    )
+    presentes = matriz.toarray().astype(bool)
+    # As combinações mostradas podem não ter todos os itens: alinhamos às colunas da coocorrência
+    presentes = pd.DataFrame(presentes, columns=itens_combinacoes).reindex(columns=itens, fill_value=False).to_numpy()
+
+    posicoes = np.arange(len(combinacoes))
+    fig = make_subplots(rows=2, cols=1, shared_xaxes=True, row_heights=[0.6, 0.4], vertical_spacing=0.03)
+    fig.add_trace(go.Bar(
+        x=posicoes, y=combinacoes.to_numpy(), text=combinacoes.to_numpy(), textposition='outside',
+        customdata=np.column_stack([combinacoes.index.astype(str).str.replace(';', ' + '),
+                                    combinacoes.to_numpy() / total * 100]),
+        hovertemplate="%{customdata[0]}<br>%{y} respondentes (%{customdata[1]:.1f}%)<extra></extra>",
+        marker_color='#00d4ff', showlegend=False
+    ), row=1, col=1)
+
+    colunas, linhas = np.nonzero(presentes)
+    ausentes_x, ausentes_y = np.nonzero(~presentes)
+    fig.add_trace(go.Scatter(
+        x=ausentes_x, y=ausentes_y, mode='markers', marker=dict(size=11, color='rgba(255,255,255,0.15)'),
+        hoverinfo='skip', showlegend=False
+    ), row=2, col=1)
+    # Um segmento por combinação, do primeiro ao último item marcado (None separa os segmentos)
+    ligacoes_x, ligacoes_y = [], []
+    for posicao in posicoes:
+        marcados = linhas[colunas == posicao]
+        if len(marcados) > 1:
+            ligacoes_x += [posicao, posicao, None]
+            ligacoes_y += [marcados.min(), marcados.max(), None]
+    fig.add_trace(go.Scatter(
+        x=ligacoes_x, y=ligacoes_y, mode='lines', line=dict(color='#00d4ff', width=3),
+        hoverinfo='skip', showlegend=False
+    ), row=2, col=1)
+    fig.add_trace(go.Scatter(
+        x=colunas, y=linhas, mode='markers', marker=dict(size=11, color='#00d4ff'),
+        hoverinfo='skip', showlegend=False
+    ), row=2, col=1)
+
+    fig.update_layout(
+        title=titulo,
+        template='plotly_dark',
+        height=600,
+        plot_bgcolor='rgba(0, 0, 0, 0.1)',
+        paper_bgcolor='rgba(0, 4, 40, 0.3)',
+        font=dict(color='white', size=12)
+    )
+    fig.update_xaxes(showticklabels=False, showgrid=False, zeroline=False, range=[-0.6, len(posicoes) - 0.4])
+    fig.update_yaxes(title_text='Respondentes (combinação exata)', gridcolor='rgba(255,255,255,0.1)', row=1, col=1)
+    fig.update_yaxes(
+        tickvals=list(range(len(itens))), ticktext=[f"{item} ({n})" for item, n in zip(itens, totais_itens)],
+        autorange='reversed', showgrid=False, zeroline=False, row=2, col=1
+    )
+
+    return fig
+
+def figura_coocorrencia(cubo, coluna, titulo):
+    """Mapa de calor de quantos respondentes marcaram cada par de itens (na diagonal, o total do item)."""
+    coocorrencia = coocorrencia_do_cubo(cubo, coluna)
+    if coocorrencia.empty:
+        return None
+    itens = list(coocorrencia.index)
+
+    fig = go.Figure(go.Heatmap(
+        z=coocorrencia.to_numpy(), x=itens, y=itens, text=coocorrencia.to_numpy(), texttemplate='%{text}',
+        colorscale='Viridis', colorbar=dict(title='Respondentes'),
+        hovertemplate="%{y} e %{x}: %{z} respondentes<extra></extra>"
+    ))
+
+    fig.update_layout(
+        title=titulo,
+        template='plotly_dark',
+        xaxis={'tickangle': -45},
+        yaxis={'autorange': 'reversed'},
+        plot_bgcolor='rgba(0, 0, 0, 0.1)',
+        paper_bgcolor='rgba(0, 4, 40, 0.3)',
+        font=dict(color='white', size=12)
+    )
+
+    return fig
+
+def figura_limites_eticos_vs_ia_consciente(cubo):
+    cross = cruzada_do_cubo(cubo, 'Limites_Éticos_Desc', 'IA_Consciente_Desc', normalizar=True)
+
+    fig = px.bar(
+        cross,
+        x=cross.index,
+        y=cross.columns,
+        title='Crença em Limites Éticos para IA vs Crença em IA Consciente',
+        labels={
+            'Limites_Éticos_Desc': 'Posição sobre Limites Éticos',
+            'value': 'Percentual dentro de cada posição sobre limites éticos',
+            'variable': 'Crença em IA Consciente'
+        },
+        color_discrete_sequence=px.colors.sequential.Mint
+    )
+
+    fig.update_layout(
+        template='plotly_dark',
+        barmode='stack',
+        xaxis={'categoryorder': 'array', 'categoryarray': ['Discordo Fortemente', 'Discordo', 'Neutro', 'Concordo', 'Concordo Fortemente']},
+        yaxis={'gridcolor': 'rgba(255,255,255,0.1)'},
+        plot_bgcolor='rgba(0, 0, 0, 0.1)',
+        paper_bgcolor='rgba(0, 4, 40, 0.3)',
+        font=dict(color='white', size=12)
+    )
+
+    return fig
+
+def figura_educacao_vs_confianca(cubo):
+    cross = cruzada_do_cubo(cubo, 'Nivel_Educacao_Desc', 'Confiança_IA_Desc', normalizar=True)
+
+    fig = px.bar(
+        cross,
+        x=cross.index,
+        y=cross.columns,
+        title='Confiança em IA por Nível de Educação',
+        labels={
+            'Nivel_Educacao_Desc': 'Nível de Educação',
+            'value': 'Percentual dentro de cada nível de educação',
+            'variable': 'Nível de Confiança'
+        },
+        color_discrete_sequence=px.colors.sequential.Sunset
+    )
+
+    fig.update_layout(
+        template='plotly_dark',
+        barmode='stack',
+        yaxis={'gridcolor': 'rgba(255,255,255,0.1)'},
+        plot_bgcolor='rgba(0, 0, 0, 0.1)',
+        paper_bgcolor='rgba(0, 4, 40, 0.3)',
+        font=dict(color='white', size=12)
+    )
+
+    return fig
+
+def figura_status_emprego_vs_risco(cubo):
+    cross = cruzada_do_cubo(cubo, 'Status_Emprego_Desc', 'Afeta_Emprego_Pessoal_Desc', normalizar=True)
+
+    fig = px.bar(
+        cross,
+        x=cross.index,
+        y=cross.columns,
+        title='Percepção de Risco ao Próprio Emprego por Status de Emprego',
+        labels={
+            'Status_Emprego_Desc': 'Status de Emprego',
+            'value': 'Percentual dentro de cada status de emprego',
+            'variable': 'Percepção de Risco'
+        },
+        color_discrete_sequence=px.colors.sequential.Plasma
+    )
+
+    fig.update_layout(
+        template='plotly_dark',
+        barmode='stack',
+        yaxis={'gridcolor': 'rgba(255,255,255,0.1)'},
+        plot_bgcolor='rgba(0, 0, 0, 0.1)',
+        paper_bgcolor='rgba(0, 4, 40, 0.3)',
+        font=dict(color='white', size=12)
+    )
+
+    return fig
+
+# Profissões com menos respondentes ficam fora do gráfico 17 (e do seu teste)
+MINIMO_POR_PROFISSAO = 3
+
+def cruzada_profissoes_frequentes(cubo):
+    """Profissão vs risco ao próprio emprego, só com as profissões de pelo menos
+    MINIMO_POR_PROFISSAO respondentes (mais respondentes primeiro)."""
+    # Apenas profissões informadas (valores vazios já viram NA no carregamento)
+    profissao_counts = contagem_do_cubo(cubo, 'Profissao_Desc').sort_values(ascending=False, kind='stable')
+    profissoes_frequentes = profissao_counts[profissao_counts >= MINIMO_POR_PROFISSAO].index
+    cross = cubo[('Profissao_Desc', 'Afeta_Emprego_Pessoal_Desc')].loc[profissoes_frequentes]
+    return cross.loc[:, cross.sum(axis=0) > 0]
+
+def figura_profissao_vs_risco_emprego(cubo):
+    # Tabela cruzada usando a coluna traduzida, ordenada por frequência (mais respondentes primeiro)
+    cross = cruzada_profissoes_frequentes(cubo)
+
+    if cross.empty:
+        return None
+
+    cross = (cross.div(cross.sum(axis=1), axis=0) * 100).round(1)
+
+    fig = px.bar(
+        cross,
+        x=cross.index,
+        y=cross.columns,
+        title='Percepção de Risco ao Próprio Emprego por Profissão',
+        labels={
+            'Profissao': 'Profissão',
+            'value': 'Percentual dentro de cada profissão',
+            'variable': 'Percepção de Risco'
+        },
+        color_discrete_sequence=px.colors.sequential.Plasma
+    )
+
+    fig.update_layout(
+        template='plotly_dark',
+        barmode='stack',
+        xaxis={'gridcolor': 'rgba(255,255,255,0.1)', 'tickangle': -45},
+        yaxis={'gridcolor': 'rgba(255,255,255,0.1)'},
+        plot_bgcolor='rgba(0, 0, 0, 0.1)',
+        paper_bgcolor='rgba(0, 4, 40, 0.3)',
+        font=dict(color='white', size=12),
+        height=500
+    )
+
+    return fig
+
+def figura_dispositivos_vs_uso_ia(cubo):
+    # Tabela cruzada (somente respostas válidas nas duas perguntas)
+    cross = cruzada_do_cubo(cubo, 'Frequencia_Dispositivos_Desc', 'Uso_IA_Categoria', normalizar=True)
+    
+    if cross.empty:
+        return None
+
+    # Ordem das frequências de dispositivos
+    ordem_freq = [f for f in ORDEM_FREQ if f in cross.index]
+    cross = cross.reindex(ordem_freq)
+
+    fig = px.bar(
+        cross,
+        x=cross.index,
+        y=cross.columns,
+        title='Distribuição do Uso de Produtos de IA por Frequência de Uso de Dispositivos Tecnológicos',
+        labels={
+            'Frequencia_Dispositivos_Desc': 'Frequência de Uso de Dispositivos Tecnológicos',
+            'value': 'Percentual dentro de cada frequência de uso',
+            'variable': 'Nível de Uso de Produtos de IA'
+        },
+        color_discrete_sequence=px.colors.sequential.Viridis
+    )
+
+    fig.update_layout(
+        template='plotly_dark',
+        barmode='stack',
+        xaxis={'gridcolor': 'rgba(255,255,255,0.1)', 'tickangle': -45},
+        yaxis={'gridcolor': 'rgba(255,255,255,0.1)'},
+        plot_bgcolor='rgba(0, 0, 0, 0.1)',
+        paper_bgcolor='rgba(0, 4, 40, 0.3)',
+        font=dict(color='white', size=12),
+        height=500
+    )
+
+    return fig
+
+def figura_impacto_humanidade(cubo):
+    # Contagem de frequência
+    impacto_counts = contagem_do_cubo(cubo, 'Impacto_Humanidade_Desc').sort_values(ascending=False, kind='stable')
+    
+    # Criar o gráfico de pizza com Plotly
+    fig = px.pie(
+        impacto_counts,
+        names=impacto_counts.index,
+        values=impacto_counts.values,
+        title='Percepção do Impacto da IA na Humanidade',
+        hole=0.4,
+        color_discrete_sequence=px.colors.sequential.Agsunset
+    )
+    
+    fig.update_traces(textinfo='percent+label', pull=[0.1, 0, 0, 0])
+    
+    fig.update_layout(
+        template='plotly_dark',
+        plot_bgcolor='rgba(0, 0, 0, 0.1)',
+        paper_bgcolor='rgba(0, 4, 40, 0.3)',
+        font=dict(color='white', size=12)
+    )
+    
+    return fig
+
+def figura_limites_eticos(cubo):
+    # Definir a ordem correta para a escala Likert
+    # Usamos "Neutro" para manter consistência com o restante dos gráficos.
+    order = ORDEM_LIKERT
+    
+    # Contagem de frequência
+    counts = cubo['Limites_Éticos_Desc'].reindex(order, fill_value=0)
+    
+    # Criar o gráfico de barras com Plotly
+    fig = px.bar(
+        counts,
+        x=counts.index,
+        y=counts.values,
+        labels={'x': 'Nível de Concordância', 'y': 'Contagem de Respondentes'},
+        title='A IA deve ser limitada por regras éticas?',
+        color=counts.values,
+        color_continuous_scale=px.colors.sequential.Mint
+    )
+    
+    fig.update_layout(
+        template='plotly_dark',
+        xaxis={'categoryorder': 'array', 'categoryarray': order},
+        yaxis={'gridcolor': 'rgba(255,255,255,0.1)'},
+        plot_bgcolor='rgba(0, 0, 0, 0.1)',
+        paper_bgcolor='rgba(0, 4, 40, 0.3)',
+        font=dict(color='white', size=12)
+    )
+    
+    return fig
+
+# ==============================================================================
+# REGISTRO DE GRÁFICOS
+# ==============================================================================
+
+# Datasets disponíveis na página de gráficos (na ordem das abas)
+# (arquivo, carregar, preparar, versao... vêm de dados.PREPARO)
+DATASETS = {
+    'survey': {
+        **PREPARO['survey'],
+        'aba': "Pesquisa Acadêmica (Survey_AI)",
+        'cabecalho': "## Resultados da Pesquisa Acadêmica (Survey_AI)",
+        'erro': "Não foi possível carregar os dados da Pesquisa Acadêmica. Verifique o arquivo 'Survey_AI.csv'.",
+    },
+    'impact': {
+        **PREPARO['impact'],
+        'aba': "Impacto Geral (Impact_AI_v2)",
+        'cabecalho': "## Resultados da Pesquisa de Impacto Geral (Impact_AI_v2)",
+        'erro': "Não foi possível carregar os dados da Pesquisa de Impacto Geral. Verifique o arquivo 'Impact_AI_v2.csv'.",
+    },
+}
+
+# Fonte única dos gráficos: a página, o cubo de contagens, o aquecimento do
+# cache de figuras e a poda de colunas são todos derivados desta lista.
+#   dataset:         chave em DATASETS
+#   titulo:          rótulo do gráfico na página
+#   figura:          função que monta a figura Plotly (recebe o cubo e args)
+#   args:            argumentos extras para a função da figura
+#   contagens:       contagens simples que precisam existir no cubo
+#   cruzamentos:     tabelas cruzadas que precisam existir no cubo
+#   opcionais:       contagens usadas se existirem (não bloqueiam o gráfico)
+#   colunas:         colunas lidas direto do DataFrame (gráficos com usa_dataframe)
+#   usa_dataframe:   a figura recebe o DataFrame completo em vez do cubo
+#   regressao:       par (x, y) com somas de regressão no cubo, passadas à figura como `somas`
+#   intervalos:      a figura mostra percentuais por linha do 1º cruzamento; cada barra
+#                    ganha no hover o intervalo bootstrap do seu percentual
+#   tabela:          função cubo -> contagens que a figura mostra, quando ela mostra só
+#                    parte do 1º cruzamento; o teste e os intervalos usam essa tabela
+#   aviso:           mensagem quando faltam dados no cubo
+#   aviso_sem_dados: mensagem quando a figura não tem o que mostrar
+GRAFICOS = [
+    # ------------------------- Survey_AI -------------------------
+    {'id': 'conhecimento_ia', 'dataset': 'survey',
+     'titulo': "1. Distribuição do Nível de Conhecimento sobre IA (Q1)",
+     'figura': figura_conhecimento_ia, 'contagens': ['Conhecimento_IA'],
+     'aviso': "Dados para 'Conhecimento_IA' não disponíveis."},
+    {'id': 'sentimentos_ia', 'dataset': 'survey',
+     'titulo': "2. Sentimentos em Relação à IA (Q5)",
+     'figura': figura_sentimentos_ia, 'contagens': ['Sentimentos_IA_Desc'],
+     'aviso': "Dados para 'Sentimentos_IA' não disponíveis."},
+    {'id': 'substituicao_emprego', 'dataset': 'survey',
+     'titulo': "3. Percepção sobre Substituição de Empregos pela IA",
+     'figura': figura_likert_scale,
+     'args': ('Substituicao_Emprego_Desc', '3. Percepção sobre Substituição de Empregos pela IA'),
+     'contagens': ['Substituicao_Emprego_Desc'],
+     'aviso': "Dados para '3. Percepção sobre Substituição de Empregos pela IA' não disponíveis."},
+    {'id': 'crescimento_economico', 'dataset': 'survey',
+     'titulo': "4. Percepção sobre Crescimento Econômico pela IA",
+     'figura': figura_likert_scale,
+     'args': ('Crescimento_Economico_Desc', '4. Percepção sobre Crescimento Econômico pela IA'),
+     'contagens': ['Crescimento_Economico_Desc'],
+     'aviso': "Dados para '4. Percepção sobre Crescimento Econômico pela IA' não disponíveis."},
+    {'id': 'conhecimento_por_genero', 'dataset': 'survey',
+     'titulo': "3. Perfil de Conhecimento sobre IA por Gênero",
+     'figura': figura_conhecimento_por_genero, 'cruzamentos': [('Genero_Desc', 'Conhecimento_IA')],
+     'aviso': "Dados para 'Conhecimento_IA' ou 'Gênero' não disponíveis."},
+    {'id': 'conhecimento_vs_sentimento', 'dataset': 'survey',
+     'titulo': "5. Distribuição de Conhecimento por Sentimento",
+     'figura': figura_conhecimento_vs_sentimento, 'cruzamentos': [('Sentimentos_IA_Desc', 'Conhecimento_IA')],
+     'aviso': "Dados para 'Conhecimento_IA' ou 'Sentimentos_IA' não disponíveis."},
+    {'id': 'curso_vs_substituicao_emprego', 'dataset': 'survey',
+     'titulo': "12. Percepção de Substituição de Empregos por Curso",
+     'figura': figura_curso_vs_substituicao_emprego, 'cruzamentos': [('Curso_Desc', 'Substituicao_Emprego_Desc')],
+     'aviso': "Dados para 'Curso' ou 'Substituicao_Emprego' não disponíveis."},
+    {'id': 'gpa_vs_conhecimento', 'dataset': 'survey',
+     'titulo': "13. Relação entre GPA e Conhecimento sobre IA",
+     'figura': figura_gpa_vs_conhecimento, 'usa_dataframe': True, 'colunas': ['GPA', 'Conhecimento_IA'],
+     'regressao': ('GPA', 'Conhecimento_IA'),
+     'aviso': "Dados para 'GPA' ou 'Conhecimento_IA' não disponíveis."},
+    {'id': 'fontes_ia', 'dataset': 'survey',
+     'titulo': "14. Fontes de Informação sobre IA",
+     'figura': figura_fontes_ia, 'contagens': ['Fontes_IA_Combinacao'],
+     'aviso': "Dados não disponíveis.",
+     'aviso_sem_dados': "Dados de fontes de informação sobre IA não disponíveis."},
+    {'id': 'fontes_ia_combinacoes', 'dataset': 'survey',
+     'titulo': "15. Combinações de Fontes de Informação sobre IA",
+     'figura': figura_combinacoes,
+     'args': ('Fontes_IA_Combinacao', 'Combinações de Fontes de Informação sobre IA Mais Frequentes'),
+     'contagens': ['Fontes_IA_Combinacao'],
+     'aviso': "Dados de fontes de informação sobre IA não disponíveis."},
+    {'id': 'fontes_ia_coocorrencia', 'dataset': 'survey',
+     'titulo': "16. Fontes de Informação sobre IA Usadas em Conjunto",
+     'figura': figura_coocorrencia,
+     'args': ('Fontes_IA_Combinacao', 'Respondentes que Usam Cada Par de Fontes de Informação sobre IA'),
+     'contagens': ['Fontes_IA_Combinacao'],
+     'aviso': "Dados de fontes de informação sobre IA não disponíveis."},
+    {'id': 'dominios_ia_combinacoes', 'dataset': 'survey',
+     'titulo': "17. Combinações de Áreas de Aplicação da IA",
+     'figura': figura_combinacoes,
+     'args': ('Dominios_IA_Combinacao', 'Combinações de Áreas de Aplicação da IA Mais Frequentes'),
+     'contagens': ['Dominios_IA_Combinacao'],
+     'aviso': "Dados de áreas de aplicação da IA não disponíveis."},
+    {'id': 'dominios_ia_coocorrencia', 'dataset': 'survey',
+     'titulo': "18. Áreas de Aplicação da IA Escolhidas em Conjunto",
+     'figura': figura_coocorrencia,
+     'args': ('Dominios_IA_Combinacao', 'Respondentes que Escolheram Cada Par de Áreas de Aplicação da IA'),
+     'contagens': ['Dominios_IA_Combinacao'],
+     'aviso': "Dados de áreas de aplicação da IA não disponíveis."},
+    # --------------------- Impact_AI_v2 ---------------------
+    {'id': 'confianca_ia', 'dataset': 'impact',
+     'titulo': "6. Confiança Geral na Inteligência Artificial",
+     'figura': figura_confianca_ia, 'contagens': ['Confiança_IA_Desc'],
+     'aviso': "Dados para 'Confiança_IA' não disponíveis."},
+    {'id': 'impacto_humanidade', 'dataset': 'impact',
+     'titulo': "7. Percepção do Impacto da IA na Humanidade",
+     'figura': figura_impacto_humanidade, 'contagens': ['Impacto_Humanidade_Desc'],
+     'aviso': "Dados para 'Impacto_Humanidade' não disponíveis."},
+    {'id': 'ameaca_liberdades', 'dataset': 'impact',
+     'titulo': "9. Ameaça às Liberdades Individuais pela IA",
+     'figura': figura_likert_scale,
+     'args': ('Ameaça_Liberdades_Desc', '9. Ameaça às Liberdades Individuais pela IA'),
+     'contagens': ['Ameaça_Liberdades_Desc'],
+     'aviso': "Dados para '9. Ameaça às Liberdades Individuais pela IA' não disponíveis."},
+    {'id': 'limites_eticos', 'dataset': 'impact',
+     'titulo': "8. Crença na Necessidade de Limites Éticos para a IA",
+     'figura': figura_limites_eticos, 'contagens': ['Limites_Éticos_Desc'],
+     'aviso': "Dados para 'Limites_Éticos' não disponíveis."},
+    {'id': 'uso_ia_vs_confianca', 'dataset': 'impact',
+     'titulo': "9. Uso Ativo de Produtos de IA vs Nível de Confiança",
+     'figura': figura_uso_ia_vs_confianca, 'cruzamentos': [('Confiança_IA_Desc', 'Uso_IA_Categoria')],
+     'aviso': "Dados para 'Confiança_IA' ou 'Uso_IA_Produtos' não disponíveis."},
+    {'id': 'profissoes_vs_emprego', 'dataset': 'impact',
+     'titulo': "10. Idade vs Crença na Eliminação de Profissões pela IA",
+     'figura': figura_profissoes_vs_emprego, 'intervalos': True, 'cruzamentos': [(COLUNA_IDADE, 'Elimina_Profissões_Desc')],
+     'aviso': "Dados para idade ou para eliminação de profissões não disponíveis."},
+    {'id': 'impacto_por_conhecimento', 'dataset': 'impact',
+     'titulo': "11. Impacto da IA na Humanidade por Nível de Conhecimento",
+     'figura': figura_impacto_por_conhecimento, 'intervalos': True, 'cruzamentos': [('Conhecimento_IA_Faixa', 'Impacto_Humanidade_Desc')],
+     'aviso': "Dados para 'Conhecimento_IA' ou 'Impacto_Humanidade' não disponíveis."},
+    {'id': 'limites_eticos_vs_ia_consciente', 'dataset': 'impact',
+     'titulo': "14. Limites Éticos vs Crença em IA Consciente",
+     'figura': figura_limites_eticos_vs_ia_consciente, 'intervalos': True, 'cruzamentos': [('Limites_Éticos_Desc', 'IA_Consciente_Desc')],
+     'aviso': "Dados para 'Limites_Éticos' ou 'IA_Consciente' não disponíveis."},
+    {'id': 'educacao_vs_confianca', 'dataset': 'impact',
+     'titulo': "15. Nível de Educação vs Confiança em IA",
+     'figura': figura_educacao_vs_confianca, 'intervalos': True, 'cruzamentos': [('Nivel_Educacao_Desc', 'Confiança_IA_Desc')],
+     'aviso': "Dados para 'Nível de Educação' ou 'Confiança_IA' não disponíveis."},
+    {'id': 'status_emprego_vs_risco', 'dataset': 'impact',
+     'titulo': "16. Status de Emprego vs Percepção de Risco ao Próprio Emprego",
+     'figura': figura_status_emprego_vs_risco, 'intervalos': True, 'cruzamentos': [('Status_Emprego_Desc', 'Afeta_Emprego_Pessoal_Desc')],
+     'aviso': "Dados para 'Status de Emprego' ou 'Afeta_Emprego_Pessoal' não disponíveis."},
+    {'id': 'profissao_vs_risco_emprego', 'dataset': 'impact',
+     'titulo': "17. Profissão vs Percepção de Risco ao Próprio Emprego",
+     'figura': figura_profissao_vs_risco_emprego, 'tabela': cruzada_profissoes_frequentes, 'intervalos': True,
+     'contagens': ['Profissao_Desc'], 'cruzamentos': [('Profissao_Desc', 'Afeta_Emprego_Pessoal_Desc')],
+     'aviso': "Dados para 'Profissão' ou 'Afeta_Emprego_Pessoal' não disponíveis.",
+     'aviso_sem_dados': "Não há dados de profissão disponíveis para exibir o gráfico."},
+    {'id': 'dispositivos_vs_uso_ia', 'dataset': 'impact',
+     'titulo': "18. Frequência de Uso de Dispositivos Tecnológicos vs Uso de Produtos de IA",
+     'figura': figura_dispositivos_vs_uso_ia, 'intervalos': True, 'cruzamentos': [('Frequencia_Dispositivos_Desc', 'Uso_IA_Categoria')],
+     'aviso': "Dados para 'Frequencia_Dispositivos' ou 'Uso_IA_Produtos' não disponíveis."},
+]
+
+# Filtros globais da página de gráficos (sidebar), aplicados a todos os gráficos de uma vez.
+#   rotulo:   rótulo do filtro na sidebar
+#   colunas:  dataset -> coluna do DataFrame preparado (datasets sem a coluna ignoram o filtro)
+#   formatar: texto de cada opção (opcional; o padrão é o próprio valor)
+FILTROS = {
+    'genero': {'rotulo': "Gênero", 'colunas': {'survey': 'Genero_Desc', 'impact': 'Genero_Desc'}},
+    'idade': {'rotulo': "Faixa etária", 'colunas': {'impact': COLUNA_IDADE}},
+    'educacao': {'rotulo': "Nível de educação", 'colunas': {'impact': 'Nivel_Educacao_Desc'}},
+    'emprego': {'rotulo': "Status de emprego", 'colunas': {'impact': 'Status_Emprego_Desc'}},
+    'ano_estudo': {'rotulo': "Ano de estudo", 'colunas': {'survey': 'Ano_Estudo'},
+                   'formatar': lambda ano: f"{ano}º ano"},
+    'curso': {'rotulo': "Curso", 'colunas': {'survey': 'Curso_Desc'}},
+}
+
+def graficos_do_dataset(dataset):
+    return [grafico for grafico in GRAFICOS if grafico['dataset'] == dataset]
+
+def agregacoes_do_registro(dataset):
+    """Contagens e cruzamentos (sem repetição) que o cubo do dataset precisa ter.
+
+    As colunas dos filtros globais entram como contagens: delas saem as opções da sidebar.
+    """
+    contagens, cruzamentos = [], []
+    for grafico in graficos_do_dataset(dataset):
+        for col in grafico.get('contagens', []) + grafico.get('opcionais', []):
+            if col not in contagens:
+                contagens.append(col)
+        for par in grafico.get('cruzamentos', []):
+            if par not in cruzamentos:
+                cruzamentos.append(par)
+    for col in colunas_de_filtro(dataset):
+        if col not in contagens:
+            contagens.append(col)
+    return contagens, cruzamentos
+
+def regressoes_do_registro(dataset):
+    """Pares (x, y) com somas de regressão no cubo do dataset (ver estatisticas.py)."""
+    regressoes = []
+    for grafico in graficos_do_dataset(dataset):
+        par = grafico.get('regressao')
+        if par is not None and par not in regressoes:
+            regressoes.append(par)
+    return tuple(regressoes)
+
+def colunas_necessarias(dataset):
+    """Colunas do DataFrame preparado que algum gráfico do dataset usa."""
+    contagens, cruzamentos = agregacoes_do_registro(dataset)
+    colunas = set(contagens)
+    for col_a, col_b in [*cruzamentos, *regressoes_do_registro(dataset)]:
+        colunas.update((col_a, col_b))
+    for grafico in graficos_do_dataset(dataset):
+        colunas.update(grafico.get('colunas', []))
+    return colunas
+
+def colunas_de_filtro(dataset):
+    """Colunas do dataset usadas pelos filtros globais (na ordem de FILTROS)."""
+    return [filtro['colunas'][dataset] for filtro in FILTROS.values() if dataset in filtro['colunas']]
+
+def filtros_do_dataset(dataset, filtros):
+    """Filtros ativos ((id, valores), ...) que se aplicam ao dataset, como ((coluna, valores), ...)."""
+    return tuple(
+        (FILTROS[id_filtro]['colunas'][dataset], valores)
+        for id_filtro, valores in filtros
+        if dataset in FILTROS[id_filtro]['colunas']
+    )
+
+def colunas_do_dataframe(dataset):
+    """Colunas que os gráficos com usa_dataframe recebem linha a linha."""
+    colunas = set()
+    for grafico in graficos_do_dataset(dataset):
+        if grafico.get('usa_dataframe'):
+            colunas.update(grafico.get('colunas', []))
+    return sorted(colunas)
+
+def grafico_disponivel(grafico, cubo):
+    if cubo is None:
+        return False
+    exigidas = grafico.get('contagens', []) + grafico.get('cruzamentos', [])
+    return all(agregacao in cubo for agregacao in exigidas)
+
+def construtor_da_figura(grafico, filtros=()):
+    """Função que monta a figura do gráfico a partir do cubo (no formato de exibir_figura).
+
+    filtros são os do dataset do gráfico (ver filtros_do_dataset); só os gráficos
+    com usa_dataframe precisam deles, os demais já recebem o cubo filtrado.
+    Gráficos com cruzamentos ganham o teste de independência da tabela no subtítulo.
+    """
+    if grafico.get('usa_dataframe'):
+        # O DataFrame só é carregado se a figura ainda não estiver no cache
+        if filtros:
+            return lambda cubo, *args: grafico['figura'](
+                _dataframe_filtrado(grafico['dataset'], cubo['_assinatura'], filtros, grafico.get('colunas', [])),
+                *args, **_somas_do_grafico(grafico, cubo)
+            )
+        return lambda cubo, *args: grafico['figura'](
+            carregar_dataframe(grafico['dataset'], grafico.get('colunas', [])), *args,
+            **_somas_do_grafico(grafico, cubo)
+        )
+    if grafico.get('cruzamentos'):
+        return lambda cubo, *args: _anotar_cruzada(grafico, grafico['figura'](cubo, *args), cubo)
+    return grafico['figura']
+
+def _anotar_cruzada(grafico, fig, cubo):
+    if fig is None:
+        return None
+    par = grafico['cruzamentos'][0]
+    if 'tabela' in grafico:
+        teste = testes_das_cruzadas({par: tabela_do_grafico(grafico, cubo)})[par]
+    else:
+        teste = teste_da_cruzada(cubo, par)
+    fig = anotar_teste(fig, teste)
+    if grafico.get('intervalos'):
+        fig = anotar_intervalos(fig, intervalos_do_grafico(grafico, cubo))
+    return fig
+
+def _somas_do_grafico(grafico, cubo):
+    """{'somas': ...} com as somas de regressão do cubo, para gráficos com regressao."""
+    par = grafico.get('regressao')
+    if par is None:
+        return {}
+    return {'somas': cubo.get(chave_regressao(*par)) if cubo is not None else None}
+
+def tabela_do_grafico(grafico, cubo):
+    """Contagens do 1º cruzamento do gráfico, recortadas como na figura (ver 'tabela' no registro)."""
+    if 'tabela' in grafico:
+        return grafico['tabela'](cubo)
+    return cubo[grafico['cruzamentos'][0]]
+
+def testes_do_cubo(cubo):
+    """Testes de independência (estatisticas.testes_das_cruzadas) de todas as tabelas cruzadas do cubo."""
+    tabelas = {chave: tabela for chave, tabela in cubo.items() if isinstance(chave, tuple) and len(chave) == 2}
+    return testes_das_cruzadas(tabelas)
+
+def teste_da_cruzada(cubo, par):
+    """Teste da tabela cruzada `par`: o já calculado para o cubo ou, sem ele, só o dessa tabela."""
+    if cubo is None or par not in cubo:
+        return None
+    testes = cubo.get('_testes')
+    if testes is None or par not in testes:
+        testes = testes_das_cruzadas({par: cubo[par]})
+    return testes[par]
+
+def _formatar_p(p):
+    return "p < 0.001" if p < 0.001 else f"p = {p:.3f}"
+
+def texto_do_teste(teste):
+    """Resumo do teste para o subtítulo: qui-quadrado, G e V de Cramér; na 2ª linha, o maior resíduo."""
+    if teste is None or not teste['gl']:
+        return None
+    significativo = teste['p_qui2'] < ALFA
+    linhas = [
+        f"χ²({teste['gl']}) = {teste['qui2']:.1f}, {_formatar_p(teste['p_qui2'])} · "
+        f"G: {_formatar_p(teste['p_g'])} · V de Cramér = {teste['v_cramer']:.2f} · "
+        + ("associação significativa" if significativo else "sem associação significativa")
+    ]
+    detalhes = []
+    residuos = teste['residuos'].stack()
+    if significativo and residuos.abs().max() >= LIMITE_RESIDUO:
+        linha, coluna = residuos.abs().idxmax()
+        detalhes.append(f"maior resíduo padronizado: {linha} × {coluna} ({residuos[(linha, coluna)]:+.1f})")
+    if teste['fracao_esperados_baixos'] > 0.2:
+        detalhes.append(f"⚠️ {teste['fracao_esperados_baixos']:.0%} das células com esperado < {ESPERADO_MINIMO}")
+    if detalhes:
+        linhas.append(' · '.join(detalhes))
+    return '<br>'.join(linhas)
+
+def anotar_teste(fig, teste):
+    """Põe o resumo do teste de independência no subtítulo da figura."""
+    texto = texto_do_teste(teste)
+    if fig is not None and texto is not None:
+        fig.update_layout(title_subtitle=dict(text=texto, font=dict(size=11)))
+    return fig
+
+# Processos para o bootstrap de muitos gráficos de uma vez (só usados acima de
+# estatisticas.SORTEIOS_PARA_PARALELIZAR e com mais de um núcleo)
+PROCESSOS_BOOTSTRAP = min(4, os.cpu_count() or 1)
+
+@st.cache_resource
+def _pool_de_processos():
+    """Pool de processos do bootstrap, único por processo do app.
+
+    Usa spawn: o servidor do Streamlit tem várias threads e um fork herdaria locks
+    no meio do uso. Os processos só são criados na primeira tarefa enviada.
+    """
+    if PROCESSOS_BOOTSTRAP < 2:
+        return None
+    return ProcessPoolExecutor(max_workers=PROCESSOS_BOOTSTRAP, mp_context=multiprocessing.get_context('spawn'))
+
+def _intervalos_dos_graficos(cubo, dataset):
+    tabelas = {
+        grafico['id']: tabela_do_grafico(grafico, cubo)
+        for grafico in graficos_do_dataset(dataset)
+        if grafico.get('intervalos') and grafico_disponivel(grafico, cubo)
+    }
+    with medir_etapa('bootstrap', dataset=dataset, graficos=len(tabelas)):
+        return intervalos_bootstrap(tabelas, executor=_pool_de_processos())
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _intervalos_em_cache(_cubo, dataset, assinatura, filtros):
+    """Intervalos de todos os gráficos com 'intervalos' do dataset, por id do gráfico."""
+    return _intervalos_dos_graficos(_cubo, dataset)
+
+def intervalos_do_grafico(grafico, cubo):
+    """(inferior, superior) bootstrap dos percentuais do gráfico para esse cubo (e seus filtros).
+
+    Na primeira vez, calcula os de todos os gráficos de percentuais do dataset de uma
+    vez (em paralelo, se forem muitos); o cache fica por (gráfico, dados, filtros).
+    """
+    if cubo is None:
+        return None
+    if cubo.get('_assinatura') is None:
+        intervalos = _intervalos_dos_graficos(cubo, grafico['dataset'])
+    else:
+        intervalos = _intervalos_em_cache(cubo, grafico['dataset'], cubo['_assinatura'], cubo.get('_filtros', ()))
+    return intervalos.get(grafico['id'])
+
+def anotar_intervalos(fig, intervalo):
+    """Acrescenta ao hover de cada barra o intervalo bootstrap do seu percentual."""
+    if fig is None or intervalo is None:
+        return fig
+    inferior, superior = intervalo
+    colunas = {str(col): col for col in inferior.columns}
+    for trace in fig.data:
+        if trace.type != 'bar' or trace.name not in colunas:
+            continue
+        coluna = colunas[trace.name]
+        limites = np.column_stack([
+            inferior[coluna].reindex(list(trace.x)).to_numpy(dtype=float),
+            superior[coluna].reindex(list(trace.x)).to_numpy(dtype=float),
+        ])
+        modelo = (trace.hovertemplate or '').replace('<extra></extra>', '')
+        trace.update(
+            customdata=limites,
+            hovertemplate=(f"{modelo}<br>IC {NIVEL_CONFIANCA:.0%} (bootstrap): "
+                           "%{customdata[0]:.1f}% a %{customdata[1]:.1f}%<extra></extra>")
+        )
+    return fig
+
+def exibir_grafico(grafico, cubo, filtros=()):
+    if not grafico_disponivel(grafico, cubo):
+        st.warning(grafico['aviso'])
+        return
+    exibido = exibir_figura(
+        grafico['id'], cubo, construtor_da_figura(grafico, filtros), *grafico.get('args', ()), filtros=filtros
+    )
+    if not exibido:
+        st.warning(grafico.get('aviso_sem_dados', "Não há dados válidos para exibir o gráfico."))
+
+def _dados_preparados(dataset):
+    info = DATASETS[dataset]
+    # Do Parquet lemos só as colunas que algum gráfico usa; sem cache, o loader completo
+    df = ler_dados_preparados(info['arquivo'], info['versao'], sorted(colunas_necessarias(dataset)))
+    if df is not None:
+        return df
+    # O loader não pode devolver o DataFrame de uma versão anterior do CSV
+    info['carregar'].clear()
+    return info['carregar']()
+
+@st.cache_resource
+def _estado_csv():
+    """Cubo e posição de leitura do CSV de cada dataset, únicos por processo.
+
+    Um lock por dataset: as cargas de datasets diferentes correm em paralelo.
+    """
+    return {'datasets': {}, 'locks': {dataset: threading.Lock() for dataset in DATASETS}}
+
+def _carregar_csv_completo(dataset):
+    """Cubo com todas as linhas do CSV, a posição de leitura e as linhas das colunas usadas."""
+    info = DATASETS[dataset]
+    leitura = abrir_leitura(info['arquivo'])
+    df = _dados_preparados(dataset)
+    if df is None or leitura is None:
+        return None
+    contagens, cruzamentos = agregacoes_do_registro(dataset)
+    with medir_etapa('construir_cubo', dataset=dataset, linhas=len(df)):
+        cubo = construir_cubo(df, contagens, cruzamentos, regressoes=regressoes_do_registro(dataset))
+    cubo['_assinatura'] = assinatura_da_leitura(leitura, info['versao'])
+    # Linha a linha ficam as colunas dos gráficos (usa_dataframe e índice dos filtros)
+    colunas = [col for col in sorted(colunas_necessarias(dataset)) if col in df.columns]
+    return {
+        'cubo': cubo,
+        # Se o CSV mudou durante a carga não dá para saber de onde continuar: recarrega na próxima
+        'leitura': leitura if leitura_em_dia(info['arquivo'], leitura) else None,
+        'linhas': [df[colunas].copy()],
+    }
+
+def _acrescentar_respostas(dataset, estado):
+    """Soma ao estado as respostas acrescentadas ao CSV; False se for preciso recarregar tudo."""
+    info = DATASETS[dataset]
+    if estado['leitura'] is None:
+        return False
+    novas = ler_respostas_novas(info['arquivo'], estado['leitura'])
+    if novas is None:
+        return False
+    df_novas, leitura = novas
+    if len(df_novas):
+        # Preparo e contagens só das linhas novas
+        with medir_etapa('acrescentar_respostas', dataset=dataset, linhas=len(df_novas)):
+            df_novas = info['preparar'](df_novas)
+            contagens, cruzamentos = agregacoes_do_registro(dataset)
+            novo = construir_cubo(df_novas, contagens, cruzamentos, regressoes=regressoes_do_registro(dataset))
+            estado['cubo'] = somar_cubos(estado['cubo'], novo)
+        estado['cubo']['_assinatura'] = assinatura_da_leitura(leitura, info['versao'])
+        colunas = [col for col in sorted(colunas_necessarias(dataset)) if col in df_novas.columns]
+        linhas = df_novas[colunas]
+        estado['linhas'].append(compactar_dados(linhas.copy()) if MODO_COMPACTO else linhas)
+    estado['leitura'] = leitura
+    return True
+
+def _estado_do_csv(dataset):
+    """Estado do CSV do dataset em dia com o arquivo (None se os dados não carregaram).
+
+    Respostas acrescentadas no fim do CSV passam sozinhas pelo preparo e pelo
+    construir_cubo e são somadas ao cubo em memória, sem reler o arquivo todo.
+    O cubo só é refeito do zero na primeira vez ou se o arquivo foi reescrito.
+    """
+    estados = _estado_csv()
+    with estados['locks'][dataset]:
+        estado = estados['datasets'].get(dataset)
+        if estado is None or not _acrescentar_respostas(dataset, estado):
+            estado = _carregar_csv_completo(dataset)
+            if estado is None:
+                estados['datasets'].pop(dataset, None)
+                return None
+            estados['datasets'][dataset] = estado
+        return estado
+
+def _cubo_do_csv(dataset):
+    estado = _estado_do_csv(dataset)
+    return estado['cubo'] if estado is not None else None
+
+def _banco_do_dataset(dataset):
+    """Arquivo do banco embarcado do dataset (criado na primeira vez) e o motor usado."""
+    info = DATASETS[dataset]
+    motor = motor_configurado()
+    caminho = banco_do_dataset(
+        info['arquivo'], info['versao'], sorted(colunas_necessarias(dataset)),
+        lambda: _dados_preparados(dataset), motor
+    )
+    return caminho, motor
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _cubo_do_banco(dataset, versao_arquivo):
+    """Cubo do banco embarcado do dataset.
+
+    versao_arquivo (dados.versao_do_arquivo do CSV) entra na chave do cache: quando
+    o CSV muda, o arquivo do banco, o cubo e a sua assinatura são refeitos.
+    """
+    caminho, motor = _banco_do_dataset(dataset)
+    if caminho is None:
+        return None
+    info = DATASETS[dataset]
+    contagens, cruzamentos = agregacoes_do_registro(dataset)
+    with medir_etapa('consultar_banco', dataset=dataset, motor=motor):
+        cubo = cubo_do_banco(caminho, motor, contagens, cruzamentos, regressoes_do_registro(dataset))
+    cubo['_assinatura'] = assinatura_dados(info['arquivo'], info['versao'])
+    return cubo
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _dataframe_do_banco(dataset, versao_arquivo, colunas):
+    """Colunas do banco embarcado linha a linha, lidas uma vez por versão do CSV."""
+    caminho, motor = _banco_do_dataset(dataset)
+    if caminho is None:
+        return None
+    with medir_etapa('consultar_banco', dataset=dataset, motor=motor, colunas=len(colunas)) as medida:
+        df = dataframe_do_banco(caminho, motor, list(colunas))
+        medida['linhas'] = len(df)
+    return df
+
+@st.cache_resource
+def _cargas_em_andamento():
+    """Threads que carregam os datasets e a carga em andamento de cada um, únicas por processo."""
+    return {
+        'pool': ThreadPoolExecutor(max_workers=len(DATASETS), thread_name_prefix='carga'),
+        'cargas': {},
+        'lock': threading.Lock(),
+    }
+
+def iniciar_cargas(datasets=None):
+    """Dispara carregar_cubo de cada dataset numa thread própria; retorna dataset -> Future.
+
+    As cargas não dependem umas das outras: com o cache frio, a espera de quem
+    precisa de todos os datasets é a do mais lento, não a soma, e quem precisa de
+    um só espera apenas a dele (aguardar_carga). Uma carga ainda em andamento é
+    reaproveitada em vez de disparada de novo. Threads, e não processos, porque o
+    resultado precisa ficar nos caches deste processo.
+    """
+    andamento = _cargas_em_andamento()
+    cargas = {}
+    with andamento['lock']:
+        for dataset in datasets or DATASETS:
+            carga = andamento['cargas'].get(dataset)
+            if carga is None or carga.done():
+                carga = andamento['pool'].submit(carregar_cubo, dataset)
+                andamento['cargas'][dataset] = carga
+            cargas[dataset] = carga
+    return cargas
+
+def aguardar_carga(cargas, dataset):
+    """Espera a carga do dataset terminar (o cubo fica em cache para carregar_cubo).
+
+    Erros da thread são ignorados aqui: a chamada seguinte a carregar_cubo, na
+    sessão, repete a carga e mostra a mensagem na página.
+    """
+    carga = cargas.get(dataset)
+    if carga is None:
+        return
+    with medir_etapa('aguardar_carga', dataset=dataset):
+        try:
+            carga.result()
+        except Exception:
+            pass
+
+def carregar_cubo(dataset):
+    """Cubo de contagens de um dataset, com as agregações declaradas no registro de gráficos.
+
+    Vem do MySQL quando o dataset está configurado em [mysql.tabelas] (agregado no
+    servidor, com TTL), do banco embarcado quando há [embarcado] nos secrets, e do
+    CSV/Parquet nos demais casos. Em '_testes' vão os testes de independência das
+    tabelas cruzadas (testes_do_cubo).
+    """
+    with medir_etapa('carregar_cubo', dataset=dataset):
+        cubo = _cubo_da_fonte(dataset)
+    if cubo is None:
+        return None
+    return dict(cubo, _testes=_testes_em_cache(cubo, dataset, cubo['_assinatura']))
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _testes_em_cache(_cubo, dataset, assinatura, filtros=()):
+    """Testes das tabelas cruzadas do cubo, calculados uma vez por versão dos dados (e filtros)."""
+    with medir_etapa('testes', dataset=dataset):
+        return testes_do_cubo(_cubo)
+
+def _cubo_da_fonte(dataset):
+    if usa_mysql(dataset):
+        contagens, cruzamentos = agregacoes_do_registro(dataset)
+        try:
+            return cubo_mysql(dataset, contagens, cruzamentos, regressoes_do_registro(dataset))
+        except Exception as e:
+            st.error(f"Erro ao consultar o MySQL ({DATASETS[dataset]['aba']}): {e}")
+            return None
+    if usa_banco_embarcado():
+        try:
+            return _cubo_do_banco(dataset, versao_do_arquivo(DATASETS[dataset]['arquivo']))
+        except Exception as e:
+            st.warning(f"Banco embarcado indisponível ({e}); usando os dados do CSV.")
+    return _cubo_do_csv(dataset)
+
+def carregar_dataframe(dataset, colunas):
+    """DataFrame preparado do dataset (para gráficos com usa_dataframe)."""
+    if usa_mysql(dataset):
+        return dataframe_mysql(dataset, list(colunas))
+    if usa_banco_embarcado():
+        try:
+            df = _dataframe_do_banco(dataset, versao_do_arquivo(DATASETS[dataset]['arquivo']), tuple(colunas))
+            if df is not None:
+                return df
+        except Exception as e:
+            st.warning(f"Banco embarcado indisponível ({e}); usando os dados do CSV.")
+    estado = _estado_do_csv(dataset)
+    if estado is None:
+        return None
+    colunas = [col for col in colunas if col in estado['linhas'][0].columns]
+    return pd.concat([linhas[colunas] for linhas in estado['linhas']], ignore_index=True)
+
+# ==============================================================================
+# FILTROS GLOBAIS
+# ==============================================================================
+
+def opcoes_do_filtro(id_filtro):
+    """Valores com respostas, em algum dataset, da coluna do filtro (na ordem das categorias)."""
+    opcoes = []
+    for dataset, coluna in FILTROS[id_filtro]['colunas'].items():
+        cubo = carregar_cubo(dataset)
+        if cubo is None or coluna not in cubo:
+            continue
+        for valor in contagem_do_cubo(cubo, coluna).index:
+            if valor not in opcoes:
+                opcoes.append(valor)
+    return opcoes
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _indice_de_filtros(dataset, assinatura):
+    """Índice (dados.construir_indice) dos dados do dataset com essa assinatura.
+
+    Montado na primeira vez que um filtro é usado; compartilhado por todas as sessões.
+    """
+    colunas = sorted(colunas_necessarias(dataset))
+    with medir_etapa('indice_filtros', dataset=dataset) as medida:
+        df = carregar_dataframe(dataset, colunas)
+        if df is None:
+            return None
+        indice = construir_indice(df, colunas, colunas_de_filtro(dataset), colunas_do_dataframe(dataset))
+        medida['linhas'] = len(df)
+    return indice
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _cubo_filtrado(dataset, assinatura, filtros):
+    indice = _indice_de_filtros(dataset, assinatura)
+    if indice is None:
+        return None
+    contagens, cruzamentos = agregacoes_do_registro(dataset)
+    with medir_etapa('cubo_filtrado', dataset=dataset) as medida:
+        mascara = mascara_do_indice(indice, filtros)
+        cubo = cubo_do_indice(indice, contagens, cruzamentos, mascara, regressoes_do_registro(dataset))
+        cubo['_respostas'] = int(mascara.sum()) if mascara is not None else indice['linhas']
+        medida['linhas'] = cubo['_respostas']
+    cubo['_filtros'] = filtros
+    with medir_etapa('testes', dataset=dataset):
+        cubo['_testes'] = testes_do_cubo(cubo)
+    cubo['_assinatura'] = assinatura
+    return cubo
+
+def carregar_cubo_filtrado(dataset, filtros):
+    """Cubo do dataset só com as respostas que passam nos filtros ativos que se aplicam a ele.
+
+    Sem filtro aplicável é o próprio carregar_cubo. Com filtros, a máscara sai dos
+    bitmaps do índice uma vez por combinação de filtros e todas as tabelas do cubo
+    são contadas com ela; os gráficos recebem esse cubo como recebem o completo.
+    """
+    cubo = carregar_cubo(dataset)
+    filtros = filtros_do_dataset(dataset, filtros)
+    if cubo is None or not filtros:
+        return cubo
+    if usa_mysql(dataset):
+        return _cubo_filtrado_mysql(dataset, filtros)
+    return _cubo_filtrado(dataset, cubo['_assinatura'], filtros)
+
+def _cubo_filtrado_mysql(dataset, filtros):
+    """Cubo filtrado no servidor: os filtros entram como WHERE nos GROUP BY (sem o índice)."""
+    contagens, cruzamentos = agregacoes_do_registro(dataset)
+    try:
+        with medir_etapa('cubo_filtrado', dataset=dataset) as medida:
+            cubo = cubo_mysql(dataset, contagens, cruzamentos, regressoes_do_registro(dataset), filtros)
+            medida['linhas'] = cubo['_respostas']
+    except Exception as e:
+        st.error(f"Erro ao consultar o MySQL ({DATASETS[dataset]['aba']}): {e}")
+        return None
+    return dict(cubo, _testes=_testes_em_cache(cubo, dataset, cubo['_assinatura'], filtros))
+
+def _dataframe_filtrado(dataset, assinatura, filtros, colunas):
+    """Linhas de usa_dataframe que passam nos filtros, com a mesma máscara do cubo filtrado."""
+    if usa_mysql(dataset):
+        return dataframe_mysql(dataset, list(colunas), filtros)
+    indice = _indice_de_filtros(dataset, assinatura)
+    if indice is None:
+        return None
+    mascara = mascara_do_indice(indice, filtros)
+    df = indice['dataframe'][[col for col in colunas if col in indice['dataframe'].columns]]
+    return df if mascara is None else df[mascara].reset_index(drop=True)
+
+# ==============================================================================
+# EVOLUÇÃO ENTRE ONDAS (ver ondas.py)
+# ==============================================================================
+
+def figura_tendencia(tendencias, coluna, titulo):
+    """Percentual de cada resposta de `coluna`, onda a onda, pela data da coleta."""
+    contagens = tendencias.get(('tendencia', coluna))
+    if contagens is None or contagens.empty:
+        return None
+    ondas = tendencias['_ondas'].loc[contagens.index]
+    totais = contagens.sum(axis=1)
+    percentuais = contagens.div(totais.where(totais > 0), axis=0) * 100
+
+    fig = go.Figure()
+    cores = px.colors.qualitative.Set2
+    for i, resposta in enumerate(contagens.columns):
+        fig.add_trace(go.Scatter(
+            x=ondas['coleta'], y=percentuais[resposta], mode='lines+markers', name=str(resposta),
+            line=dict(color=cores[i % len(cores)]),
+            customdata=np.column_stack([contagens.index, contagens[resposta], totais]),
+            hovertemplate=(
+                "Onda %{customdata[0]} (%{x|%d/%m/%Y})<br>%{y:.1f}% "
+                "(%{customdata[1]} de %{customdata[2]})<extra>" + str(resposta) + "</extra>"
+            ),
+        ))
+
+    fig.update_layout(
+        title=titulo,
+        template='plotly_dark',
+        xaxis={'title': 'Data da Coleta', 'gridcolor': 'rgba(255,255,255,0.1)',
+               'tickvals': ondas['coleta'], 'tickformat': '%d/%m/%Y'},
+        yaxis={'title': '% dos Respondentes', 'gridcolor': 'rgba(255,255,255,0.1)', 'rangemode': 'tozero'},
+        legend_title_text='Resposta',
+        plot_bgcolor='rgba(0, 0, 0, 0.1)',
+        paper_bgcolor='rgba(0, 4, 40, 0.3)',
+        font=dict(color='white', size=12)
+    )
+
+    return fig
+
+# Gráficos de evolução entre ondas, um por pergunta acompanhada.
+#   dataset, id, titulo: como em GRAFICOS
+#   coluna:              coluna contada em cada onda
+TENDENCIAS = [
+    {'id': 'tendencia_sentimentos_ia', 'dataset': 'survey', 'coluna': 'Sentimentos_IA_Desc',
+     'titulo': "Sentimentos em Relação à IA ao Longo das Ondas"},
+    {'id': 'tendencia_substituicao_emprego', 'dataset': 'survey', 'coluna': 'Substituicao_Emprego_Desc',
+     'titulo': "Percepção sobre Substituição de Empregos ao Longo das Ondas"},
+    {'id': 'tendencia_confianca_ia', 'dataset': 'impact', 'coluna': 'Confiança_IA_Desc',
+     'titulo': "Confiança na IA ao Longo das Ondas"},
+    {'id': 'tendencia_impacto_humanidade', 'dataset': 'impact', 'coluna': 'Impacto_Humanidade_Desc',
+     'titulo': "Impacto da IA na Humanidade ao Longo das Ondas"},
+    {'id': 'tendencia_afeta_emprego', 'dataset': 'impact', 'coluna': 'Afeta_Emprego_Pessoal_Desc',
+     'titulo': "Percepção de Risco ao Próprio Emprego ao Longo das Ondas"},
+]
+
+def tendencias_do_dataset(dataset):
+    return [tendencia for tendencia in TENDENCIAS if tendencia['dataset'] == dataset]
+
+def colunas_das_tendencias(dataset):
+    return tuple(dict.fromkeys(tendencia['coluna'] for tendencia in tendencias_do_dataset(dataset)))
+
+@st.cache_data(max_entries=256, persist='disk', show_spinner=False)
+def _cubo_da_onda(dataset, onda, versao_arquivo, versao_mapeamentos, colunas):
+    """Contagens das colunas de evolução numa onda, calculadas uma vez por versão do arquivo.
+
+    Ficam gravadas em disco: cadastrar uma onda nova (ou reiniciar o app) não
+    refaz as contagens das ondas que não mudaram.
+    """
+    df = dados_da_onda(dataset, onda, list(colunas))
+    if df is None:
+        return None
+    with medir_etapa('cubo_da_onda', dataset=dataset, onda=onda['id'], linhas=len(df)):
+        cubo = construir_cubo(df, list(colunas), [])
+    cubo['_respostas'] = len(df)
+    return cubo
+
+def _tabela_da_tendencia(cubos, coluna):
+    """Contagens de `coluna` com uma linha por onda e as respostas na ordem em que aparecem."""
+    contagens = {id_onda: cubo[coluna] for id_onda, cubo in cubos.items() if coluna in cubo}
+    if not contagens:
+        return None
+    respostas = list(dict.fromkeys(valor for contagem in contagens.values() for valor in contagem.index))
+    tabela = pd.DataFrame(
+        {id_onda: contagem.reindex(respostas, fill_value=0).to_numpy() for id_onda, contagem in contagens.items()},
+        index=pd.Index(respostas, name=coluna)
+    ).T
+    tabela.index.name = 'onda'
+    return tabela
+
+def carregar_tendencias(dataset, ondas):
+    """Tabelas de evolução das ondas escolhidas (no formato de cubo, para o cache de figuras).
+
+    Só as ondas pedidas são lidas, cada uma do seu cubo em cache. Chaves:
+    ('tendencia', coluna) com uma linha por onda; '_ondas' com a data da coleta e
+    as respostas de cada onda; '_sem_dados' com as ondas que não puderam ser lidas.
+    """
+    colunas = colunas_das_tendencias(dataset)
+    versao_mapeamentos = DATASETS[dataset]['versao']
+    cubos, versoes, sem_dados = {}, [], []
+    for onda in ondas:
+        versao_arquivo = versao_da_onda(onda)
+        cubo = None
+        if versao_arquivo is not None:
+            cubo = _cubo_da_onda(dataset, onda, versao_arquivo, versao_mapeamentos, colunas)
+        if cubo is None:
+            sem_dados.append(onda['id'])
+            continue
+        cubos[onda['id']] = cubo
+        versoes.append((onda['id'], onda['coleta'], versao_arquivo))
+
+    tendencias = {
+        '_assinatura': hashlib.sha256(repr((dataset, versao_mapeamentos, versoes)).encode('utf-8')).hexdigest()[:16],
+        '_ondas': pd.DataFrame(
+            {'coleta': [pd.Timestamp(onda['coleta']) for onda in ondas if onda['id'] in cubos],
+             'respostas': [cubo['_respostas'] for cubo in cubos.values()]},
+            index=pd.Index(list(cubos), name='onda')
+        ),
+        '_sem_dados': sem_dados,
+    }
+    for coluna in colunas:
+        tabela = _tabela_da_tendencia(cubos, coluna)
+        if tabela is not None:
+            tendencias[('tendencia', coluna)] = tabela
+    return tendencias
+
+def exibir_tendencia(tendencia, tendencias):
+    exibido = exibir_figura(tendencia['id'], tendencias, figura_tendencia, tendencia['coluna'], tendencia['titulo'])
+    if not exibido:
+        st.warning("Não há dados desta pergunta nas ondas escolhidas.")
+
+def aquecer_cache_figuras(datasets=None):
+    """Monta as figuras de todos os gráficos registrados e guarda no cache de figuras.
+
+    Assim o primeiro visitante de cada gráfico já encontra a figura pronta.
+    """
+    for dataset in datasets or DATASETS:
+        cubo = carregar_cubo(dataset)
+        for grafico in graficos_do_dataset(dataset):
+            if grafico_disponivel(grafico, cubo):
+                figura_em_json(grafico['id'], cubo, construtor_da_figura(grafico), *grafico.get('args', ()))
+
+@st.cache_resource
+def iniciar_aquecimento_cache():
+    """Dispara o aquecimento uma única vez por processo, em segundo plano.
+
+    A thread roda sem contexto de sessão, então avisos dos loaders não aparecem
+    na página de quem a disparou.
+    """
+    thread = threading.Thread(target=aquecer_cache_figuras, name='aquecimento-figuras', daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,254 @@
+"""Medição das etapas caras do app: leitura, preparo, cubo, figuras e serialização.
+
+Ativada pela seção [medicoes] do .streamlit/secrets.toml:
+
+    [medicoes]
+    arquivo = ".logs/medicoes.jsonl"   # log JSONL rotativo (padrão)
+    tamanho_max_mb = 5                 # tamanho de cada arquivo antes de rodar
+    copias = 3                         # arquivos antigos mantidos (.1, .2, ...)
+    memoria = false                    # pico de memória por etapa (tracemalloc; deixa tudo mais lento)
+
+Sem a seção, medir_etapa() só executa o bloco (e importar() só importa). Com ela, cada etapa vira uma
+linha do log (tempo, linhas processadas, memória e a sessão que a disparou) e
+fica disponível para o painel de desempenho da sidebar. Só carregar_cubo e
+exibir rodam a cada execução; as demais etapas (leitura, preparo, cubo, figura,
+serialização, consultas) só aparecem quando o cache correspondente não ajudou.
+"""
+import importlib
+import json
+import logging
+import logging.handlers
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+
+import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+# O pandas só é importado pelas funções do painel: o app importa este módulo em
+# todas as páginas, inclusive nas que não usam o pandas para nada.
+
+ARQUIVO_LOG_PADRAO = os.path.join('.logs', 'medicoes.jsonl')
+TAMANHO_MAX_MB_PADRAO = 5
+COPIAS_PADRAO = 3
+
+# Quantas medidas recentes o processo guarda para o painel
+MEDIDAS_RECENTES = 2000
+
+# Campos de cada medida que não são detalhes da etapa
+CAMPOS_FIXOS = ('quando', 'inicio', 'etapa', 'segundos', 'linhas', 'memoria_mb', 'sessao', 'thread', 'nivel', 'erro')
+
+def secao_dos_secrets(nome):
+    """Seção [nome] do .streamlit/secrets.toml ({} se não houver secrets ou a seção não existir)."""
+    try:
+        return st.secrets.get(nome, {})
+    except FileNotFoundError:
+        return {}
+
+def silenciar_fora_do_app():
+    """Para os scripts de linha de comando: fora do `streamlit run` os decoradores de
+    cache avisam a cada chamada que não há sessão.
+
+    O nível vai também para a configuração, pois ler os secrets recarrega o nível
+    de log dela. Chamar antes de importar os módulos do app.
+    """
+    import streamlit.config
+    import streamlit.logger
+    streamlit.config.set_option('logger.level', 'error')
+    streamlit.logger.set_log_level('error')
+
+def medicoes_ativas():
+    return bool(secao_dos_secrets('medicoes'))
+
+@st.cache_resource
+def _medidas_recentes():
+    """Últimas medidas do processo, compartilhadas por todas as sessões."""
+    return {'medidas': deque(maxlen=MEDIDAS_RECENTES), 'lock': threading.Lock()}
+
+@st.cache_resource
+def _log_medicoes(arquivo, tamanho_max_mb, copias):
+    """Logger que grava uma medida JSON por linha, trocando de arquivo ao atingir o tamanho."""
+    os.makedirs(os.path.dirname(arquivo) or '.', exist_ok=True)
+    log = logging.getLogger(f"{__name__}.{os.path.abspath(arquivo)}")
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    for handler in list(log.handlers):
+        log.removeHandler(handler)
+        handler.close()
+    handler = logging.handlers.RotatingFileHandler(
+        arquivo, maxBytes=int(tamanho_max_mb * 1024 * 1024), backupCount=int(copias), encoding='utf-8'
+    )
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    log.addHandler(handler)
+    return log
+
+def _registrar(medida, config):
+    recentes = _medidas_recentes()
+    with recentes['lock']:
+        recentes['medidas'].append(medida)
+    try:
+        log = _log_medicoes(
+            config.get('arquivo', ARQUIVO_LOG_PADRAO),
+            float(config.get('tamanho_max_mb', TAMANHO_MAX_MB_PADRAO)),
+            int(config.get('copias', COPIAS_PADRAO)),
+        )
+        log.info(json.dumps(medida, ensure_ascii=False, default=str))
+    except OSError:
+        # Sem permissão de escrita o painel continua funcionando, só sem o arquivo
+        pass
+
+# Pilha das etapas abertas em cada thread (para o pico de memória de etapas aninhadas)
+_local = threading.local()
+
+@contextmanager
+def medir_etapa(etapa, **detalhes):
+    """Mede o bloco como uma etapa; o dict devolvido aceita 'linhas' e outros detalhes.
+
+        with medir_etapa('ler_csv', arquivo=ARQUIVO_SURVEY) as medida:
+            df = pd.read_csv(...)
+            medida['linhas'] = len(df)
+
+    Com memoria = true, 'memoria_mb' é o pico alocado durante a etapa acima do que
+    já estava alocado no início (o tracemalloc é do processo: outras threads entram
+    na conta).
+    """
+    config = secao_dos_secrets('medicoes')
+    if not config:
+        yield {}
+        return
+
+    medida = {'etapa': etapa, **detalhes}
+    pilha = getattr(_local, 'pilha', None)
+    if pilha is None:
+        pilha = _local.pilha = []
+    com_memoria = bool(config.get('memoria'))
+    if com_memoria and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    quadro = {'base': 0, 'pico': 0}
+    if com_memoria:
+        atual, pico = tracemalloc.get_traced_memory()
+        if pilha:
+            pilha[-1]['pico'] = max(pilha[-1]['pico'], pico)
+        tracemalloc.reset_peak()
+        quadro = {'base': atual, 'pico': atual}
+    pilha.append(quadro)
+
+    ctx = get_script_run_ctx(suppress_warning=True)
+    inicio_epoca = time.time()
+    inicio = time.perf_counter()
+    try:
+        yield medida
+    except BaseException as e:
+        medida['erro'] = type(e).__name__
+        raise
+    finally:
+        segundos = time.perf_counter() - inicio
+        pilha.pop()
+        if com_memoria and tracemalloc.is_tracing():
+            _, pico = tracemalloc.get_traced_memory()
+            pico = max(quadro['pico'], pico)
+            medida['memoria_mb'] = round((pico - quadro['base']) / 1e6, 3)
+            if pilha:
+                pilha[-1]['pico'] = max(pilha[-1]['pico'], pico)
+        medida.update(
+            quando=datetime.fromtimestamp(inicio_epoca).isoformat(timespec='milliseconds'),
+            inicio=inicio_epoca,
+            segundos=round(segundos, 6),
+            sessao=ctx.session_id if ctx is not None else None,
+            thread=threading.current_thread().name,
+            nivel=len(pilha),
+        )
+        _registrar(medida, config)
+
+# ==============================================================================
+# IMPORTAÇÕES SOB DEMANDA
+# ==============================================================================
+
+@st.cache_resource
+def _importacoes():
+    """Primeira importação de cada módulo pedido a importar(), no processo."""
+    return {'importacoes': [], 'lock': threading.Lock()}
+
+def importar(nome, pagina=None):
+    """Importa o módulo `nome` na primeira vez que alguma página precisa dele.
+
+    Com [medicoes], a primeira importação no processo vira a etapa 'importar' e
+    entra no relatório do painel: tempo, quantos módulos novos foram carregados e
+    de quais pacotes (um resumo do `python -X importtime` por página; o detalhe
+    módulo a módulo sai do relatorio_importacao.py). Depois disso o módulo vem
+    do sys.modules, sem custo.
+    """
+    if nome in sys.modules:
+        return sys.modules[nome]
+    if not medicoes_ativas():
+        return importlib.import_module(nome)
+
+    antes = set(sys.modules)
+    with medir_etapa('importar', modulo=nome, pagina=pagina) as medida:
+        modulo = importlib.import_module(nome)
+        novos = set(sys.modules) - antes
+        medida['modulos_novos'] = len(novos)
+        medida['pacotes'] = ', '.join(sorted({novo.split('.')[0] for novo in novos}))
+    importacoes = _importacoes()
+    with importacoes['lock']:
+        importacoes['importacoes'].append({
+            'modulo': nome, 'pagina': pagina, 'segundos': medida['segundos'],
+            'modulos_novos': len(novos), 'pacotes': medida['pacotes'],
+        })
+    return modulo
+
+def relatorio_importacoes():
+    """Importações sob demanda já feitas neste processo, na ordem em que aconteceram."""
+    import pandas as pd
+    importacoes = _importacoes()
+    with importacoes['lock']:
+        linhas = list(importacoes['importacoes'])
+    return pd.DataFrame(linhas, columns=['modulo', 'pagina', 'segundos', 'modulos_novos', 'pacotes'])
+
+# ==============================================================================
+# DADOS DO PAINEL DE DESEMPENHO
+# ==============================================================================
+
+def _copiar_medidas():
+    recentes = _medidas_recentes()
+    with recentes['lock']:
+        return list(recentes['medidas'])
+
+def _descricao(medida):
+    """Detalhes da etapa (gráfico, arquivo, dataset...) num texto curto."""
+    return ', '.join(f"{chave}={valor}" for chave, valor in medida.items() if chave not in CAMPOS_FIXOS)
+
+def medidas_da_execucao(desde):
+    """Etapas disparadas pela sessão atual desde o instante `desde` (time.time())."""
+    import pandas as pd
+    ctx = get_script_run_ctx(suppress_warning=True)
+    sessao = ctx.session_id if ctx is not None else None
+    linhas = [
+        {
+            'etapa': '  ' * m['nivel'] + m['etapa'],
+            'detalhes': _descricao(m),
+            'segundos': m['segundos'],
+            'linhas': m.get('linhas'),
+            'memoria_mb': m.get('memoria_mb'),
+        }
+        # Cada etapa é registrada ao terminar; pelo início, a de fora vem antes das de dentro
+        for m in sorted(_copiar_medidas(), key=lambda m: m['inicio'])
+        if m['sessao'] == sessao and m['inicio'] >= desde
+    ]
+    return pd.DataFrame(linhas, columns=['etapa', 'detalhes', 'segundos', 'linhas', 'memoria_mb'])
+
+def resumo_das_etapas():
+    """Tempo por etapa nas medidas recentes do processo (todas as sessões e threads)."""
+    import pandas as pd
+    medidas = pd.DataFrame(_copiar_medidas())
+    if medidas.empty:
+        return pd.DataFrame(columns=['etapa', 'vezes', 'media_s', 'p95_s', 'max_s', 'total_s'])
+    resumo = medidas.groupby('etapa')['segundos'].agg(
+        vezes='count', media_s='mean', p95_s=lambda s: s.quantile(0.95), max_s='max', total_s='sum'
+    )
+    return resumo.sort_values('total_s', ascending=False).round(4).reset_index()
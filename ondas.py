@@ -0,0 +1,81 @@
+"""Catálogo das ondas de cada pesquisa (aplicações repetidas do mesmo questionário).
+
+Cada onda é um CSV no formato do questionário, com a data da coleta, registrado na
+seção [ondas] do .streamlit/secrets.toml:
+
+    [[ondas.survey]]
+    id = "2025-1"
+    arquivo = "ondas/survey/2025-1.csv"
+    coleta = 2025-03-17
+
+    [[ondas.survey]]
+    id = "2025-2"
+    arquivo = "ondas/survey/2025-2.csv"
+    coleta = 2025-09-22
+
+Pesquisas sem ondas cadastradas têm uma única onda: o CSV do app, com a data de
+modificação do arquivo como data da coleta.
+
+Os dados preparados de cada onda ficam numa partição própria (dados.PASTA_ONDAS),
+lida só quando alguma visão seleciona a onda. Cadastrar uma onda nova não mexe nas
+partições nem nos cubos das anteriores.
+"""
+import os
+import re
+from datetime import date, datetime
+
+from dados import PREPARO, caminho_da_particao, ler_particao, versao_do_arquivo
+from medicoes import secao_dos_secrets
+
+ID_ONDA_PADRAO = 'atual'
+
+# O id vira nome de pasta (onda=<id>)
+FORMATO_ID = re.compile(r'^[\w.-]+$')
+
+def _data_da_coleta(valor, arquivo):
+    if isinstance(valor, datetime):
+        return valor.date()
+    if isinstance(valor, date):
+        return valor
+    if valor:
+        return date.fromisoformat(str(valor))
+    try:
+        return date.fromtimestamp(os.path.getmtime(arquivo))
+    except OSError:
+        return None
+
+def ondas_do_dataset(dataset):
+    """Ondas cadastradas da pesquisa, da coleta mais antiga para a mais recente.
+
+    Cada onda é {'id', 'arquivo', 'coleta'}. Levanta ValueError se o cadastro tiver
+    id repetido ou inválido, onda sem arquivo ou data fora do formato AAAA-MM-DD.
+    """
+    cadastro = secao_dos_secrets('ondas').get(dataset) or [{'id': ID_ONDA_PADRAO, 'arquivo': PREPARO[dataset]['arquivo']}]
+    ondas, ids = [], set()
+    for item in cadastro:
+        id_onda = str(item.get('id', ''))
+        if not FORMATO_ID.match(id_onda):
+            raise ValueError(f"Id de onda inválido em [ondas.{dataset}]: {id_onda!r} (use letras, números, '.', '-' ou '_')")
+        if id_onda in ids:
+            raise ValueError(f"Onda {id_onda!r} cadastrada mais de uma vez em [ondas.{dataset}]")
+        if not item.get('arquivo'):
+            raise ValueError(f"Onda {id_onda!r} de [ondas.{dataset}] sem arquivo")
+        ids.add(id_onda)
+        ondas.append({
+            'id': id_onda,
+            'arquivo': item['arquivo'],
+            'coleta': _data_da_coleta(item.get('coleta'), item['arquivo']),
+        })
+    return sorted(ondas, key=lambda onda: (onda['coleta'] is None, onda['coleta'] or date.min))
+
+def versao_da_onda(onda):
+    """Identifica o arquivo da onda sem lê-lo (dados.versao_do_arquivo); None se não existir."""
+    return versao_do_arquivo(onda['arquivo'])
+
+def dados_da_onda(dataset, onda, colunas=None):
+    """DataFrame preparado da onda, lido da sua partição (None se o CSV não puder ser lido)."""
+    preparo = PREPARO[dataset]
+    caminho = caminho_da_particao(dataset, onda['id'], onda['arquivo'], preparo['versao'])
+    if caminho is None:
+        return None
+    return ler_particao(onda['arquivo'], caminho, preparo['preparar'], preparo['traduzidas'], colunas)
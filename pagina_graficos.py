@@ -0,0 +1,136 @@
+"""Página de gráficos: abas por dataset, filtros globais e evolução entre ondas.
+
+Módulo à parte do app.py para que o Plotly, o pandas e o resto da pilha dos
+gráficos só sejam importados quando a página é aberta (ver medicoes.importar).
+"""
+import streamlit as st
+
+from graficos import (
+    DATASETS, FILTROS, aguardar_carga, carregar_cubo_filtrado, carregar_tendencias, exibir_grafico,
+    exibir_tendencia, filtros_do_dataset, graficos_do_dataset, iniciar_aquecimento_cache, iniciar_cargas,
+    opcoes_do_filtro, tendencias_do_dataset
+)
+from ondas import ondas_do_dataset
+
+@st.fragment
+def exibir_grafico_sob_demanda(grafico, cubo, filtros=()):
+    """Gráfico dentro de um expander, calculado só quando o expander está aberto.
+
+    Roda como fragmento: abrir/fechar o expander (ou interagir com o gráfico)
+    reexecuta apenas este gráfico, e não a página inteira.
+    """
+    expander = st.expander(grafico['titulo'], key=f"grafico_{grafico['id']}", on_change='rerun')
+    with expander:
+        if expander.open:
+            exibir_grafico(grafico, cubo, filtros)
+
+@st.fragment
+def exibir_tendencia_sob_demanda(tendencia, tendencias):
+    """Gráfico de evolução entre ondas num expander, como exibir_grafico_sob_demanda."""
+    expander = st.expander(tendencia['titulo'], key=f"grafico_{tendencia['id']}", on_change='rerun')
+    with expander:
+        if expander.open:
+            exibir_tendencia(tendencia, tendencias)
+
+def exibir_evolucao(dataset):
+    """Evolução entre ondas (ondas.py): só as ondas escolhidas são carregadas."""
+    if not tendencias_do_dataset(dataset):
+        return
+    st.markdown("### 📈 Evolução entre Ondas")
+    try:
+        ondas = ondas_do_dataset(dataset)
+    except ValueError as e:
+        st.error(f"Cadastro de ondas inválido: {e}")
+        return
+    if len(ondas) < 2:
+        st.caption("Há uma única onda desta pesquisa. Cadastre as demais em [ondas] nos secrets para acompanhar a evolução.")
+    rotulos = {
+        onda['id']: f"{onda['id']} ({onda['coleta']:%d/%m/%Y})" if onda['coleta'] else onda['id'] for onda in ondas
+    }
+    escolhidas = st.multiselect(
+        "Ondas", list(rotulos), default=list(rotulos), format_func=rotulos.get, key=f"ondas_{dataset}"
+    )
+    if not escolhidas:
+        st.info("Escolha ao menos uma onda.")
+        return
+    tendencias = carregar_tendencias(dataset, [onda for onda in ondas if onda['id'] in escolhidas])
+    if tendencias['_sem_dados']:
+        st.warning(f"Não foi possível ler a(s) onda(s): {', '.join(tendencias['_sem_dados'])}.")
+    st.caption("Os filtros da sidebar não se aplicam à evolução entre ondas.")
+    for tendencia in tendencias_do_dataset(dataset):
+        exibir_tendencia_sob_demanda(tendencia, tendencias)
+
+def filtros_escolhidos():
+    """Filtros ativos como ((id, valores), ...), lidos do estado dos multiselects da sidebar.
+
+    Os multiselects só são desenhados depois da aba (exibir_filtros), pois as opções
+    dependem de todos os datasets; o valor deles já está no session_state.
+    """
+    ativos = []
+    for id_filtro in FILTROS:
+        escolhidos = st.session_state.get(f"filtro_{id_filtro}")
+        if escolhidos:
+            ativos.append((id_filtro, tuple(escolhidos)))
+    return tuple(ativos)
+
+def exibir_filtros(area):
+    """Filtros globais (graficos.FILTROS) na área reservada da sidebar."""
+    with area:
+        st.markdown("---")
+        st.markdown("#### 🔎 Filtros")
+        for id_filtro, filtro in FILTROS.items():
+            opcoes = opcoes_do_filtro(id_filtro)
+            if not opcoes:
+                continue
+            st.multiselect(
+                filtro['rotulo'], opcoes, key=f"filtro_{id_filtro}",
+                format_func=filtro.get('formatar', str), placeholder="Todos"
+            )
+
+def legenda_dos_filtros(dataset, filtros, cubo):
+    """Quantas respostas passam nos filtros e quais filtros não existem nesta pesquisa."""
+    if not filtros:
+        return
+    ignorados = [
+        FILTROS[id_filtro]['rotulo'] for id_filtro, _ in filtros if dataset not in FILTROS[id_filtro]['colunas']
+    ]
+    if filtros_do_dataset(dataset, filtros):
+        texto = f"🔎 {cubo['_respostas']} resposta(s) atendem aos filtros."
+    else:
+        texto = "🔎 Nenhum dos filtros ativos se aplica a esta pesquisa."
+    if ignorados:
+        texto += f" Sem efeito aqui: {', '.join(ignorados)}."
+    st.caption(texto)
+
+def show_graficos_page():
+    """Abas com os gráficos do registro (o cabeçalho da página vem de conteudo.PAGINAS)."""
+    # Todos os datasets começam a carregar juntos; a aba visível espera só o dela
+    cargas = iniciar_cargas()
+    iniciar_aquecimento_cache()
+    area_filtros = st.sidebar.container()
+    filtros = filtros_escolhidos()
+    
+    # Com estado (key + on_change), só o código da aba visível é executado
+    abas = st.tabs([info['aba'] for info in DATASETS.values()], key="aba_graficos", on_change="rerun")
+    
+    for (dataset, info), aba in zip(DATASETS.items(), abas):
+        if not aba.open:
+            continue
+        with aba:
+            st.markdown(info['cabecalho'])
+            aguardar_carga(cargas, dataset)
+            # Só as tabelas de contagem são carregadas aqui (o DataFrame completo fica para quem usa_dataframe)
+            cubo = carregar_cubo_filtrado(dataset, filtros)
+            if cubo is None:
+                st.error(info['erro'])
+                continue
+            legenda_dos_filtros(dataset, filtros, cubo)
+            filtros_aplicados = filtros_do_dataset(dataset, filtros)
+            for grafico in graficos_do_dataset(dataset):
+                exibir_grafico_sob_demanda(grafico, cubo, filtros_aplicados)
+            exibir_evolucao(dataset)
+
+    # As opções dos filtros vêm de todos os datasets: a aba já foi desenhada enquanto os demais carregavam
+    for dataset in DATASETS:
+        aguardar_carga(cargas, dataset)
+    exibir_filtros(area_filtros)
@@ -0,0 +1,92 @@
+"""Relatório do tempo de importação de cada página do app, com `python -X importtime`.
+
+Para cada página de conteudo.PAGINAS, um interpretador novo importa primeiro o que
+o app.py importa em todas as páginas (a base) e depois os módulos que os blocos da
+página pedem (conteudo.modulos_dos_blocos). O relatório mostra o tempo da base, o
+da página e os pacotes que mais pesaram na importação da página.
+
+Uso:
+    python relatorio_importacao.py [--repeticoes 3] [--pacotes 8]
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+from collections import defaultdict
+
+from conteudo import PAGINAS, modulos_dos_blocos
+
+# O que o app.py importa antes de saber qual página foi pedida
+MODULOS_BASE = ['streamlit', 'conteudo', 'medicoes']
+
+MARCADOR = '--- pagina ---'
+
+# "import time: self [us] | cumulative | imported package", com o nível no recuo do nome
+LINHA_IMPORTTIME = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|( +)(\S+)$')
+
+def _comando(modulos):
+    return (
+        f"import sys; import {', '.join(MODULOS_BASE)}; "
+        f"sys.stderr.write({MARCADOR + chr(10)!r}); "
+        + ''.join(f"import {modulo}; " for modulo in modulos)
+    )
+
+def _ler_importtime(saida):
+    """(linhas da base, linhas da página) como (própria_us, acumulada_us, nível, módulo)."""
+    base, pagina = [], []
+    atual = base
+    for linha in saida.splitlines():
+        if linha == MARCADOR:
+            atual = pagina
+            continue
+        encontrada = LINHA_IMPORTTIME.match(linha)
+        if encontrada:
+            propria, acumulada, recuo, modulo = encontrada.groups()
+            atual.append((int(propria), int(acumulada), (len(recuo) - 1) // 2, modulo))
+    return base, pagina
+
+def medir_pagina(modulos, pasta):
+    """Tempos (em segundos) de uma importação a frio da base e dos módulos da página."""
+    processo = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', _comando(modulos)],
+        cwd=pasta, capture_output=True, text=True
+    )
+    if processo.returncode != 0:
+        raise RuntimeError(processo.stderr.strip().splitlines()[-1] if processo.stderr.strip() else "falha ao importar")
+    base, pagina = _ler_importtime(processo.stderr)
+    pacotes = defaultdict(int)
+    for propria, _, _, modulo in pagina:
+        pacotes[modulo.split('.')[0]] += propria
+    return {
+        'base_s': sum(acumulada for _, acumulada, nivel, _ in base if nivel == 0) / 1e6,
+        'pagina_s': sum(acumulada for _, acumulada, nivel, _ in pagina if nivel == 0) / 1e6,
+        'modulos': len(pagina),
+        'pacotes': {pacote: us / 1e6 for pacote, us in pacotes.items()},
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Mede o tempo de importação a frio de cada página do app.")
+    parser.add_argument('--repeticoes', type=int, default=3, help="Importações de cada página; vale a mais rápida (padrão: 3)")
+    parser.add_argument('--pacotes', type=int, default=8, help="Pacotes mais pesados listados por página (padrão: 8)")
+    args = parser.parse_args(argv)
+    if args.repeticoes < 1:
+        parser.error("--repeticoes deve ser pelo menos 1")
+
+    pasta = os.path.dirname(os.path.abspath(__file__))
+    print(f"{'página':<20} {'base s':>8} {'página s':>9} {'módulos':>8}  pacotes mais pesados")
+    for nome, blocos in PAGINAS.items():
+        modulos = modulos_dos_blocos(blocos)
+        try:
+            medidas = [medir_pagina(modulos, pasta) for _ in range(args.repeticoes)]
+        except RuntimeError as e:
+            print(f"{nome}: não foi possível importar {', '.join(modulos)} ({e})", file=sys.stderr)
+            continue
+        medida = min(medidas, key=lambda m: m['base_s'] + m['pagina_s'])
+        pesados = sorted(medida['pacotes'].items(), key=lambda item: item[1], reverse=True)[:args.pacotes]
+        texto_pacotes = ', '.join(f"{pacote} {segundos:.3f}s" for pacote, segundos in pesados) or '-'
+        print(f"{nome:<20} {medida['base_s']:>8.3f} {medida['pagina_s']:>9.3f} {medida['modulos']:>8}  {texto_pacotes}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
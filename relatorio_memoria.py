@@ -0,0 +1,59 @@
+"""Relatório de memória do modo compacto: bytes por coluna antes e depois.
+
+Lê cada CSV, aplica o preparo normal e mostra, coluna a coluna, o tipo e os bytes
+do DataFrame preparado com e sem compactar_dados (dados.MODO_COMPACTO).
+
+Uso:
+    python relatorio_memoria.py [--pasta dados_sinteticos/1000000] [--datasets survey]
+"""
+import argparse
+import os
+import sys
+
+import pandas as pd
+
+from medicoes import silenciar_fora_do_app
+
+silenciar_fora_do_app()
+
+from dados import PREPARO, compactar_dados, ler_csv, relatorio_memoria
+
+def relatorio_do_dataset(dataset):
+    """Relatório por coluna de um dataset, lido da pasta atual (sem o cache do app)."""
+    preparo = PREPARO[dataset]
+    antes = preparo['preparar'](ler_csv(preparo['arquivo']))
+    depois = compactar_dados(antes.copy(), preparo['traduzidas'])
+    return relatorio_memoria(antes, depois)
+
+def _mb(n):
+    return f"{n / 1e6:,.2f} MB"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compara a memória dos dados preparados com e sem o modo compacto.")
+    parser.add_argument('--pasta', default=None, help="Pasta com os CSVs (padrão: a do app)")
+    parser.add_argument('--datasets', default=None, help="Datasets separados por vírgula (padrão: todos)")
+    args = parser.parse_args(argv)
+
+    datasets = [d.strip() for d in args.datasets.split(',')] if args.datasets else list(PREPARO)
+    desconhecidos = set(datasets) - set(PREPARO)
+    if desconhecidos:
+        parser.error(f"Dataset(s) desconhecido(s): {', '.join(sorted(desconhecidos))}")
+    os.chdir(os.path.abspath(args.pasta) if args.pasta else os.path.dirname(os.path.abspath(__file__)))
+
+    with pd.option_context('display.max_rows', None, 'display.width', 200, 'display.max_colwidth', 50):
+        for dataset in datasets:
+            try:
+                relatorio = relatorio_do_dataset(dataset)
+            except OSError as e:
+                print(f"{dataset}: não foi possível ler {PREPARO[dataset]['arquivo']} ({e})", file=sys.stderr)
+                continue
+            tabela = relatorio.assign(economia=relatorio['economia'].map('{:.0%}'.format))
+            tabela.index = [col if len(col) <= 50 else col[:47] + '...' for col in tabela.index]
+            print(f"\n=== {dataset} ({PREPARO[dataset]['arquivo']}) ===")
+            print(tabela.to_string())
+            antes, depois = relatorio['bytes_antes'].sum(), relatorio['bytes_depois'].sum()
+            print(f"Total: {_mb(antes)} -> {_mb(depois)} ({1 - depois / antes:.0%} a menos)")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
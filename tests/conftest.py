@@ -0,0 +1,17 @@
+"""Configuração comum dos testes: módulos do app importáveis e a pasta dos CSVs como atual."""
+import os
+import sys
+
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from medicoes import silenciar_fora_do_app  # noqa: E402
+
+silenciar_fora_do_app()
+
+@pytest.fixture(autouse=True)
+def pasta_do_app(monkeypatch):
+    """Os módulos leem os CSVs e gravam os caches por caminho relativo à pasta do app."""
+    monkeypatch.chdir(RAIZ)
@@ -0,0 +1,12 @@
+"""Testes da assinatura do site estático."""
+import os
+
+import construir_site
+
+def test_assinatura_cobre_os_modulos_usados_pelos_graficos():
+    nomes = {os.path.basename(caminho) for caminho in construir_site.arquivos_fonte()}
+    # Módulos que mudam as figuras sem estarem no registro de gráficos
+    assert {'graficos.py', 'dados.py', 'estatisticas.py', 'banco_embarcado.py', 'ondas.py', 'medicoes.py',
+            'conteudo.py', 'construir_site.py'} <= nomes
+    # Só os módulos do projeto (não os testes nem as bibliotecas)
+    assert all(os.path.dirname(caminho) == construir_site.PASTA_PROJETO for caminho in construir_site.arquivos_fonte())
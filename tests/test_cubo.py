@@ -0,0 +1,149 @@
+"""Testes do cubo de contagens de dados.py comparado com o pandas puro sobre as mesmas linhas."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from dados import (
+    _unir_categorias, chave_regressao, construir_cubo, construir_indice, cubo_do_indice, mascara_do_indice,
+    somar_cubos
+)
+from estatisticas import regressao_das_somas
+
+CONTAGENS = ['genero', 'nivel', 'curso']
+CRUZAMENTOS = [('genero', 'nivel'), ('curso', 'genero')]
+REGRESSOES = [('nota', 'nivel')]
+
+def dados_aleatorios(linhas, semente, cursos=('Direito', 'Letras', 'Medicina')):
+    rng = np.random.default_rng(semente)
+    df = pd.DataFrame({
+        'genero': pd.Categorical(rng.choice(['Feminino', 'Masculino', None], linhas),
+                                 categories=['Masculino', 'Feminino']),
+        'nivel': pd.array(rng.integers(1, 6, linhas), dtype='Int64'),
+        'curso': rng.choice(list(cursos), linhas).astype(object),
+        'nota': rng.normal(7, 1.5, linhas).round(1),
+    })
+    df.loc[rng.random(linhas) < 0.1, 'nivel'] = pd.NA
+    df.loc[rng.random(linhas) < 0.1, 'curso'] = None
+    return df
+
+def cubo_de(df, **opcoes):
+    return construir_cubo(df, CONTAGENS, CRUZAMENTOS, regressoes=REGRESSOES, **opcoes)
+
+def assert_cubos_iguais(cubo, esperado):
+    assert set(cubo) == set(esperado)
+    for chave, tabela in esperado.items():
+        if isinstance(chave, tuple) and chave[0] == 'regressao':
+            np.testing.assert_allclose(cubo[chave].to_numpy(), tabela.to_numpy())
+        elif isinstance(tabela, pd.Series):
+            pd.testing.assert_series_equal(cubo[chave], tabela, check_index_type=False)
+        else:
+            pd.testing.assert_frame_equal(cubo[chave], tabela, check_index_type=False, check_column_type=False)
+
+def assert_igual_ao_pandas(cubo, df):
+    """Cada tabela do cubo tem as contagens do value_counts/crosstab (zero nas categorias sem respostas)."""
+    for col in CONTAGENS:
+        esperado = df[col].value_counts()
+        assert set(esperado.index) <= set(cubo[col].index)
+        np.testing.assert_array_equal(cubo[col].to_numpy(), esperado.reindex(cubo[col].index, fill_value=0).to_numpy())
+
+    for col_a, col_b in CRUZAMENTOS:
+        tabela = cubo[(col_a, col_b)]
+        esperado = pd.crosstab(df[col_a], df[col_b]).reindex(index=tabela.index, columns=tabela.columns, fill_value=0)
+        np.testing.assert_array_equal(tabela.to_numpy(), esperado.to_numpy())
+        assert tabela.to_numpy().sum() == df[[col_a, col_b]].notna().all(axis=1).sum()
+
+    pares = df[['nota', 'nivel']].dropna().astype(float)
+    regressao = regressao_das_somas(cubo[chave_regressao('nota', 'nivel')])
+    inclinacao, intercepto = np.polyfit(pares['nota'], pares['nivel'], 1)
+    assert regressao['n'] == len(pares)
+    assert regressao['inclinacao'] == pytest.approx(inclinacao)
+    assert regressao['intercepto'] == pytest.approx(intercepto)
+
+# ==============================================================================
+# CUBO
+# ==============================================================================
+
+def test_construir_cubo_igual_ao_pandas():
+    df = dados_aleatorios(500, 0)
+    cubo = cubo_de(df)
+    assert_igual_ao_pandas(cubo, df)
+    # Categorias declaradas vêm na ordem do categórico, mesmo sem respostas
+    assert list(cubo['genero'].index) == ['Masculino', 'Feminino']
+
+def test_construir_cubo_com_pesos_igual_as_linhas_repetidas():
+    df = dados_aleatorios(300, 1)
+    agrupado = df.groupby(['genero', 'nivel', 'curso', 'nota'], observed=True, dropna=False).size()
+    agrupado = agrupado.rename('quantidade').reset_index()
+    agrupado['genero'] = pd.Categorical(agrupado['genero'], categories=df['genero'].cat.categories)
+
+    assert_cubos_iguais(cubo_de(agrupado, pesos='quantidade'), cubo_de(df))
+
+# ==============================================================================
+# SOMA DE CUBOS
+# ==============================================================================
+
+def test_somar_cubos_igual_ao_cubo_de_tudo():
+    # O segundo trecho traz um curso novo e o nível como float (como num trecho pequeno do CSV)
+    antes = dados_aleatorios(400, 2)
+    depois = dados_aleatorios(60, 3, cursos=('Artes', 'Direito', 'Zootecnia'))
+    depois_float = depois.assign(nivel=depois['nivel'].astype('Float64'))
+
+    somado = somar_cubos(dict(cubo_de(antes), _assinatura='x'), cubo_de(depois_float))
+    tudo = cubo_de(pd.concat([antes, depois], ignore_index=True))
+
+    assert somado.pop('_assinatura') == 'x'
+    assert_cubos_iguais(somado, tudo)
+    assert list(somado['curso'].index) == ['Artes', 'Direito', 'Letras', 'Medicina', 'Zootecnia']
+
+@pytest.mark.parametrize('atuais, novas, esperado', [
+    (['Baixo', 'Médio', 'Alto'], ['Baixo', 'Médio', 'Alto'], ['Baixo', 'Médio', 'Alto']),
+    # A ordem declarada fica no início e as demais seguem em ordem crescente
+    (['Baixo', 'Alto', 'b', 'd'], ['Baixo', 'Alto', 'a', 'c'], ['Baixo', 'Alto', 'a', 'b', 'c', 'd']),
+    (['b', 'd'], ['c'], ['b', 'c', 'd']),
+    ([1, 3], [2], [1, 2, 3]),
+    # Tipos misturados não se ordenam: as novas ficam no fim
+    ([1, 'x'], [2], [1, 'x', 2]),
+])
+def test_unir_categorias(atuais, novas, esperado):
+    unidas = _unir_categorias(pd.Index(atuais, name='col'), pd.Index(novas))
+    assert list(unidas) == esperado
+    assert unidas.name == 'col'
+
+# ==============================================================================
+# ÍNDICE DOS FILTROS
+# ==============================================================================
+
+FILTROS = [
+    [('genero', ['Feminino'])],
+    [('genero', ['Feminino', 'Masculino']), ('curso', ['Letras'])],
+    [('curso', ['Direito', 'Medicina']), ('nivel', [1, 5])],
+    [('curso', ['Inexistente'])],
+    [('genero', ['Masculino']), ('coluna_fora_do_indice', ['x'])],
+]
+
+@pytest.mark.parametrize('filtros', FILTROS)
+def test_mascara_do_indice_igual_ao_isin(filtros):
+    df = dados_aleatorios(203, 4)
+    indice = construir_indice(df, CONTAGENS + ['nota'], ['genero', 'curso', 'nivel'])
+
+    mascara = mascara_do_indice(indice, filtros)
+    esperada = np.ones(len(df), dtype=bool)
+    for coluna, valores in filtros:
+        if coluna in df.columns:
+            esperada &= df[coluna].isin(valores).to_numpy()
+    np.testing.assert_array_equal(mascara, esperada)
+
+    # O cubo recortado mantém as categorias de todas as linhas, com zero nas que saíram
+    recortado = cubo_do_indice(indice, CONTAGENS, CRUZAMENTOS, mascara, regressoes=REGRESSOES)
+    assert set(recortado) == set(cubo_de(df))
+    if esperada.any():
+        assert_igual_ao_pandas(recortado, df[esperada])
+    else:
+        assert all(recortado[col].sum() == 0 for col in CONTAGENS)
+
+def test_mascara_sem_filtros_aplicaveis():
+    df = dados_aleatorios(10, 5)
+    indice = construir_indice(df, CONTAGENS, ['genero'])
+    assert mascara_do_indice(indice, []) is None
+    assert mascara_do_indice(indice, [('curso', ['Letras'])]) is None
+    assert_cubos_iguais(cubo_do_indice(indice, CONTAGENS, CRUZAMENTOS), construir_cubo(df, CONTAGENS, CRUZAMENTOS))
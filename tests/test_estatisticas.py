@@ -0,0 +1,90 @@
+"""Testes de estatisticas.py: regressão e testes das cruzadas comparados com o scipy.stats
+sobre as mesmas contagens, e o bootstrap em série e em processos."""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+from scipy import stats
+
+import estatisticas
+from estatisticas import regressao_das_somas, somas_regressao
+
+
+def test_regressao_das_somas_igual_ao_linregress():
+    rng = np.random.default_rng(1)
+    x = rng.integers(1, 11, 300).astype(float)
+    y = 2.0 + 0.1 * x + rng.normal(0, 0.5, 300)
+    x[::17] = np.nan
+
+    regressao = regressao_das_somas(somas_regressao(x, y))
+    validos = ~np.isnan(x)
+    esperado = stats.linregress(x[validos], y[validos])
+
+    assert regressao['n'] == validos.sum()
+    assert regressao['inclinacao'] == pytest.approx(esperado.slope)
+    assert regressao['intercepto'] == pytest.approx(esperado.intercept)
+    assert regressao['r'] == pytest.approx(esperado.rvalue)
+    assert regressao['p_valor'] == pytest.approx(esperado.pvalue)
+
+
+def test_regressao_sem_dois_x_distintos():
+    assert regressao_das_somas(somas_regressao([3, 3, 3], [1, 2, 3])) is None
+    assert regressao_das_somas(somas_regressao([1], [1])) is None
+
+
+def test_testes_das_cruzadas_igual_ao_chi2_contingency():
+    tabelas = {
+        'a': pd.DataFrame([[10, 20, 30], [25, 5, 12]], index=['x', 'y'], columns=['p', 'q', 'r']),
+        # Linha e coluna vazias não contam nos graus de liberdade
+        'b': pd.DataFrame([[7, 0, 3], [0, 0, 0], [2, 0, 9]]),
+    }
+    resultados = estatisticas.testes_das_cruzadas(tabelas)
+
+    for chave, observado in [('a', tabelas['a'].to_numpy()), ('b', np.array([[7, 3], [2, 9]]))]:
+        qui2, p, gl, _ = stats.chi2_contingency(observado, correction=False)
+        g, p_g, _, _ = stats.chi2_contingency(observado, correction=False, lambda_='log-likelihood')
+        resultado = resultados[chave]
+        assert resultado['gl'] == gl
+        assert resultado['qui2'] == pytest.approx(qui2)
+        assert resultado['p_qui2'] == pytest.approx(p)
+        assert resultado['g'] == pytest.approx(g)
+        assert resultado['p_g'] == pytest.approx(p_g)
+        assert resultado['v_cramer'] == pytest.approx(stats.contingency.association(observado))
+    assert resultados['a']['residuos'].shape == (2, 3)
+
+
+def test_testes_de_tabela_sem_graus_de_liberdade():
+    resultado = estatisticas.testes_das_cruzadas({'a': pd.DataFrame([[4, 6]])})['a']
+    assert resultado['gl'] == 0
+    assert np.isnan(resultado['p_qui2'])
+    assert np.isnan(resultado['v_cramer'])
+
+
+class ExecutorContado:
+    """ProcessPoolExecutor que conta as chamadas a map."""
+
+    def __init__(self, executor):
+        self.executor = executor
+        self.chamadas = 0
+
+    def map(self, *args):
+        self.chamadas += 1
+        return self.executor.map(*args)
+
+
+def test_intervalos_bootstrap_em_processos_iguais_aos_em_serie(monkeypatch):
+    rng = np.random.default_rng(2)
+    tabelas = {chave: pd.DataFrame(rng.integers(0, 40, (4, 3))) for chave in 'abc'}
+    em_serie = estatisticas.intervalos_bootstrap(tabelas, reamostras=500, semente=7)
+
+    monkeypatch.setattr(estatisticas, 'SORTEIOS_PARA_PARALELIZAR', 0)
+    with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context('spawn')) as pool:
+        executor = ExecutorContado(pool)
+        em_processos = estatisticas.intervalos_bootstrap(tabelas, reamostras=500, semente=7, executor=executor)
+
+    assert executor.chamadas == 1
+    for chave in tabelas:
+        for serie, processos in zip(em_serie[chave], em_processos[chave]):
+            pd.testing.assert_frame_equal(serie, processos)
@@ -0,0 +1,264 @@
+"""Testes da fonte MySQL: o pool de conexões (sem servidor) e, com um servidor local,
+os cubos agregados e filtrados no servidor comparados com o pandas sobre o CSV.
+
+Os testes contra o servidor só rodam com MYSQL_TESTE_HOST definido, por exemplo:
+
+    MYSQL_TESTE_HOST=127.0.0.1 MYSQL_TESTE_USER=root MYSQL_TESTE_PASSWORD=... \\
+    MYSQL_TESTE_DATABASE=teste_congresso python -m pytest tests/test_fonte_mysql.py
+
+As tabelas teste_survey_ai e teste_impact_ai são recriadas no banco indicado.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import fonte_mysql
+from dados import PREPARO, construir_cubo, ler_csv
+
+# A função original: a fixture agrupado_no_pandas a troca por uma assinatura fixa
+ASSINATURA_TABELA = fonte_mysql._assinatura_tabela
+
+# ==============================================================================
+# POOL DE CONEXÕES
+# ==============================================================================
+
+class ConexaoFalsa:
+    def __init__(self, ping_falha=False):
+        self.ping_falha = ping_falha
+        self.fechada = False
+
+    def ping(self, reconnect=True):
+        if self.ping_falha:
+            raise OSError("servidor reiniciado")
+
+    def close(self):
+        self.fechada = True
+
+@pytest.fixture
+def pool(monkeypatch):
+    monkeypatch.setattr(fonte_mysql, 'secao_dos_secrets', lambda nome: {'tamanho_pool': 1})
+    fonte_mysql._pool_mysql.clear()
+    novas = []
+
+    def nova_conexao():
+        novas.append(ConexaoFalsa())
+        return novas[-1]
+
+    monkeypatch.setattr(fonte_mysql, '_nova_conexao', nova_conexao)
+    yield fonte_mysql._pool_mysql(), novas
+    fonte_mysql._pool_mysql.clear()
+
+def test_conexao_volta_ao_pool(pool):
+    estado, novas = pool
+    with fonte_mysql.conexao_mysql() as conexao:
+        pass
+    with fonte_mysql.conexao_mysql() as de_novo:
+        pass
+    assert de_novo is conexao
+    assert len(novas) == 1 and not conexao.fechada
+
+def test_ping_com_erro_descarta_a_conexao(pool):
+    estado, novas = pool
+    quebrada = ConexaoFalsa(ping_falha=True)
+    estado['livres'].put(quebrada)
+    with fonte_mysql.conexao_mysql() as conexao:
+        assert conexao is novas[0]
+    assert quebrada.fechada
+    # A vaga do semáforo foi devolvida: com pool de 1, outra conexão pode ser emprestada
+    assert estado['vagas'].acquire(blocking=False)
+    estado['vagas'].release()
+
+def test_erro_no_uso_descarta_a_conexao(pool):
+    estado, novas = pool
+    with pytest.raises(RuntimeError):
+        with fonte_mysql.conexao_mysql():
+            raise RuntimeError("consulta falhou")
+    assert novas[0].fechada
+    assert estado['livres'].empty()
+    assert estado['vagas'].acquire(blocking=False)
+    estado['vagas'].release()
+
+# ==============================================================================
+# CUBO A PARTIR DE LINHAS AGRUPADAS (GROUP BY feito pelo pandas)
+# ==============================================================================
+
+# Uma resposta com duas grafias: a sem acento tem mais respostas, a acentuada aparece
+# em mais linhas do GROUP BY (uma por resposta diferente na outra pergunta)
+RESPOSTAS_AGRUPADAS = pd.DataFrame({
+    'Profissao': ['muhendis yardimcisi'] * 3 + ['Mühendis Yardımcısı'] * 2 + ['Teacher'],
+    'Afeta_Emprego_Pessoal': ['Think'] * 3 + ["I'm undecided", "I don't think so", 'Think'],
+})
+
+@pytest.fixture
+def agrupado_no_pandas(monkeypatch):
+    def consultar_agrupado(tabela, colunas, condicao=None):
+        grupos = RESPOSTAS_AGRUPADAS[colunas].astype(object).groupby(colunas, dropna=False).size()
+        return fonte_mysql._tipos_como_no_csv(grupos.rename(fonte_mysql.COLUNA_PESO).reset_index())
+
+    monkeypatch.setattr(fonte_mysql, 'secao_dos_secrets', lambda nome: {'tabelas': {'impact': 'impact_ai'}})
+    monkeypatch.setattr(fonte_mysql, 'consultar_agrupado', consultar_agrupado)
+    monkeypatch.setattr(fonte_mysql, '_assinatura_tabela', lambda tabela, versao, janela: 'assinatura')
+    fonte_mysql._cubo_mysql.clear()
+    yield
+    fonte_mysql._cubo_mysql.clear()
+
+def test_rotulo_de_grafias_pelas_respostas_como_no_csv(agrupado_no_pandas):
+    par = ('Profissao_Desc', 'Afeta_Emprego_Pessoal_Desc')
+    cubo = fonte_mysql.cubo_mysql('impact', ['Profissao_Desc'], [par])
+    esperado = construir_cubo(PREPARO['impact']['preparar'](RESPOSTAS_AGRUPADAS.copy()), ['Profissao_Desc'], [par])
+
+    contagem = cubo['Profissao_Desc']
+    assert dict(contagem[contagem > 0]) == {'Muhendis Yardimcisi': 5, 'Professor(a)': 1}
+    for chave in ['Profissao_Desc', par]:
+        obtido, tabela = _sem_zeros(cubo[chave]), _sem_zeros(esperado[chave])
+        assert list(obtido.index) == list(tabela.index)
+        np.testing.assert_array_equal(obtido.to_numpy(), tabela.to_numpy())
+
+class ServidorFalso:
+    """Conexão que responde às consultas de metadados, DISTINCT e COUNT(*) e guarda o SQL executado."""
+
+    def __init__(self, alterada):
+        self.alterada = alterada
+        self.consultas = []
+
+    def cursor(self):
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *erro):
+        pass
+
+    def execute(self, sql, parametros=None):
+        self.consultas.append(sql)
+        if 'information_schema' in sql:
+            self.linhas = [(self.alterada, 6, 16384)]
+        elif 'DISTINCT' in sql:
+            self.linhas = [(b'Female',), (b'Male',), (b'female ',)]
+        else:
+            self.linhas = [(4,)]
+
+    def fetchall(self):
+        return self.linhas
+
+    def fetchone(self):
+        return self.linhas[0]
+
+    def ping(self, reconnect=True):
+        pass
+
+def consultas_com(servidor, trecho):
+    return sum(trecho in sql for sql in servidor.consultas)
+
+@pytest.mark.parametrize('alterada', ['2026-10-01 12:00:00', None])
+def test_assinatura_e_textos_consultados_uma_vez_por_janela(agrupado_no_pandas, monkeypatch, alterada):
+    servidor = ServidorFalso(alterada)
+    monkeypatch.setattr(fonte_mysql, '_nova_conexao', lambda: servidor)
+    monkeypatch.setattr(fonte_mysql, '_assinatura_tabela', ASSINATURA_TABELA)
+    monkeypatch.setattr(fonte_mysql, '_janela_ttl', lambda: 7)
+    for funcao in (fonte_mysql._pool_mysql, ASSINATURA_TABELA, fonte_mysql._textos_gravados):
+        funcao.clear()
+
+    cubos = [
+        fonte_mysql.cubo_mysql('impact', ['Profissao_Desc'], [], filtros=filtros)
+        for filtros in [(), (('Genero_Desc', ('Feminino',)),), (('Genero_Desc', ('Masculino',)),),
+                        (('Genero_Desc', ('Feminino', 'Masculino')),)]
+    ]
+    assert len({cubo['_assinatura'] for cubo in cubos}) == 1
+    assert consultas_com(servidor, 'information_schema') == 1
+    assert consultas_com(servidor, 'DISTINCT') == 1
+    assert 'CHECKSUM' not in ' '.join(servidor.consultas)
+    assert cubos[1]['_respostas'] == 4
+
+    # Na janela seguinte a assinatura é lida de novo; sem a data de alteração, ela muda com a janela
+    monkeypatch.setattr(fonte_mysql, '_janela_ttl', lambda: 8)
+    seguinte = fonte_mysql.cubo_mysql('impact', ['Profissao_Desc'], [])
+    assert consultas_com(servidor, 'information_schema') == 2
+    assert (seguinte['_assinatura'] == cubos[0]['_assinatura']) == (alterada is not None)
+    fonte_mysql._pool_mysql.clear()
+
+# ==============================================================================
+# CONTRA UM SERVIDOR LOCAL
+# ==============================================================================
+
+TABELAS_TESTE = {'survey': 'teste_survey_ai', 'impact': 'teste_impact_ai'}
+
+CASOS_DE_FILTRO = {
+    'survey': [(), (('Genero_Desc', ('Feminino',)),), (('Ano_Estudo', (1, 2)), ('Genero_Desc', ('Masculino',)))],
+    'impact': [(), (('Genero_Desc', ('Feminino',)),),
+               (('Nivel_Educacao_Desc', ('Graduação', 'Em Graduação')), ('Status_Emprego_Desc', ('Estudante',)))],
+}
+
+def _limpar_caches():
+    for funcao in (fonte_mysql._pool_mysql, fonte_mysql._cubo_mysql, fonte_mysql._assinatura_tabela,
+                   fonte_mysql._textos_gravados):
+        funcao.clear()
+
+@pytest.fixture(scope='module')
+def servidor():
+    if not os.environ.get('MYSQL_TESTE_HOST'):
+        pytest.skip("defina MYSQL_TESTE_HOST (e usuário, senha, banco) para testar contra um MySQL/MariaDB local")
+    pytest.importorskip('pymysql')
+    config = {
+        'host': os.environ['MYSQL_TESTE_HOST'],
+        'port': int(os.environ.get('MYSQL_TESTE_PORT', 3306)),
+        'user': os.environ.get('MYSQL_TESTE_USER', 'root'),
+        'password': os.environ.get('MYSQL_TESTE_PASSWORD', ''),
+        'database': os.environ.get('MYSQL_TESTE_DATABASE', 'teste_congresso'),
+        'tabelas': TABELAS_TESTE,
+    }
+    original = fonte_mysql.secao_dos_secrets
+    fonte_mysql.secao_dos_secrets = lambda nome: config if nome == 'mysql' else {}
+    _limpar_caches()
+    try:
+        for dataset in TABELAS_TESTE:
+            fonte_mysql.importar_csv(dataset)
+        yield config
+    finally:
+        fonte_mysql.secao_dos_secrets = original
+        _limpar_caches()
+
+def _sem_zeros(tabela):
+    if isinstance(tabela, pd.Series):
+        return tabela[tabela > 0]
+    return tabela.loc[tabela.sum(axis=1) > 0, tabela.sum(axis=0) > 0]
+
+def _agregacoes(dataset):
+    # Importado aqui: o registro de gráficos só é necessário para os testes com servidor
+    from graficos import agregacoes_do_registro, regressoes_do_registro
+    contagens, cruzamentos = agregacoes_do_registro(dataset)
+    return contagens, cruzamentos, regressoes_do_registro(dataset)
+
+@pytest.mark.parametrize('dataset, filtros', [
+    (dataset, filtros) for dataset, casos in CASOS_DE_FILTRO.items() for filtros in casos
+])
+def test_cubo_do_servidor_igual_ao_do_pandas(servidor, dataset, filtros):
+    contagens, cruzamentos, regressoes = _agregacoes(dataset)
+    cubo = fonte_mysql.cubo_mysql(dataset, contagens, cruzamentos, regressoes, filtros)
+
+    df = PREPARO[dataset]['preparar'](ler_csv(PREPARO[dataset]['arquivo']))
+    mascara = np.ones(len(df), dtype=bool)
+    for coluna, valores in filtros:
+        mascara &= df[coluna].isin(valores).to_numpy()
+    esperado = construir_cubo(df[mascara], contagens, cruzamentos, regressoes=regressoes)
+
+    if filtros:
+        assert cubo['_respostas'] == int(mascara.sum())
+    for chave, tabela in esperado.items():
+        if isinstance(chave, tuple) and chave[0] == 'regressao':
+            np.testing.assert_allclose(np.asarray(cubo[chave], dtype=float), np.asarray(tabela, dtype=float))
+            continue
+        obtido, tabela = _sem_zeros(cubo[chave]), _sem_zeros(tabela)
+        assert list(map(str, obtido.index)) == list(map(str, tabela.index)), chave
+        np.testing.assert_array_equal(obtido.to_numpy(), tabela.to_numpy())
+
+def test_dataframe_filtrado_no_servidor(servidor):
+    filtros = (('Genero_Desc', ('Feminino',)),)
+    df = fonte_mysql.dataframe_mysql('survey', ['GPA', 'Conhecimento_IA'], filtros)
+    completo = PREPARO['survey']['preparar'](ler_csv(PREPARO['survey']['arquivo']))
+    esperado = completo[completo['Genero_Desc'] == 'Feminino']
+    assert len(df) == len(esperado)
+    np.testing.assert_allclose(np.sort(df['GPA'].dropna()), np.sort(esperado['GPA'].dropna()))
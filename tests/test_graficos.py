@@ -0,0 +1,42 @@
+"""Testes do registro de gráficos: o teste e os intervalos usam a tabela que a figura mostra."""
+import pandas as pd
+
+import graficos
+
+PAR = ('Profissao_Desc', 'Afeta_Emprego_Pessoal_Desc')
+
+def cubo_de_profissoes():
+    # A profissão com um único respondente tem a resposta oposta das demais: incluída
+    # no teste, ela sozinha mudaria o qui-quadrado
+    cruzada = pd.DataFrame(
+        {'Sim': [6, 5, 1], 'Não': [6, 5, 0]},
+        index=pd.Index(['Professor(a)', 'Engenheiro(a)', 'Piloto'], name='Profissao_Desc'),
+    )
+    return {'Profissao_Desc': cruzada.sum(axis=1), PAR: cruzada}
+
+def grafico_de_profissoes():
+    return next(g for g in graficos.GRAFICOS if g['id'] == 'profissao_vs_risco_emprego')
+
+def test_tabela_do_grafico_so_tem_as_profissoes_mostradas():
+    cubo = cubo_de_profissoes()
+    tabela = graficos.tabela_do_grafico(grafico_de_profissoes(), cubo)
+    assert list(tabela.index) == ['Professor(a)', 'Engenheiro(a)']
+
+    fig = graficos.figura_profissao_vs_risco_emprego(cubo)
+    assert set(fig.data[0].x) == set(tabela.index)
+
+def test_anotacao_testa_a_tabela_mostrada():
+    cubo = cubo_de_profissoes()
+    grafico = grafico_de_profissoes()
+    fig = graficos.construtor_da_figura(grafico)(cubo)
+
+    mostrada = graficos.testes_das_cruzadas({PAR: cubo[PAR].loc[['Professor(a)', 'Engenheiro(a)']]})[PAR]
+    completa = graficos.testes_das_cruzadas({PAR: cubo[PAR]})[PAR]
+    assert fig.layout.title.subtitle.text == graficos.texto_do_teste(mostrada)
+    assert graficos.texto_do_teste(mostrada) != graficos.texto_do_teste(completa)
+
+def test_sem_profissoes_frequentes_nao_ha_figura():
+    cubo = cubo_de_profissoes()
+    cubo[PAR] = cubo[PAR].loc[['Piloto']]
+    cubo['Profissao_Desc'] = cubo['Profissao_Desc'].loc[['Piloto']]
+    assert graficos.construtor_da_figura(grafico_de_profissoes())(cubo) is None
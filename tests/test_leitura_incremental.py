@@ -0,0 +1,79 @@
+"""Testes da leitura incremental do CSV: só as respostas acrescentadas, ou None quando é preciso
+reler tudo."""
+import pandas as pd
+import pytest
+
+from dados import abrir_leitura, ler_respostas_novas
+
+@pytest.fixture
+def csv(tmp_path):
+    caminho = tmp_path / 'respostas.csv'
+    caminho.write_bytes(b'nome,nota\nana,7\nbia,8\n')
+    return caminho
+
+def acrescentar(caminho, conteudo):
+    with open(caminho, 'ab') as f:
+        f.write(conteudo)
+
+def test_respostas_acrescentadas(csv):
+    leitura = abrir_leitura(csv)
+    acrescentar(csv, b'caio,9\ndani,6\n')
+    novas, leitura = ler_respostas_novas(csv, leitura)
+    pd.testing.assert_frame_equal(novas, pd.DataFrame({'nome': ['caio', 'dani'], 'nota': [9, 6]}))
+
+    # A leitura atualizada é a mesma de quem abre o arquivo inteiro
+    inteira = abrir_leitura(csv)
+    assert leitura['posicao'] == inteira['posicao']
+    assert leitura['hash'].hexdigest() == inteira['hash'].hexdigest()
+
+    novas, _ = ler_respostas_novas(csv, leitura)
+    assert novas.empty and list(novas.columns) == ['nome', 'nota']
+
+def test_linha_incompleta_fica_para_a_proxima_leitura(csv):
+    leitura = abrir_leitura(csv)
+    acrescentar(csv, b'caio,9\ndani,')
+    novas, leitura = ler_respostas_novas(csv, leitura)
+    assert list(novas['nome']) == ['caio']
+
+    acrescentar(csv, b'6\n')
+    novas, _ = ler_respostas_novas(csv, leitura)
+    assert list(novas['nome']) == ['dani'] and list(novas['nota']) == [6]
+
+def test_arquivo_sem_quebra_de_linha_no_fim(tmp_path):
+    caminho = tmp_path / 'respostas.csv'
+    caminho.write_bytes(b'nome,nota\nana,7')
+    leitura = abrir_leitura(caminho)
+
+    acrescentar(caminho, b'\r\nbia,8\r\n')
+    novas, _ = ler_respostas_novas(caminho, leitura)
+    assert list(novas['nome']) == ['bia']
+
+    # Sem a quebra de linha, o acréscimo emendaria na última resposta lida
+    caminho.write_bytes(b'nome,nota\nana,7')
+    leitura = abrir_leitura(caminho)
+    acrescentar(caminho, b'5\n')
+    assert ler_respostas_novas(caminho, leitura) is None
+
+def test_so_linhas_em_branco(csv):
+    leitura = abrir_leitura(csv)
+    acrescentar(csv, b'\n\n')
+    novas, leitura = ler_respostas_novas(csv, leitura)
+    assert novas.empty
+    assert leitura['posicao'] == csv.stat().st_size
+
+@pytest.mark.parametrize('mudanca', ['encolheu', 'reescrito', 'malformado'])
+def test_recarregar_tudo(csv, mudanca):
+    leitura = abrir_leitura(csv)
+    if mudanca == 'encolheu':
+        csv.write_bytes(b'nome,nota\nana,7\n')
+    elif mudanca == 'reescrito':
+        csv.write_bytes(b'nome,nota\nana,5\nbia,8\ncaio,9\n')
+    else:
+        acrescentar(csv, b'caio,9,extra,"aberta\n')
+    assert ler_respostas_novas(csv, leitura) is None
+
+def test_arquivo_removido(csv):
+    leitura = abrir_leitura(csv)
+    csv.unlink()
+    assert ler_respostas_novas(csv, leitura) is None
+    assert abrir_leitura(csv) is None
@@ -0,0 +1,44 @@
+"""Testes da decodificação de múltipla escolha e da coocorrência comparadas com uma matriz
+indicadora montada no pandas."""
+import numpy as np
+import pandas as pd
+
+from dados import construir_cubo, coocorrencia, coocorrencia_do_cubo, decodificar_multipla_escolha
+
+RESPOSTAS = pd.Series([
+    'Internet;TV', 'TV; Internet', None, 'Amigos', '', 'Internet;Internet;Livros', 'Livros;TV;Amigos', 'TV',
+])
+MAPA = {'Internet': 'Internet', 'TV': 'Televisão', 'Livros': 'Livros', 'Amigos': 'Amigos'}
+
+def indicadora_pandas(serie, mapa):
+    itens = serie.fillna('').str.split(';').apply(lambda lista: {mapa.get(i.strip(), i.strip()) for i in lista} - {''})
+    return pd.DataFrame([{item: 1 for item in grupo} for grupo in itens]).fillna(0).astype(np.int64)
+
+def densa(matriz):
+    return matriz.toarray()
+
+def test_decodificar_multipla_escolha_igual_ao_pandas():
+    matriz, itens = decodificar_multipla_escolha(RESPOSTAS, MAPA, ordem=['Televisão', 'Internet'])
+    assert itens == ['Televisão', 'Internet', 'Amigos', 'Livros']
+
+    esperada = indicadora_pandas(RESPOSTAS, MAPA).reindex(columns=itens, fill_value=0)
+    np.testing.assert_array_equal(densa(matriz), esperada.to_numpy())
+
+def test_coocorrencia_igual_ao_produto_denso():
+    matriz, itens = decodificar_multipla_escolha(RESPOSTAS, MAPA)
+    indicadora = indicadora_pandas(RESPOSTAS, MAPA)[itens].to_numpy()
+    np.testing.assert_array_equal(coocorrencia(matriz), indicadora.T @ indicadora)
+
+    pesos = np.arange(1, len(RESPOSTAS) + 1)
+    np.testing.assert_array_equal(coocorrencia(matriz, pesos), indicadora.T @ (indicadora * pesos[:, None]))
+
+def test_coocorrencia_do_cubo_igual_a_das_respostas():
+    # O cubo só guarda a contagem das combinações; a coocorrência sai delas
+    respostas = RESPOSTAS.dropna().replace('', np.nan).dropna().str.replace(' ', '')
+    ordenadas = respostas.str.split(';').apply(lambda itens: ';'.join(sorted(set(itens))))
+    cubo = construir_cubo(pd.DataFrame({'combinacao': ordenadas}), ['combinacao'], [])
+
+    matriz, itens = decodificar_multipla_escolha(respostas)
+    esperada = pd.DataFrame(coocorrencia(matriz), index=itens, columns=itens)
+    resultado = coocorrencia_do_cubo(cubo, 'combinacao')
+    pd.testing.assert_frame_equal(resultado.loc[itens, itens], esperada, check_names=False)
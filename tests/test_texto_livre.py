@@ -0,0 +1,44 @@
+"""Testes do texto livre: normalização, aproximação por trigramas e rótulo das profissões sem tradução."""
+import pandas as pd
+import pytest
+
+from dados import (
+    PROFISSAO_MAP, SIMILARIDADE_MIN_PROFISSAO, TRADUCOES_IMPACT, _aplicar_traducao, canonizar_texto_livre,
+    normalizar_texto_livre
+)
+
+CHAVES = tuple(PROFISSAO_MAP)
+ESPEC_PROFISSAO = next(espec for espec in TRADUCOES_IMPACT if espec['origem'] == 'Profissao')
+
+def canonizar(bruto):
+    return canonizar_texto_livre(bruto, CHAVES, SIMILARIDADE_MIN_PROFISSAO)
+
+def test_normalizacao():
+    assert normalizar_texto_livre("  Öğretmen ") == 'ogretmen'
+    assert normalizar_texto_livre("Sales &amp; Marketing") == 'sales & marketing'
+    assert normalizar_texto_livre("Doktor-Student") == 'doktor student'
+
+@pytest.mark.parametrize('bruto, chave', [
+    ("Enginer", 'engineer'),
+    ("Accountent", 'accountant'),
+    ("Sigortacý", 'sigortaci'),
+    ("ÖĞRENCİ", 'ogrenci'),
+    ("sales marketing", 'sales & marketing'),
+])
+def test_erros_de_digitacao_caem_na_chave(bruto, chave):
+    assert canonizar(bruto) == chave
+
+@pytest.mark.parametrize('bruto', ["management", "intern doctor", "student teacher", "Doktor-Student"])
+def test_outras_profissoes_nao_sao_aproximadas(bruto):
+    assert canonizar(bruto) == normalizar_texto_livre(bruto)
+
+def test_sem_traducao_mostra_a_grafia_original():
+    serie = pd.Series(["Mühendis  Yardımcısı", "mühendis yardımcısı", "Muhendis Yardimcisi",
+                       "mühendis yardımcısı", "intern doctor", "Teacher", None, "  "])
+    traduzida, normalizada = _aplicar_traducao(serie, ESPEC_PROFISSAO)
+
+    # Uma categoria por valor normalizado, com a grafia mais frequente
+    assert list(traduzida[:4]) == ["Mühendis Yardımcısı"] * 4
+    assert list(traduzida[4:6]) == ["Intern Doctor", "Professor(a)"]
+    assert traduzida[6:].isna().all()
+    assert list(normalizada[:5]) == ['muhendis yardimcisi'] * 4 + ['intern doctor']